@@ -0,0 +1,147 @@
+'''
+
+Timing harness for the noise generator library.
+
+Each benchmark prints how long a generator takes on a fixed workload so that changes to the generators can be measured before and after.
+Run it from the command line; no pygame required.
+
+Note that the dependencies do NOT include NumPy, but the array backends can only be timed if it's installed.
+
+'''
+
+import NoiseMapGenerators_14 as NoiseMapGenerators
+import sys
+import timeit
+
+
+
+
+#### Constants ####
+
+
+## How many times each benchmark is repeated. The best (lowest) time is reported, since the others are mostly measuring whatever else the machine was doing.
+REPEAT_COUNT = 5
+
+## The grid of sample points used by the per-sample simplex benchmark.
+SIMPLEX_SAMPLE_GRID_SIZE = 128
+
+## The map size and octave count used by the whole-map simplex benchmark.
+SIMPLEX_MAP_SIZE = 256
+SIMPLEX_MAP_OCTAVES = 4
+
+## The map size and octave ("size") value used by the Perlin benchmark. 256 is in the range the Perlin demo recommends.
+PERLIN_MAP_SIZE = 256
+PERLIN_MAP_OCTAVES = 256
+
+## The worker counts the parallel Perlin benchmark tries. Counts above the number of CPU cores can't go any faster, but show what the pool costs.
+PERLIN_WORKER_COUNTS = (1, 2, 4, 8)
+PERLIN_PARALLEL_MAP_SIZE = 512
+
+## A fixed seed so every run benchmarks the same permutations table.
+BENCHMARK_SEED = 12345
+
+
+
+
+#### Functions ####
+
+
+def benchmark_simplex_raw_noise_per_sample():
+
+    ''' Time SimplexNoiseGenerator.generate_raw_unoctaved_noise() over a grid of sample points and print the cost of one sample. '''
+
+    the_simplex_generator = NoiseMapGenerators.SimplexNoiseGenerator(random_number_seed=BENCHMARK_SEED)
+
+    ## Fractional coordinates, so every sample lands somewhere different inside its simplex.
+    sample_points = [((each_x * 0.37), (each_y * 0.37)) for each_y in range(SIMPLEX_SAMPLE_GRID_SIZE) for each_x in range(SIMPLEX_SAMPLE_GRID_SIZE)]
+
+    raw_noise = the_simplex_generator.generate_raw_unoctaved_noise
+
+    def run_all_samples():
+        for each_x, each_y in sample_points:
+            raw_noise(each_x, each_y)
+
+    best_time = min(timeit.repeat(run_all_samples, number=1, repeat=REPEAT_COUNT))
+
+    print("simplex raw noise: %.3f microseconds per sample (%d samples)" % (((best_time / len(sample_points)) * 1000000.0), len(sample_points)))
+
+
+
+
+def benchmark_simplex_generate_noise():
+
+    ''' Time a whole SimplexNoiseGenerator.generate_noise() map on the scalar path and print its throughput. '''
+
+    the_simplex_generator = NoiseMapGenerators.SimplexNoiseGenerator(random_number_seed=BENCHMARK_SEED)
+
+    def generate_one_map():
+        the_simplex_generator.generate_noise(SIMPLEX_MAP_SIZE, SIMPLEX_MAP_SIZE, 0.01, SIMPLEX_MAP_OCTAVES, 0.5, reshuffle=False)
+
+    ## Whole maps are slow enough that fewer repeats still give a stable best time.
+    best_time = min(timeit.repeat(generate_one_map, number=1, repeat=max(1, (REPEAT_COUNT // 2))))
+
+    samples_per_map = (SIMPLEX_MAP_SIZE * SIMPLEX_MAP_SIZE * SIMPLEX_MAP_OCTAVES)
+
+    print("simplex generate_noise: %.2f seconds for %dx%d at %d octaves (%.0f samples per second)" % (best_time, SIMPLEX_MAP_SIZE, SIMPLEX_MAP_SIZE, SIMPLEX_MAP_OCTAVES, (samples_per_map / best_time)))
+
+
+
+
+def benchmark_perlin_generate_noise():
+
+    ''' Time a whole PerlinNoiseGenerator.generate_noise() map on the scalar path and, if NumPy is installed, on the array path. '''
+
+    the_perlin_generator = NoiseMapGenerators.PerlinNoiseGenerator()
+
+    backends = [("scalar", False)]
+
+    if NoiseMapGenerators.numpy is not None:
+        backends.append(("numpy", True))
+
+    for backend_name, use_numpy in backends:
+
+        def generate_one_map():
+            the_perlin_generator.generate_noise(PERLIN_MAP_SIZE, PERLIN_MAP_SIZE, 1, PERLIN_MAP_OCTAVES, use_numpy=use_numpy)
+
+        best_time = min(timeit.repeat(generate_one_map, number=1, repeat=max(1, (REPEAT_COUNT // 2))))
+
+        print("perlin generate_noise (%s): %.3f seconds for %dx%d at size %d" % (backend_name, best_time, PERLIN_MAP_SIZE, PERLIN_MAP_SIZE, PERLIN_MAP_OCTAVES))
+
+
+
+
+def benchmark_perlin_parallel_generate_noise():
+
+    ''' Time a seeded PerlinNoiseGenerator.generate_noise() map on the scalar path with each of PERLIN_WORKER_COUNTS worker processes and print each time's ratio to the one worker time. Whether that ratio is a speed-up at all depends on the machine's cores; on a single core it isn't. '''
+
+    print("perlin parallel generate_noise: %dx%d at size %d, %d CPU core(s) available" % (PERLIN_PARALLEL_MAP_SIZE, PERLIN_PARALLEL_MAP_SIZE, PERLIN_MAP_OCTAVES, (NoiseMapGenerators.os.cpu_count() or 1)))
+
+    single_worker_time = None
+
+    for worker_count in PERLIN_WORKER_COUNTS:
+
+        ## A new generator every time, so the single worker run can't just reuse the last run's turbulence pyramid.
+        def generate_one_map():
+            NoiseMapGenerators.PerlinNoiseGenerator().generate_noise(PERLIN_PARALLEL_MAP_SIZE, PERLIN_PARALLEL_MAP_SIZE, 1, PERLIN_MAP_OCTAVES, randseed=BENCHMARK_SEED, workers=worker_count)
+
+        best_time = min(timeit.repeat(generate_one_map, number=1, repeat=max(1, (REPEAT_COUNT // 2))))
+
+        if single_worker_time is None:
+            single_worker_time = best_time
+
+        print("    %d worker(s): %.3f seconds (%.2fx the one worker rate)" % (worker_count, best_time, (single_worker_time / best_time)))
+
+
+
+
+#### Main ####
+
+
+if __name__ == '__main__':
+
+    benchmark_simplex_raw_noise_per_sample()
+    benchmark_simplex_generate_noise()
+    benchmark_perlin_generate_noise()
+    benchmark_perlin_parallel_generate_noise()
+
+    sys.exit(0)
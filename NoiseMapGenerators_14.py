@@ -41,6 +41,7 @@ The MarkIIDungeonMapGenerator is my favorite one so far. It produces maps wherei
 
 
 Note that the dependencies do NOT include pygame, even though the display program I created for demonstrations does.
+NumPy is an optional dependency. It's only needed for the array backends, which are switched on with use_numpy=True.
 
 '''
 
@@ -48,6 +49,135 @@ Note that the dependencies do NOT include pygame, even though the display progra
 import random
 import sys
 import math
+import os
+import array
+import collections
+import concurrent.futures
+import multiprocessing.shared_memory
+import multiprocessing.util
+
+## NumPy is optional. Only the array backends (use_numpy=True) need it; everything else runs on plain Python.
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+
+
+
+
+
+
+
+#### Process pool workers ####
+
+
+## Process pools can only run module-level functions, so the workers for the generators' parallel modes live here.
+## Each worker process keeps its own generator, set up once by the pool's initializer.
+
+
+simplex_noise_worker_generator = None
+
+
+def initialize_simplex_noise_worker(hash_number, noise_array, permutations_table, random_number_seed):
+
+	''' Process pool initializer: build this worker's SimplexNoiseGenerator around the parent generator's permutations table. '''
+	
+	global simplex_noise_worker_generator
+	
+	## No shuffle of its own, since the parent's table replaces it straight away.
+	simplex_noise_worker_generator = SimplexNoiseGenerator(supplied_hash=hash_number, reshuffle=False)
+	simplex_noise_worker_generator.load_permutations_table(noise_array, permutations_table, random_number_seed)
+	
+	
+def generate_simplex_noise_worker_band(supplied_x, first_row, last_row, scale, octaves, persistence, use_numpy, origin_x, origin_y):
+	
+	''' Process pool task: generate one band of rows with this worker's generator. '''
+	
+	return simplex_noise_worker_generator.generate_noise_band(supplied_x, first_row, last_row, scale, octaves, persistence, use_numpy=use_numpy, origin_x=origin_x, origin_y=origin_y)
+
+
+perlin_noise_worker_generator = None
+perlin_noise_worker_shared_memory = None
+perlin_noise_worker_shared_views = ()
+
+
+def initialize_perlin_noise_worker(shared_memory_name, noise_width, noise_height, permutations_table, noise_type):
+
+	''' Process pool initializer: build this worker's PerlinNoiseGenerator around the parent generator's lattice, which it reads straight out of the shared memory block named shared_memory_name. '''
+	
+	global perlin_noise_worker_generator
+	global perlin_noise_worker_shared_memory
+	global perlin_noise_worker_shared_views
+	
+	## The block has to stay open for as long as the worker is using the lattice inside it, so it's kept in a global too.
+	## The parent owns the block and unlinks it, so where SharedMemory can be told to (Python 3.13 on), the worker doesn't hand it to a resource tracker as well.
+	try:
+		perlin_noise_worker_shared_memory = multiprocessing.shared_memory.SharedMemory(name=shared_memory_name, track=False)
+	except TypeError:
+		perlin_noise_worker_shared_memory = multiprocessing.shared_memory.SharedMemory(name=shared_memory_name)
+	
+	## The block can be bigger than asked for (it's rounded up to whole pages), so only the lattice's part of it is used.
+	shared_lattice_view = perlin_noise_worker_shared_memory.buf.cast('d')
+	shared_noise_array = shared_lattice_view[:(noise_width * noise_height)]
+	
+	## The views are kept so they can be released before the block is closed; it can't be closed while they're still around.
+	perlin_noise_worker_shared_views = (shared_noise_array, shared_lattice_view)
+	
+	perlin_noise_worker_generator = PerlinNoiseGenerator(noise_type=noise_type)
+	perlin_noise_worker_generator.load_noise_lattice(shared_noise_array, noise_width, noise_height, permutations_table)
+	
+	## Pool workers leave through os._exit(), which skips atexit, so the block is closed by one of multiprocessing's own exit finalizers instead.
+	multiprocessing.util.Finalize(None, release_perlin_noise_worker_lattice, exitpriority=0)
+	
+	
+def release_perlin_noise_worker_lattice():
+	
+	''' Process pool worker exit hook: drop this worker's generator and close its view of the shared lattice. '''
+	
+	global perlin_noise_worker_generator
+	global perlin_noise_worker_shared_memory
+	global perlin_noise_worker_shared_views
+	
+	## The generator goes first, taking any NumPy arrays built over the lattice with it, then the views, then the block itself.
+	perlin_noise_worker_generator = None
+	
+	for each_view in perlin_noise_worker_shared_views:
+		each_view.release()
+	
+	perlin_noise_worker_shared_views = ()
+	
+	if perlin_noise_worker_shared_memory is not None:
+		
+		perlin_noise_worker_shared_memory.close()
+		perlin_noise_worker_shared_memory = None
+	
+	
+def generate_perlin_noise_worker_band(width, first_row, last_row, frequency, octaves, use_numpy, origin_x, origin_y, output_dtype):
+	
+	''' Process pool task: generate one band of rows with this worker's generator. '''
+	
+	return perlin_noise_worker_generator.generate_noise_band(width, first_row, last_row, frequency, octaves, use_numpy=use_numpy, origin_x=origin_x, origin_y=origin_y, output_dtype=output_dtype)
+
+
+plasma_fractal_worker_generator = None
+
+
+def initialize_plasma_fractal_worker(displacement_min, displacement_max, minimum_separation_distance):
+
+	''' Process pool initializer: build this worker's PlasmaFractalGenerator with the parent generator's displacement settings. '''
+	
+	global plasma_fractal_worker_generator
+	
+	## The corners are given so the constructor doesn't draw any; every quadrant brings its own.
+	plasma_fractal_worker_generator = PlasmaFractalGenerator(displacement_min=displacement_min, displacement_max=displacement_max, minimum_separation_distance=minimum_separation_distance, uleft_corner=0, uright_corner=0, lleft_corner=0, lright_corner=0)
+	
+	
+def generate_plasma_fractal_worker_quadrant(quadrant, quadrant_seed, integer_lattice, detail_depth):
+	
+	''' Process pool task: subdivide one quadrant with this worker's generator. '''
+	
+	return plasma_fractal_worker_generator.generate_plasma_quadrant(quadrant, quadrant_seed, integer_lattice, detail_depth)
 
 
 
@@ -73,10 +203,40 @@ class PlasmaFractalGenerator:
 	''' Create a fractal generator that returns a list of ((word for things that come in parentheses)) consisting of three floating point values: x, y and z coordinates for constructing a plasma fractal for use as a noise map. '''
 	
 	
+	## generate_region() builds its world on a lattice of points this far apart (a power of two), whose values come straight from the seed.
+	## Everything in between is subdivided from them, so no feature of the world is bigger than this.
+	REGION_LATTICE_SPACING = 256
+	
+	## Keeps the hashes generate_region() uses for lattice corners and for midpoint displacements unrelated to each other.
+	CORNER_SALT = 0x1
+	DISPLACEMENT_SALT = 0x2
+	
+	## How many levels generate_noise(workers=...) subdivides itself before handing the quadrants it's reached to the process pool.
+	## Three levels is 64 quadrants, plenty to keep a pool busy. It doesn't depend on the number of workers, so neither does the map.
+	PARALLEL_SPLIT_DEPTH = 3
+	
+	## Keeps the hashes that seed those quadrants unrelated to generate_region()'s.
+	QUADRANT_SALT = 0x3
+	
+	## The most midpoint displacements the subdivision engines draw for one level in one go. See subdivide_plasma_quadrants().
+	DISPLACEMENTS_PER_DRAW = 4096
+	
+	## Constants for hash_plasma_coordinates(): the splitmix64 multipliers and a 64 bit mask.
+	SPLITMIX_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+	SPLITMIX_MULTIPLIER_ONE = 0xBF58476D1CE4E5B9
+	SPLITMIX_MULTIPLIER_TWO = 0x94D049BB133111EB
+	SIXTY_FOUR_BIT_MASK = 0xFFFFFFFFFFFFFFFF
+	
+	
 	
-	def __init__(self, array_root=2, corners_min=0, corners_max=255, displacement_min=(-35), displacement_max=35, minimum_separation_distance=1, uleft_corner=None, uright_corner=None, lleft_corner=None, lright_corner=None):
+	def __init__(self, array_root=2, corners_min=0, corners_max=255, displacement_min=(-35), displacement_max=35, minimum_separation_distance=1, uleft_corner=None, uright_corner=None, lleft_corner=None, lright_corner=None, random_number_seed=None):
 
 		
+		## Every random number this generator uses comes from its own random.Random, so generators don't disturb each other (or anything else using the random module) and can be used from different threads.
+		## Supplying random_number_seed makes the corners, and the maps made from them, reproducible.
+		self.random_number_generator = random.Random(random_number_seed)
+		self.random_number_seed = random_number_seed
+		
 		## The root of the array (it's square root, or side measurement):
 		self.array_root = array_root
 		
@@ -84,8 +244,8 @@ class PlasmaFractalGenerator:
 		self.array_width =  (self.array_root * 2)
 		self.array_height = (self.array_root * 2)
 		
-		## Init the plasma fractal's handler, the noise array, as None:
-		self.saved_noise_array = None
+		## What refine_noise() needs to carry on from the last generate_noise() call: see generate_noise().
+		self.saved_plasma_frontier = None
 		
 		## Min and max values for randomly generated corner Z values:
 		self.corners_min = corners_min
@@ -109,13 +269,17 @@ class PlasmaFractalGenerator:
 		## ...
 		## This section may be a candidate for refactorization in the future, with the addition of parameters to reinitialize_corners()
 		if self.uleft_corner is None:
-			self.uleft_corner =  random.randint(self.corners_min, self.corners_max)
+			self.uleft_corner =  self.random_number_generator.randint(self.corners_min, self.corners_max)
 		if self.uright_corner is None:
-			self.uright_corner = random.randint(self.corners_min, self.corners_max)
+			self.uright_corner = self.random_number_generator.randint(self.corners_min, self.corners_max)
 		if self.lleft_corner is None:
-			self.lleft_corner =  random.randint(self.corners_min, self.corners_max)
+			self.lleft_corner =  self.random_number_generator.randint(self.corners_min, self.corners_max)
 		if self.lright_corner is None:
-			self.lright_corner = random.randint(self.corners_min, self.corners_max)
+			self.lright_corner = self.random_number_generator.randint(self.corners_min, self.corners_max)
+		
+		## The seed generate_region() uses when it isn't given one, so one generator always describes one world.
+		## It's only drawn the first time it's needed, so generators that never call generate_region() don't use up a random number on it.
+		self.world_seed = None
 						
 						
 
@@ -125,37 +289,31 @@ class PlasmaFractalGenerator:
 	def reinitialize_corners(self, uleft_corner=None, uright_corner=None, lleft_corner=None, lright_corner=None):
 	
 		if uleft_corner == None:
-			self.uleft_corner =  random.randint(self.corners_min, self.corners_max)
+			self.uleft_corner =  self.random_number_generator.randint(self.corners_min, self.corners_max)
 		else:
 			self.uleft_corner = uleft_corner
 
 		if uright_corner == None:			
-			self.uright_corner = random.randint(self.corners_min, self.corners_max)
+			self.uright_corner = self.random_number_generator.randint(self.corners_min, self.corners_max)
 		else:
 			self.uright_corner = uright_corner
 
 		if lleft_corner == None:
-			self.lleft_corner = random.randint(self.corners_min, self.corners_max)
+			self.lleft_corner = self.random_number_generator.randint(self.corners_min, self.corners_max)
 		else:
 			self.lleft_corner = lleft_corner
 
 		if lright_corner == None:
-			self.lright_corner = random.randint(self.corners_min, self.corners_max)
+			self.lright_corner = self.random_number_generator.randint(self.corners_min, self.corners_max)
 		else:
 			self.lright_corner = lright_corner
 
 		
 		
 		
-	def generate_noise(self, x=None, y=None, supplied_width=None, supplied_height=None, uleft_corner=None, uright_corner=None, lleft_corner=None, lright_corner=None):
-		
-		''' This function is the gateway function to generate_plasma(). '''
-		
-		del self.saved_noise_array
-		
-		self.saved_noise_array = []
-		
+	def generate_noise(self, x=None, y=None, supplied_width=None, supplied_height=None, uleft_corner=None, uright_corner=None, lleft_corner=None, lright_corner=None, integer_lattice=False, detail_depth=None, workers=None, randseed=None):
 		
+		''' This function is the gateway function to generate_plasma(). With integer_lattice=True the map is subdivided along whole cells instead (see fill_plasma_buffer_exactly()), which fills any width and height exactly once per cell. detail_depth stops the subdivision after that many levels and fills each unfinished quadrant with its average, for a quick blocky preview; refine_noise() can carry on from there later. workers subdivides the map's quadrants in that many processes (0 means one per CPU core); see fill_plasma_buffer_in_parallel(). The map is the same whatever the number of workers, but isn't the one workers=None would have made. randseed reseeds the generator's random number generator first, so the same generator (with the same corners) makes the same map from the same randseed. '''
 		
 		## This section necessitated by the combination of my desire to make generate_noise() callable with arbitrary arguments and Python's refusal to accept self.foo as parameters for a method.
 		if x == None:
@@ -178,70 +336,28 @@ class PlasmaFractalGenerator:
 		if lright_corner == None:
 			lright_corner = self.lright_corner
 								
+		if (detail_depth is not None) and (detail_depth < 0):
+			raise ValueError("detail_depth must be 0 or more, not %r." % (detail_depth,))
 		
-		
-		## Remember, no call to self in the parameters when a method is calling another method. The definition of the second method will invoke its own self, don't worry. :p
-		self.plasma_recursion(x=x, y=y, supplied_width=supplied_width, supplied_height=supplied_height, uleft_corner=uleft_corner, uright_corner=uright_corner, lleft_corner=lleft_corner, lright_corner=lright_corner)
-
-		
-		####print("  Debug: self.saved_noise_array == ")
-		#for each in self.saved_noise_array:
-		#	###print("    " + str(each))
+		if randseed is not None:
+			self.random_number_generator.seed(randseed)
+			self.random_number_seed = randseed
 		
 		
-		## Now convert that giant list into a tuple with the same ordering as the PerlinNoiseGenerator's results.
 		
-		array_to_return = []
+		## The map is allocated once, up front, in the ( array[y][x] == z ) layout the PerlinNoiseGenerator's results use, and the plasma is written straight into it.
+		## Cells the subdivision never lands on keep the -1 they start with.
+		array_to_return = [([-1] * supplied_width) for each_array_height_index in range(0, supplied_height)]
 		
-		for each_array_height_index in range(0, supplied_height):    # y
-
-			## Fill the array_to_return with rows full of -1s so we only have to iterate through it once in the next step!
-			
-			new_row = []
-			
-			for each_array_width_index in range(0, supplied_width):  # x
-				
-				new_row.append(-1)
-			
-			array_to_return.append(new_row)
+		if workers is not None:
+			plasma_frontier = self.fill_plasma_buffer_in_parallel(array_to_return, x=x, y=y, supplied_width=supplied_width, supplied_height=supplied_height, uleft_corner=uleft_corner, uright_corner=uright_corner, lleft_corner=lleft_corner, lright_corner=lright_corner, integer_lattice=integer_lattice, detail_depth=detail_depth, workers=workers)
+		elif integer_lattice:
+			plasma_frontier = self.fill_plasma_buffer_exactly(array_to_return, supplied_width=supplied_width, supplied_height=supplied_height, uleft_corner=uleft_corner, uright_corner=uright_corner, lleft_corner=lleft_corner, lright_corner=lright_corner, detail_depth=detail_depth)
+		else:
+			plasma_frontier = self.fill_plasma_buffer(array_to_return, x=x, y=y, supplied_width=supplied_width, supplied_height=supplied_height, uleft_corner=uleft_corner, uright_corner=uright_corner, lleft_corner=lleft_corner, lright_corner=lright_corner, detail_depth=detail_depth)
 		
-		####print("  Debug: array_to_return == " + str(array_to_return) + "\n")
-			
-			
-		for each_cell in self.saved_noise_array:
-				
-			## Round down x and y since the values are probably all floats.
-			## This will ALMOST CERTAINLY give me bad results and I'm gonna have to change something, maybe cleverer rounding??
-			## I may have to round up and down more precisely than int() depending on exactly what ends up happening with the results. :S
-					
-					
-			'''
-			## EDIT: The following is probably not the best way to do this. I added the -1 overwrite procedure instead.
-			
-			## ...
-			
-			## Complicated syntax is actually very shallow conceptually.
-			## array[a].insert([b], [c])
-			## a == the rounded down y value of the cell
-			## b == the rounded down x value of the cell
-			## c == the floating point z value of the cell
-			## Rounding is currently being done by int() calls, this may very well be a bad idea. See above note.
-			## All index variables are referenced by their index number in each_cell; hence the square brackets.
-			
-			array_to_return[int(each_cell[1])].insert(int(each_cell[0]), each_cell[2])
-			'''	
-			
-			####print("  Debug: each_cell    == " + str(each_cell)) 
-			####print("         each_cell[0] == " + str(each_cell[0]))
-			####print("         each_cell[1] == " + str(each_cell[1]))
-			####print("         each_cell[2] == " + str(each_cell[2]))			
-			
-			## The syntax is now:
-			## array[y][x] = z
-			## where y, x and z are extracted from their respective indices in each_cell.
-			## Rounding is once again involved at this step. See above notes in this method.
-			## DEBUG: Testing -1 to see if it always rounds one way or does a split at 0.5
-			array_to_return[int(each_cell[1])][int(each_cell[0])] = each_cell[2]
+		## The quadrants the subdivision stopped at are kept, along with the map they're part of, so refine_noise() can pick up where this left off.
+		self.saved_plasma_frontier = {'noise_map': array_to_return, 'quadrants': plasma_frontier, 'integer_lattice': integer_lattice, 'first_column': int(x), 'first_row': int(y)}
 			
 			
 		## If this line is left out the generator will use the same corner values and make a whole new map between them.
@@ -249,803 +365,3115 @@ class PlasmaFractalGenerator:
 		#self.reinitialize_corners()		
 		
 		return array_to_return
+	
+	
+	def refine_noise(self, detail_depth=None):
 		
+		''' Carry on subdividing the map from the last generate_noise() (or refine_noise()) call that stopped early, down to detail_depth levels (or all the way, if it's None). The finer detail is written into that same map, which is also returned. The levels that were already done aren't redone, and a detail_depth no deeper than the map already goes leaves it as it is. '''
 		
-	def plasma_recursion(self, x, y, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner):
-		## This method is intended to be called by self.generate_noise()
-		## The results of calling this separately from self.generate_noise() will be a long list of [x, y, z] values rather than a tuple with the form ( array[y][x] == (z) ).
-			
-			
-		''' Recursively supply [x, y, z]-formatted plasma fractal elements to self.saved_noise_array, as called by self.generate_noise() '''	
-			
-		new_width  = (supplied_width  / 2)
-		new_height = (supplied_height / 2)
-
+		## Each refinement only subdivides the quadrants the last one stopped at, so a viewer can show the blocky map first and fill it in a level or a few at a time.
+		saved_plasma_frontier = self.saved_plasma_frontier
 		
+		if saved_plasma_frontier is None:
+			return None
 		
-		if ( (supplied_width > self.minimum_separation_distance) or (supplied_height > self.minimum_separation_distance) ):
-			
-			## This step must happen during this part of the conditional tree. Not after the else!
-			random_midpoint_displacement = random.randint(self.displacement_min, self.displacement_max)
-			
-			## Create midpoint's zee by averaging corners' zees and mixing in the random_midpoint_displacement:
-			mid_z    =  ( ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 ) + random_midpoint_displacement )
-
-			## Deduce sides' zees:
-			top_z    =  ( (uleft_corner + uright_corner)  / 2 )
-			bottom_z =  ( (lleft_corner + lright_corner)  / 2 )
-			left_z   =  ( (uleft_corner + lleft_corner)   / 2 )
-			right_z  =  ( (uright_corner + lright_corner) / 2 )
-
-			## Recursion. Note this happens inside the earlier if statement. The alternative is not recurring at this call, and instead returning a value.
-			uleft_quadrant  =  self.plasma_recursion(x=x,             y=y,              supplied_width=new_width, supplied_height=new_height, uleft_corner=uleft_corner, uright_corner=top_z,         lleft_corner=left_z,       lright_corner=mid_z         )
-			uright_quadrant =  self.plasma_recursion(x=(x+new_width), y=y,              supplied_width=new_width, supplied_height=new_height, uleft_corner=top_z,        uright_corner=uright_corner, lleft_corner=mid_z,        lright_corner=right_z       )
-			lleft_quadrant  =  self.plasma_recursion(x=x,             y=(y+new_height), supplied_width=new_width, supplied_height=new_height, uleft_corner=left_z,       uright_corner=mid_z,         lleft_corner=lleft_corner, lright_corner=bottom_z      )
-			lright_quadrant =  self.plasma_recursion(x=(x+new_width), y=(y+new_height), supplied_width=new_width, supplied_height=new_height, uleft_corner=mid_z,        uright_corner=right_z,       lleft_corner=bottom_z,     lright_corner=lright_corner )
-	
+		noise_map = saved_plasma_frontier['noise_map']
+		
+		## Quadrants are 9-tuples ending in their depth, and the frontier's shallowest quadrant is as deep as the map goes everywhere.
+		if (detail_depth is not None) and ( (len(saved_plasma_frontier['quadrants']) == 0) or (detail_depth <= min(each_quadrant[8] for each_quadrant in saved_plasma_frontier['quadrants'])) ):
+			return noise_map
+		
+		if saved_plasma_frontier['integer_lattice']:
+			saved_plasma_frontier['quadrants'] = self.subdivide_plasma_quadrants_exactly(noise_map, saved_plasma_frontier['quadrants'], detail_depth)
 		else:
-			
-			## When the distance between the corners drops below the minimum separation distance, create an [x, y, z] cell and return it up the chain:
-	
-			new_z_value = ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 )
-	
-			new_coordinate = [x, y, new_z_value]
-			
-			self.saved_noise_array.append(new_coordinate)
-            
-            
-            
-            
-            
-            
-class PerlinNoiseGenerator:
-	
+			saved_plasma_frontier['quadrants'] = self.subdivide_plasma_quadrants(noise_map, saved_plasma_frontier['quadrants'], saved_plasma_frontier['first_column'], saved_plasma_frontier['first_row'], detail_depth)
+		
+		return noise_map
 	
-	def __init__(self):
 	
-		## The generator saves its noise-map state:
-		self.noise_array = []
-		self.noise_width = 0
-		noise_height = 0
-		
+	def fill_plasma_buffer(self, noise_buffer, x, y, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, detail_depth=None):
 		
-	def generate_noise(self, width, height, frequency, octaves):
+		''' Write a plasma fractal over the supplied_width by supplied_height area whose upper left corner is at (x, y) straight into noise_buffer, a list of rows indexed ( noise_buffer[y][x] ) relative to that corner. The subdivision is done without recursing or building a list of cells. Returns the quadrants left unfinished because of detail_depth. '''
 		
-		''' Returns a tuple of [parameter 2] lists each containing [parameter 1] randomly generated integer numbers between $FIX_ME_MINIMUM and $FIX_ME_MAXIMUM, fractally smoothed as Perlin noise using a frequency of [parameter 3] and an octave count of [parameter 4]. '''
+		## Cells are written relative to the area's upper left corner, so the first row and column of noise_buffer are at (x, y).
+		## Each quadrant is (x, y, width, height, uleft_corner, uright_corner, lleft_corner, lright_corner, depth).
+		return self.subdivide_plasma_quadrants(noise_buffer, [(x, y, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, 0)], int(x), int(y), detail_depth)
+	
+	
+	def subdivide_plasma_quadrants(self, noise_buffer, quadrants, first_column, first_row, detail_depth=None, random_number_generator=None):
 		
-		## Octaves?
-		## It's used for calling turbulence(), which considers that parameter to be "size".
-		## The original function declared that changing octaves changes how far in or out from the noise you are zoomed.
-		## Which seems like a decent interpretation of the results.
-		## Raising the frequency makes it spikier (which is reminiscent of zooming out).
-		## Raising the octaves make it smoother (which is reminiscent of zooming in).
-		## Note that keeping the ratios of frequency to octaves the same will keep the results looking similar!
-		## For this reason I recommend using small octave values, since that governs the recursor runtime.
+		''' The engine behind fill_plasma_buffer(): subdivide each of the quadrants in turn, writing finished cells into noise_buffer. Quadrants that reach detail_depth are filled with their average instead, and returned so they can be subdivided further later. The displacements come from random_number_generator (a random.Random), or the generator's own if it's None. '''
 		
-
+		## The quadrants still waiting to be subdivided are kept on a stack, and the last one pushed is the next one done.
+		## Pushing each quadrant's four children in reverse order means they're popped upper left, upper right, lower left, lower right, the order the original recursive version visited them in.
+		## The stack never holds more than three quadrants per level of subdivision.
+		minimum_separation_distance = self.minimum_separation_distance
 		
+		take_displacement = self.make_displacement_source(quadrants, random_number_generator)
 		
-		## First, clear the currently saved noise map:
-		## ...
-		## actually self.noise_array is used internally to the generator's function and does not save the actual noise map.
-		## Interesting, that.
-		del self.noise_array[:]
+		## No detail_depth means no limit. Quadrants already at or past it stop where they are.
+		if detail_depth is None:
+			detail_depth = math.inf
 		
-		## Now assign this NoiseGenerator's current noise_width and noise_height to the values supplied by the function call parameters:
-		## Note that the NoiseGenerator saves these as state because they need to be referenced in the sub-functions below.
-		self.noise_width = width
-		self.noise_height = height
+		quadrants_to_subdivide = list(reversed(quadrants))
+		unfinished_quadrants = []
 		
+		pop_quadrant = quadrants_to_subdivide.pop
+		push_quadrant = quadrants_to_subdivide.append
 		
-		## Initializing the noise_array with random numbers.
-		## This for loop provides the raw random data smeuthanized into a pretty, pretty vapor cloud further in the program.
-		## Create a bunch of rows, equal in number to self.noise_height...
-		for each_row in range(0, self.noise_height):
+		while quadrants_to_subdivide:
+			
+			each_quadrant = pop_quadrant()
 			
-			noise_row_handler = []
+			x, y, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, depth = each_quadrant
 			
-			## ... and fill them with randint()s equal in number to self.noise_width:
-			for each_column in range(0, self.noise_width):
+			if ( (supplied_width > minimum_separation_distance) or (supplied_height > minimum_separation_distance) ):
+				
+				if depth >= detail_depth:
+					
+					## Every cell this quadrant's own cells would be rounded down into, clipped to the map.
+					self.fill_plasma_block(noise_buffer, (int(x) - first_column), (int(y) - first_row), (math.ceil(x + supplied_width) - first_column), (math.ceil(y + supplied_height) - first_row), ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 ))
+					
+					unfinished_quadrants.append(each_quadrant)
+					
+					continue
+				
+				new_width  = (supplied_width  / 2)
+				new_height = (supplied_height / 2)
+				
+				new_depth = (depth + 1)
 				
-				noise_value = ( random.randint(0, 1000) / 1000.0 )
+				## The midpoint gets the corners' average plus a random displacement, and each side the average of its two corners.
+				random_midpoint_displacement = take_displacement(depth)
 				
-				noise_row_handler.append(noise_value)
+				mid_z    =  ( ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 ) + random_midpoint_displacement )
 				
-			## Attach each row to the noise_array.
-			self.noise_array.append(noise_row_handler)
-			## The generator's noise_array should now be full of rows which are full of integers.
+				top_z    =  ( (uleft_corner + uright_corner)  / 2 )
+				bottom_z =  ( (lleft_corner + lright_corner)  / 2 )
+				left_z   =  ( (uleft_corner + lleft_corner)   / 2 )
+				right_z  =  ( (uright_corner + lright_corner) / 2 )
+				
+				push_quadrant( ((x + new_width), (y + new_height), new_width, new_height, mid_z,       right_z,       bottom_z,     lright_corner, new_depth) )
+				push_quadrant( (x,               (y + new_height), new_width, new_height, left_z,      mid_z,         lleft_corner, bottom_z,      new_depth) )
+				push_quadrant( ((x + new_width), y,                new_width, new_height, top_z,       uright_corner, mid_z,        right_z,       new_depth) )
+				push_quadrant( (x,               y,                new_width, new_height, uleft_corner, top_z,        left_z,       mid_z,         new_depth) )
+			
+			else:
+				
+				## Rounded down with int() to the cell the quadrant is in.
+				noise_buffer[int(y) - first_row][int(x) - first_column] = ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 )
 		
-			## The noise_array isn't the finished product. It's used to create it, in the below functions.
+		return unfinished_quadrants
 	
 	
-	
-			
-		result = []
+	def fill_plasma_buffer_exactly(self, noise_buffer, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, detail_depth=None):
 		
+		''' Write a plasma fractal over the whole supplied_width by supplied_height noise_buffer, subdividing along cell boundaries so every cell is written exactly once, whatever the width and height. Returns the quadrants left unfinished because of detail_depth. '''
+		
+		## fill_plasma_buffer() halves the quadrants' float widths and rounds the finished cells down with int(), so unless the map is a power of two on a side, some cells get written more than once and others not at all.
+		## Here quadrants are whole numbers of cells, split into (width // 2) and (width - (width // 2)) columns and the same for rows, so the quadrants always exactly tile the map.
+		## That's one quadrant per subdivision and one write per cell, so the work goes up linearly with the number of cells.
+		## minimum_separation_distance doesn't apply: subdivision always goes down to single cells.
+		if (supplied_width < 1) or (supplied_height < 1):
+			return []
+		
+		return self.subdivide_plasma_quadrants_exactly(noise_buffer, [(0, 0, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, 0)], detail_depth)
 	
 	
-		## Turbulating the noise array ##
-	
-			
-		for each_y in range(0, self.noise_height):
+	def subdivide_plasma_quadrants_exactly(self, noise_buffer, quadrants, detail_depth=None, random_number_generator=None):
 		
+		''' The engine behind fill_plasma_buffer_exactly(), working the same way as subdivide_plasma_quadrants() does for fill_plasma_buffer(). '''
 		
-			turbulated_noise_row_handler = []
-
+		take_displacement = self.make_displacement_source(quadrants, random_number_generator)
+		
+		if detail_depth is None:
+			detail_depth = math.inf
+		
+		## Same stack, visiting order, displacements and detail_depth handling as subdivide_plasma_quadrants().
+		quadrants_to_subdivide = list(reversed(quadrants))
+		unfinished_quadrants = []
+		
+		pop_quadrant = quadrants_to_subdivide.pop
+		push_quadrant = quadrants_to_subdivide.append
+		
+		while quadrants_to_subdivide:
+			
+			each_quadrant = pop_quadrant()
 			
-			for each_x in range(0, self.noise_width):
+			x, y, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, depth = each_quadrant
+			
+			if (supplied_width == 1) and (supplied_height == 1):
+				
+				noise_buffer[y][x] = ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 )
 				
+				continue
 			
-				## Note: Frequency is rolled into the parameters here!
-				turbulated_noise_value = int(self.totally_justified_turbulence_function((each_x * frequency), (each_y * frequency), octaves))
+			if depth >= detail_depth:
+				
+				## The quadrant's cells are exactly its block, so nothing else gets overwritten.
+				self.fill_plasma_block(noise_buffer, x, y, (x + supplied_width), (y + supplied_height), ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 ))
+				
+				unfinished_quadrants.append(each_quadrant)
+				
+				continue
 			
-				turbulated_noise_row_handler.append(turbulated_noise_value)
+			new_depth = (depth + 1)
 			
+			random_midpoint_displacement = take_displacement(depth)
 			
+			mid_z    =  ( ( (uleft_corner + uright_corner + lleft_corner + lright_corner) / 4 ) + random_midpoint_displacement )
 			
-			result.append(turbulated_noise_row_handler)
-
-		
-		## NOTE that the NoiseGenerator does NOT save the result as state.
-		## It hands it off to whatever called its generate_noise() function.
-		## This is where this generator's entire function chain ends:
-		return result
+			left_width = (supplied_width // 2)
+			top_height = (supplied_height // 2)
 			
+			if (left_width > 0) and (top_height > 0):
+				
+				## Split both ways: four quadrants, exactly as in subdivide_plasma_quadrants().
+				top_z    =  ( (uleft_corner + uright_corner)  / 2 )
+				bottom_z =  ( (lleft_corner + lright_corner)  / 2 )
+				left_z   =  ( (uleft_corner + lleft_corner)   / 2 )
+				right_z  =  ( (uright_corner + lright_corner) / 2 )
+				
+				right_width = (supplied_width - left_width)
+				bottom_height = (supplied_height - top_height)
+				
+				push_quadrant( ((x + left_width), (y + top_height), right_width, bottom_height, mid_z,        right_z,       bottom_z,     lright_corner, new_depth) )
+				push_quadrant( (x,                (y + top_height), left_width,  bottom_height, left_z,       mid_z,         lleft_corner, bottom_z,      new_depth) )
+				push_quadrant( ((x + left_width), y,                right_width, top_height,    top_z,        uright_corner, mid_z,        right_z,       new_depth) )
+				push_quadrant( (x,                y,                left_width,  top_height,    uleft_corner, top_z,         left_z,       mid_z,         new_depth) )
+			
+			elif left_width > 0:
+				
+				## Only one row of cells left: split it into a left and a right half, with the displaced midpoint along the line between them.
+				push_quadrant( ((x + left_width), y, (supplied_width - left_width), supplied_height, mid_z,        uright_corner, mid_z,        lright_corner, new_depth) )
+				push_quadrant( (x,                y, left_width,                    supplied_height, uleft_corner, mid_z,         lleft_corner, mid_z,         new_depth) )
+			
+			else:
+				
+				## Only one column of cells left: split it into a top and a bottom half the same way.
+				push_quadrant( (x, (y + top_height), supplied_width, (supplied_height - top_height), mid_z,        mid_z,         lleft_corner, lright_corner, new_depth) )
+				push_quadrant( (x, y,                supplied_width, top_height,                    uleft_corner, uright_corner, mid_z,        mid_z,         new_depth) )
+		
+		return unfinished_quadrants
 	
 	
-	
-	
-	
-
-	def totally_justified_turbulence_function(self, x, y, size):
+	def make_displacement_source(self, quadrants, random_number_generator=None):
 		
-		## noise_value is "built up" by smooth_noise():
-		noise_value = 0.0
+		''' Return a function that takes a subdivision depth and returns the next midpoint displacement for that level, for the subdivision engines to subdivide quadrants with. The displacements are drawn from random_number_generator (default: the generator's own) a whole level at a time. '''
 		
-		## Floats it:
-		size *= 1.0
+		## One randint() per midpoint is most of what the subdivision costs, so each level's displacements are drawn in one choices() call instead.
+		## Each starting quadrant has at most 4 ** n quadrants n levels below it, so that's how many midpoints a level is drawn for.
+		## fill_plasma_buffer()'s quadrants all split together, so for it that's exact. Big levels are drawn DISPLACEMENTS_PER_DRAW at a time, so they're never held all at once.
+		if random_number_generator is None:
+			random_number_generator = self.random_number_generator
 		
-		initial_size = size
+		choices = random_number_generator.choices
+		displacement_values = range(self.displacement_min, (self.displacement_max + 1))
+		displacements_per_draw = self.DISPLACEMENTS_PER_DRAW
 		
+		starting_depths = [each_quadrant[8] for each_quadrant in quadrants]
 		
-		## This is kind of like fractally splitting a grid, except it just sort of "resonates" itself in half and applies noise smoothening or something. Octaves.
-		while (size >= 1):
-			
+		## Each level's undrawn displacements, as [midpoints still to come, drawn displacements].
+		displacements_by_depth = {}
+		
+		def take_displacement(depth):
 			
-			the_smooth_noise = self.smooth_noise((x / size), (y / size))
+			level_displacements = displacements_by_depth.get(depth)
 			
-			the_smooth_noise *= size
+			if level_displacements is None:
+				
+				level_midpoint_count = sum( (4 ** (depth - each_starting_depth)) for each_starting_depth in starting_depths if (each_starting_depth <= depth) )
+				
+				level_displacements = [level_midpoint_count, []]
+				
+				displacements_by_depth[depth] = level_displacements
 			
-			## Add it to the noise_value pile:
-			noise_value += the_smooth_noise
+			drawn_displacements = level_displacements[1]
 			
-			## Paring down the size... iterating downwards...
-			size /= 2.0
+			if not drawn_displacements:
+				
+				draw_count = max(1, min(level_displacements[0], displacements_per_draw))
+				
+				level_displacements[0] -= draw_count
+				
+				## Reversed, so popping them off the end hands them out in the order they were drawn.
+				drawn_displacements.extend(reversed(choices(displacement_values, k=draw_count)))
 			
+			return drawn_displacements.pop()
+		
+		return take_displacement
+	
+	
+	def fill_plasma_buffer_in_parallel(self, noise_buffer, x, y, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, integer_lattice=False, detail_depth=None, workers=0):
+		
+		''' Write a plasma fractal into noise_buffer the way fill_plasma_buffer() (or fill_plasma_buffer_exactly(), with integer_lattice=True) does, but only subdivide the first PARALLEL_SPLIT_DEPTH levels here and hand the quadrants they leave to a process pool of that many workers (0 or less means one per CPU core). Returns the quadrants left unfinished because of detail_depth. '''
+		
+		## Called by generate_noise(workers=...).
+		## Note that on platforms that spawn rather than fork, the calling script needs the usual if __name__ == '__main__': guard.
+		if integer_lattice:
 			
-		## Order of Operations suggests division before multiplication, so:
-		noise_value /= initial_size	
+			if (supplied_width < 1) or (supplied_height < 1):
+				return []
 			
-		## ???
-		## Experiment to figure out what it does! o_o	
-		## ...
-		## Biases the resulting z values to average out at this number:
-		noise_value *= 128.0
-
-		
-		return noise_value
+			first_column = 0
+			first_row = 0
 			
+			top_quadrant = (0, 0, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, 0)
 			
-	
-
+		else:
 			
-	
-
-	def smooth_noise(self, x, y):
-
-		''' Return the average value of the 4 neighbors of the point (x, y) from self.noise_array. '''
+			first_column = int(x)
+			first_row = int(y)
 			
-		## NOTE! self.noise_array is a cranny full of state used for THIS FUNCTION ONLY.
+			top_quadrant = (x, y, supplied_width, supplied_height, uleft_corner, uright_corner, lleft_corner, lright_corner, 0)
 		
-		## The following is necessary because of modulo calls further down that would ignore it, but it needs to be saved.
-		## Get the trailing part of the floats of x and y:
-		fractional_element_of_x = ( x - int(x) )
-		fractional_element_of_y = ( y - int(y) )
-
-
+		if (detail_depth is not None) and (detail_depth < 0):
+			raise ValueError("detail_depth must be 0 or more, not %r." % (detail_depth,))
 		
-		x1 = ( (int(x) + self.noise_width) % self.noise_width )
-		y1 = ( (int(y) + self.noise_height) % self.noise_height )
+		split_depth = self.PARALLEL_SPLIT_DEPTH
 		
+		## A preview that stops before the split has nothing to hand out.
+		if (detail_depth is not None) and (detail_depth <= split_depth):
+			split_depth = detail_depth
 		
-		## I think the -1 is to compensate for the fractional_element_of_foo being extracted earlier.
-		## Remember, that fractional_element is added back in below.
-		## Apart from that, this is exactly the same as \
-		## figuring out the length of a line between \
-		## (x1, y1) and (x2, y2) in a noise plane.
-		## Or something like that. Surely.
-		x2 = ( (x1 + self.noise_width - 1) % self.noise_width )
-		y2 = ( (y1 + self.noise_height - 1) % self.noise_height )
-
-
-
-		## Take NOTE of the use of self.noise_array below...
-		## It's the place it really matters in this ridiculous three-function chain, \
-		## even though it's stored at the object level.
-			
-		## Begin the cooking process by taking out a bowl.
-		value = 0.0
-
-		## Place inside the bowl the fractional element of X times the fractional element of Y times the noise value at location (y1, x1)
-		value += ( fractional_element_of_x * fractional_element_of_y * self.noise_array[y1][x1] )
-
-		## Next, stir in the fractional element of X times (one minus the fractional element of y) times the noise value at location (y2, x1)
-		value += ( fractional_element_of_x * (1 - fractional_element_of_y) * self.noise_array[y2][x1] )
-
-		## Sprinkle liberal amounts of (one minus the fractional element of X) times the fractional element of Y times the noise value at location (y1, x2)
-		value += ( (1 - fractional_element_of_x) * fractional_element_of_y * self.noise_array[y1][x2] )
+		## The top levels, done here with the usual random numbers. Each quadrant they stop at gets filled with its average for now.
+		if integer_lattice:
+			split_quadrants = self.subdivide_plasma_quadrants_exactly(noise_buffer, [top_quadrant], split_depth)
+		else:
+			split_quadrants = self.subdivide_plasma_quadrants(noise_buffer, [top_quadrant], first_column, first_row, split_depth)
 		
-		## Line baking pan with a mixture of (one minus the fractional element of X) times (one minus the fractional element of Y) times the noise value at location (y2, x2)
-		value += ( (1 - fractional_element_of_x) * (1 - fractional_element_of_y) * self.noise_array[y2][x2] )
+		if (split_depth == detail_depth) or (len(split_quadrants) == 0):
+			return split_quadrants
 		
-		## I'm not yet sure how adding four things and then not dividing by four returns the AVERAGE value of the four neighbors of point (x, y) in the noise array. (Maybe it's already taken into account?)
-		## But slap that pan in the oven and let it burn for 0.002 ms.
+		## Every quadrant below the split draws its displacements from its own random.Random, seeded from one number drawn here and the quadrant's place in the tree.
+		## The quadrants, and the order the subdivision reaches them in, only depend on the map's size, so each quadrant gets the same seed however many workers there are, and whichever one it goes to.
+		quadrant_tree_seed = self.random_number_generator.getrandbits(64)
 		
+		quadrant_seeds = [self.hash_plasma_coordinates(quadrant_tree_seed, each_quadrant_number, split_depth, self.QUADRANT_SALT) for each_quadrant_number in range(0, len(split_quadrants))]
 		
-		return value
-
-	
-	
-	
-	
+		quadrant_count = len(split_quadrants)
+		
+		if workers < 1:
+			workers = (os.cpu_count() or 1)
+		
+		if workers == 1:
+			
+			quadrant_results = list(map(self.generate_plasma_quadrant, split_quadrants, quadrant_seeds, [integer_lattice] * quadrant_count, [detail_depth] * quadrant_count))
+			
+		else:
+			
+			with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=initialize_plasma_fractal_worker, initargs=(self.displacement_min, self.displacement_max, self.minimum_separation_distance)) as executor:
+				
+				quadrant_results = list(executor.map(generate_plasma_fractal_worker_quadrant, split_quadrants, quadrant_seeds, [integer_lattice] * quadrant_count, [detail_depth] * quadrant_count))
+		
+		
+		## Stitched back in the order the subdivision reached the quadrants, so where fill_plasma_buffer()'s rounding lands neighbouring quadrants on the same cell, the later one wins, as it would have done without the split.
+		unfinished_quadrants = []
+		
+		for block_first_column, block_first_row, quadrant_rows, each_unfinished_quadrants in quadrant_results:
+			
+			unfinished_quadrants.extend(each_unfinished_quadrants)
+			
+			block_first_column -= first_column
+			block_first_row -= first_row
+			
+			for each_row_index, each_quadrant_row in enumerate(quadrant_rows):
+				
+				map_row_index = (block_first_row + each_row_index)
+				
+				if not (0 <= map_row_index < supplied_height):
+					continue
+				
+				noise_row = noise_buffer[map_row_index]
+				
+				if integer_lattice:
+					
+					## Integer quadrants tile the map exactly, so every cell of the block is the quadrant's.
+					noise_row[block_first_column:(block_first_column + len(each_quadrant_row))] = each_quadrant_row
+					
+				else:
+					
+					## Cells the quadrant's subdivision never landed on are None, and keep what's already there.
+					for each_column_index, each_z_value in enumerate(each_quadrant_row, block_first_column):
+						
+						if (each_z_value is not None) and (0 <= each_column_index < supplied_width):
+							noise_row[each_column_index] = each_z_value
+		
+		return unfinished_quadrants
 	
-class SimplexNoiseGenerator:	
 	
+	def generate_plasma_quadrant(self, quadrant, quadrant_seed, integer_lattice=False, detail_depth=None):
+		
+		''' Subdivide one quadrant (as fill_plasma_buffer_in_parallel() hands them out) on its own, drawing its displacements from a random.Random seeded with quadrant_seed. Returns (first_column, first_row, quadrant_rows, unfinished_quadrants): the block of cells the quadrant covers, as a list of rows whose upper left cell is at (first_column, first_row) in the quadrant's coordinates, and the quadrants left unfinished because of detail_depth. '''
+		
+		## This is what each worker process runs, so it only uses the quadrant and the displacement settings, never the map.
+		random_number_generator = random.Random(quadrant_seed)
+		
+		x, y, supplied_width, supplied_height = quadrant[0:4]
+		
+		if integer_lattice:
+			
+			## The integer subdivision only depends on the quadrant's size, so it's done in a buffer of its own, with the quadrant moved to the corner.
+			quadrant_rows = [([-1] * supplied_width) for each_row in range(0, supplied_height)]
+			
+			unfinished_quadrants = self.subdivide_plasma_quadrants_exactly(quadrant_rows, [((0, 0) + tuple(quadrant[2:]))], detail_depth, random_number_generator)
+			
+			## ... and moved back.
+			unfinished_quadrants = [(((each_quadrant[0] + x), (each_quadrant[1] + y)) + each_quadrant[2:]) for each_quadrant in unfinished_quadrants]
+			
+			return (x, y, quadrant_rows, unfinished_quadrants)
+		
+		## fill_plasma_buffer()'s cells are rounded down from the quadrant's float coordinates, so they're kept where they are, and the buffer covers every cell they can round down into.
+		first_column = int(x)
+		first_row = int(y)
+		
+		block_width = max(1, (math.ceil(x + supplied_width) - first_column))
+		block_height = max(1, (math.ceil(y + supplied_height) - first_row))
+		
+		quadrant_rows = [([None] * block_width) for each_row in range(0, block_height)]
+		
+		unfinished_quadrants = self.subdivide_plasma_quadrants(quadrant_rows, [quadrant], first_column, first_row, detail_depth, random_number_generator)
+		
+		return (first_column, first_row, quadrant_rows, unfinished_quadrants)
 	
-	## These things are true for every instance of this class and does not require re-initting.
 	
-	## I don't really know what's going on here. Halp plix.
-	## ...
-	## The way it's referenced suggests that grad3 is an ordered list of simplex vertices.
-	## gi0/gi1/gi2 gives numbers that somehow map to indices of this list via a quite arcane mathemagical cantrip with no justification given. See below in the noise generator.
-	## I'm just gonna interpret all those Grad objects as simple boxes for vertex coordinates.
-	grad3 = [   [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],  \
-				[1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],	 \
-				[0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1]   ]
-	## ...
-	## Wow I think they actually decided not to include a grad2 table because the mapping for grad3 technically works for grad2 too.
-	## Wow.
-	## I'm gonna go ahead and make a grad2 table based on my interpretation of what is going on here.
-	grad2 = [	[1, 1], [-1, 1], [1, -1], [-1, -1],  \
-				[1, 0], [-1, 0], [1, 0], [-1, 0],    \
-				[0, 1], [0, -1], [0, 1], [0, -1]     ]
-	## Nooope does not make more sense now.
-	## I'm going to put all of my trust in the implicit knowledge of the Java coder here.
-	## Just going to assume using the first two columns of the grad3 table works.
-	## It probably should, given that in grad2, there are precisely 4 instances of each specific value across the table, in varying combinations.
-	## So even though there are repeats I guess it still works somehow?!
-	## Maybe the fact there's some modulus going on ensures the repeated indices get skipped or something?
+	def fill_plasma_block(self, noise_buffer, first_column, first_row, last_column, last_row, z_value):
+		
+		''' Set every cell of noise_buffer from (first_column, first_row) up to (but not including) (last_column, last_row) to z_value, clipped to noise_buffer's edges. Always sets at least the first cell, if it's inside. '''
+		
+		first_column = max(0, first_column)
+		first_row = max(0, first_row)
+		
+		last_row = min(len(noise_buffer), max(last_row, (first_row + 1)))
+		
+		for each_row in range(first_row, last_row):
+			
+			noise_row = noise_buffer[each_row]
+			
+			row_last_column = min(len(noise_row), max(last_column, (first_column + 1)))
+			
+			if row_last_column > first_column:
+				noise_row[first_column:row_last_column] = ( [z_value] * (row_last_column - first_column) )
 	
 	
+	def generate_region(self, origin_x, origin_y, width, height, randseed=None, lattice_spacing=None):
 		
-	## The next section initializes the skewing and unskewing factors.
-	## I looked in the Java code and these are just constants.
-	## They should probably be called in preprocessing somehow, maybe at the top of this module...
-	## But I want the generators to be able to whip out new worlds at high speeds...
-	## So it's either top of the module, presolved here, or it takes too long. Choose one.
-	
-	#F2 = 0.3660254037844386 # 0.5*(Math.sqrt(3.0)-1.0); <-- IDLE gives me 0.3660254037844386 instead of what I had -- the lower-precision 0.36602540378 ... I clearly made a mistake while putting the formula into Google as an impromptu calculator substitute. Whatever, I hadn't considered putting the stuff in the base class at that time.
-	#G2 = 0.21132486540518713 # (3.0-Math.sqrt(3.0))/6.0; apparently I copied it incorrectly. I had 2.71132486541 before I changed it to 0.21132486540518713
+		''' Return the width by height piece of an endless plasma world whose upper left cell is (origin_x, origin_y), in the usual ( array[y][x] == z ) format. The world is decided entirely by randseed (default: this generator's world_seed), so regions can be generated in any order, separately or in parallel, and the ones that touch or overlap agree exactly. '''
 		
-	## Trying out the math module for debugging purposes and it sort of makes it better anyways?
-	F2 = ( 0.5 * (math.sqrt(3.0) - 1.0) )
-	G2 = (  ( 3.0 - math.sqrt(3.0) ) / 6.0  )
-
+		## Each cell is a point of the world's integer lattice, and every point's value is defined by its own coordinates:
+		##   Points on multiples of lattice_spacing (in both x and y) get a hashed value between corners_min and corners_max.
+		##   Halfway between those, and so on down by halves, a point is either the middle of a square of coarser points, which gets their average plus a hashed displacement, \
+		##   or the middle of an edge between two coarser points, which gets their average. That's the same midpoint displacement fill_plasma_buffer() does.
+		## A region just works those values out, coarsest first, and at each level only for the points that the next level down needs.
+		## That's the region's own cells, plus at most one more point on each side per level, so a small region costs about as much as its cells no matter where it is.
+		## Nothing depends on where the region starts, so two regions always agree on the cells they share, edges and corners included.
+		if randseed is None:
+			
+			if self.world_seed is None:
+				self.world_seed = self.random_number_generator.getrandbits(64)
+			
+			randseed = self.world_seed
+		
+		if lattice_spacing is None:
+			lattice_spacing = self.REGION_LATTICE_SPACING
+		
+		if (lattice_spacing < 1) or (lattice_spacing & (lattice_spacing - 1)):
+			raise ValueError("lattice_spacing must be a power of two, not %r." % (lattice_spacing,))
+		
+		if (width < 1) or (height < 1):
+			return [[] for each_row in range(0, max(0, height))]
+		
+		## Going down a level only ever needs the coarser points around the finer ones, so the points each level needs cover the region, rounded out to that level's spacing.
+		## Each is (step, left, top, right, bottom), in world coordinates, from the region itself up to the lattice corners.
+		level_windows = [(1, origin_x, origin_y, (origin_x + width - 1), (origin_y + height - 1))]
+		
+		while level_windows[-1][0] < lattice_spacing:
+			
+			step, left, top, right, bottom = level_windows[-1]
+			
+			double_step = (step * 2)
+			
+			level_windows.append((double_step, ((left // double_step) * double_step), ((top // double_step) * double_step), (-((-right) // double_step) * double_step), (-((-bottom) // double_step) * double_step)))
+		
+		hash_plasma_coordinates = self.hash_plasma_coordinates
+		
+		corners_min = self.corners_min
+		corners_range = ( self.corners_max - self.corners_min + 1 )
+		
+		displacement_min = self.displacement_min
+		displacement_range = ( self.displacement_max - self.displacement_min + 1 )
+		
+		corner_seed = hash_plasma_coordinates(randseed, 0, 0, self.CORNER_SALT)
+		displacement_seed = hash_plasma_coordinates(randseed, 0, 0, self.DISPLACEMENT_SALT)
+		
+		## The lattice corners, as rows of points lattice_spacing apart.
+		coarse_step, coarse_left, coarse_top, coarse_right, coarse_bottom = level_windows.pop()
+		
+		coarse_points = [[float(corners_min + (hash_plasma_coordinates(corner_seed, each_x, each_y) % corners_range)) for each_x in range(coarse_left, (coarse_right + 1), coarse_step)] for each_y in range(coarse_top, (coarse_bottom + 1), coarse_step)]
+		
+		while level_windows:
+			
+			step, left, top, right, bottom = level_windows.pop()
+			
+			## Rows of the finer level are built across the whole of the coarser level's window, which is at most one point wider on each side, then trimmed to this level's window.
+			first_column = ((left - coarse_left) // step)
+			last_column = (first_column + ((right - left) // step) + 1)
+			
+			fine_points = []
+			
+			for each_y in range(top, (bottom + 1), step):
+				
+				coarse_row_index, row_offset = divmod((each_y - coarse_top), coarse_step)
+				
+				fine_row = [0.0] * ((2 * len(coarse_points[0])) - 1)
+				
+				if row_offset == 0:
+					
+					## A row of coarser points, with the edge middles between each two of them.
+					coarse_row = coarse_points[coarse_row_index]
+					
+					fine_row[0::2] = coarse_row
+					fine_row[1::2] = [((point_left + point_right) / 2) for point_left, point_right in zip(coarse_row, coarse_row[1:])]
+					
+				else:
+					
+					## A row halfway between two rows of coarser points: edge middles between the points above and below, and square middles between those.
+					row_above = coarse_points[coarse_row_index]
+					row_below = coarse_points[coarse_row_index + 1]
+					
+					fine_row[0::2] = [((point_above + point_below) / 2) for point_above, point_below in zip(row_above, row_below)]
+					fine_row[1::2] = [( ( (row_above[each_index] + row_above[each_index + 1] + row_below[each_index] + row_below[each_index + 1]) / 4 ) + ( displacement_min + (hash_plasma_coordinates(displacement_seed, (coarse_left + step + (each_index * coarse_step)), each_y) % displacement_range) ) ) for each_index in range(0, (len(row_above) - 1))]
+				
+				fine_points.append(fine_row[first_column:last_column])
+			
+			coarse_step, coarse_left, coarse_top = step, left, top
+			coarse_points = fine_points
+		
+		## The last level is the region itself.
+		return coarse_points
 	
 	
-	## There's a fastfloor algorithm in the Java code.
-	## Whether or not any algorithm modifications like this in Python might help is currently beyond me and beyond my needs to implement this generator.
-	## I'm skipping that.	
 	
 	
+	def generate_chunks(self, chunk_coordinates, chunk_width, chunk_height, randseed=None, lattice_spacing=None):
+		
+		''' Lazily yield (chunk_x, chunk_y, chunk) for each (chunk_x, chunk_y) pair in chunk_coordinates, where chunk is the fixed-size tile generate_region() returns for that spot in the chunk grid. '''
+		
+		## Same chunk grid as SimplexNoiseGenerator.generate_chunks(): chunk (1, 0) starts at world cell (chunk_width, 0), and so on.
+		## A chunk only works out its own cells and a thin border of coarser points around them, so chunks cost about the same wherever they fall on the lattice.
+		for chunk_x, chunk_y in chunk_coordinates:
+			
+			yield (chunk_x, chunk_y, self.generate_region((chunk_x * chunk_width), (chunk_y * chunk_height), chunk_width, chunk_height, randseed=randseed, lattice_spacing=lattice_spacing))
 	
 	
 	
-	def __init__(self, supplied_hash=255):
 	
-		## The following section initializes self.noise_array.
-		## NOTE: The Java example just runs through the same list twice -- in Python this approach makes index errors with all the easy ways to do that behavior, so I'm using a separate Python implementation's technique of repeating the list twice, instead.
-		## The list contains every integer from 0 to 255.
-		self.noise_array_seed = [151,160,137,91,90,15, \
-		131,13,201,95,96,53,194,233,7,225,140,36,103,30,69,142,8,99,37,240,21,10,23, \
-		190, 6,148,247,120,234,75,0,26,197,62,94,252,219,203,117,35,11,32,57,177,33, \
-		88,237,149,56,87,174,20,125,136,171,168, 68,175,74,165,71,134,139,48,27,166, \
-		77,146,158,231,83,111,229,122,60,211,133,230,220,105,92,41,55,46,245,40,244, \
-		102,143,54, 65,25,63,161, 1,216,80,73,209,76,132,187,208, 89,18,169,200,196, \
-		135,130,116,188,159,86,164,100,109,198,173,186, 3,64,52,217,226,250,124,123, \
-		5,202,38,147,118,126,255,82,85,212,207,206,59,227,47,16,58,17,182,189,28,42, \
-		223,183,170,213,119,248,152, 2,44,154,163, 70,221,153,101,155,167, 43,172,9, \
-		129,22,39,253, 19,98,108,110,79,113,224,232,178,185, 112,104,218,246,97,228, \
-		251,34,242,193,238,210,144,12,191,179,162,241, 81,51,145,235,249,14,239,107, \
-		49,192,214, 31,181,199,106,157,184, 84,204,176,115,121,50,45,127, 4,150,254, \
-		138,236,205,93,222,114,67,29,24,72,243,141,128,195,78,66,215,61,156,180]
+	def hash_plasma_coordinates(self, seed, x, y, salt=0):
 		
-		## Prep the noise_array variable for subsequent randomization. Remember, this is the __init__() for the generator. Things have to be initialized somewhere.
-		self.noise_array = []
+		''' Hash seed, integer coordinates (x, y) and salt into a well-mixed 64 bit integer, the same way every time. This is what stands in for random numbers in generate_region(). '''
 		
-		## Hash number is a variable because someone might think to make the seed some other number than 255 and would want to change the hash to match.
-		self.hash_number = supplied_hash
-
+		## splitmix64's finalizer, fed one value at a time. Negative coordinates are folded into 64 bits first.
+		sixty_four_bit_mask = self.SIXTY_FOUR_BIT_MASK
+		golden_gamma = self.SPLITMIX_GOLDEN_GAMMA
+		multiplier_one = self.SPLITMIX_MULTIPLIER_ONE
+		multiplier_two = self.SPLITMIX_MULTIPLIER_TWO
+		
+		hash_value = seed
+		
+		for each_value in (x, y, salt):
+			
+			hash_value = ( (hash_value ^ (each_value & sixty_four_bit_mask)) + golden_gamma ) & sixty_four_bit_mask
+			hash_value = ( (hash_value ^ (hash_value >> 30)) * multiplier_one ) & sixty_four_bit_mask
+			hash_value = ( (hash_value ^ (hash_value >> 27)) * multiplier_two ) & sixty_four_bit_mask
+			hash_value = ( hash_value ^ (hash_value >> 31) )
+		
+		return hash_value
+            
+            
+            
+            
+            
+            
+class PerlinNoiseGenerator:
 	
 	
-		## in Java I think you need to explicitly set the size of the array; not so in Python
-		self.permutations_table       = []
-		#self.permutations_table_Mod12 = []
+	## Every value a lattice point can take: the same thousandths random.randint(0, 1000) / 1000.0 would give.
+	LATTICE_VALUES = tuple( (each_value / 1000.0) for each_value in range(0, 1001) )
 	
+	## How many seeded lattices lattice_cache keeps before dropping the least recently used one.
+	LATTICE_CACHE_SIZE = 8
 	
-			
-		## Randomize the seed distribution (CURRENTLY DEBUGGING):
-		self.randomize_the_noise_array_seed()
-		
+	## Seeded lattices, keyed by (seed, width, height), shared by every PerlinNoiseGenerator.
+	## Parameter sweeps that only change frequency or octaves then never rebuild the lattice.
+	lattice_cache = collections.OrderedDict()
 	
-
 	
-		## This may only be called after self.hash_number has been established.
-		#self.generate_permutations_table()
+	## The kinds of noise the turbulence levels can be made of. See __init__().
+	NOISE_TYPES = ('value', 'gradient')
 	
+	## How many rows generate_noise_bands() works out (and hands over) at a time, unless told otherwise.
+	ROWS_PER_BAND = 16
 	
+	## How many rows generate_noise() sums its turbulence levels over at a time, when it isn't caching them.
+	ROWS_PER_PASS = 64
 	
+	## How many bands of rows generate_noise_in_parallel() gives each worker process, on average.
+	BANDS_PER_WORKER = 4
 	
+	## The output_dtype choices: for each, its array module typecode, what the values are scaled by, and what they're clipped to (None for no rounding or clipping).
+	OUTPUT_DTYPES = {
+		'float32': ('f', 1.0, None),
+		'float64': ('d', 1.0, None),
+		'uint8':   ('B', 1.0, 255),
+		'uint16':  ('H', 256.0, 65535),
+	}
 	
+	## Gradient noise picks each lattice point's gradient from these eight directions, using the permutations table as a hash.
+	GRADIENTS = ( (1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (-1, 0), (0, 1), (0, -1) )
 	
-	def generate_permutations_table(self):
 	
-		if self.hash_number == None:
-			
-			## Note that this presumes generate_permutations_table() will never be called when self.noise_array is zeroed out for regeneration or only half its normal size, which ought to always be the case.
-			self.hash_number = ((len(self.noise_array) // 2) - 1)
-			## The reasoning behind this is somewhat complex. It has to do with there being 512 numbers in the noise array...
-			## which is constructed by taking the 256 numbers in the initial noise array and putting them in again on the end in the same order.
-			## The noise array is that doubled size because of some sort of wraparound thing the simplex grid needs, I think.
-			## But for the hash number, it needs to be 255 if there are 256 distinct values. Why, I forget, but it's somewhere in the logic behind needing a permutations_table.
-			
+	def __init__(self, noise_type='value'):
 	
-		del self.permutations_table
+		## noise_type 'value' is the original generator: random values at the lattice points, smoothed bilinearly by smooth_noise().
+		## noise_type 'gradient' is classic gradient ("improved") Perlin noise: random gradients at the lattice points, blended with a fade curve by smooth_gradient_noise().
+		## Gradient noise doesn't have value noise's blocky grid artefacts, so it looks good with a far smaller octaves (size) value, which means far fewer turbulence levels.
+		if noise_type not in self.NOISE_TYPES:
+			raise ValueError("noise_type must be one of %s, not %r." % (", ".join(self.NOISE_TYPES), noise_type))
+		
+		self.noise_type = noise_type
 	
+		## The generator saves its noise-map state:
+		## noise_array is the lattice, stored flat: the value for (x, y) is at noise_array[(y * noise_width) + x].
+		self.noise_array = array.array('d')
+		self.noise_width = 0
+		self.noise_height = 0
+		
+		## The gradient noise hash: a shuffled 0-255 written out twice, plus the gradient components for every entry of it.
 		self.permutations_table = []
-	
-	
-		## I changed 512 to 256 because it was giving me "list index out of range"
-		## This was probably not a good idea but I'll figure out why once it gives me more meaningful results with its errors
-		## ...
-		## Comparing the java and python versions convinced me it should be the other way. Their tables are both supposed to be 512.
-		## ...
-		## Made hash number changeable.
-		## Note that the permutations_table must be the size of the noise_array, since it is the table of permutations of that noise array's values, with a 1:1 correspondence (bijection??)
-		for each_number in range(0, len(self.noise_array)):
+		self.gradient_x_table = []
+		self.gradient_y_table = []
+		
+		## Caches for the array backend and for reusing turbulence levels between windows. All of them are thrown out whenever noise_array is refilled.
+		self.noise_lattice_array = None
+		self.gradient_table_arrays = None
+		self.turbulence_pyramid = None
+		
+		## Unseeded lattices come from this generator's own Random, so nothing here touches (or depends on) the global random state.
+		self.random_number_generator = random.Random()
+		self.random_number_seed = None
+		
+		
+	def generate_noise(self, width, height, frequency, octaves, use_numpy=False, origin_x=0, origin_y=0, reshuffle=True, randseed=None, lattice_width=None, lattice_height=None, workers=None, output_dtype=None, cache_pyramid=False):
+		
+		''' Returns a tuple of [parameter 2] lists each containing [parameter 1] randomly generated integer numbers between $FIX_ME_MINIMUM and $FIX_ME_MAXIMUM, fractally smoothed as Perlin noise using a frequency of [parameter 3] and an octave count of [parameter 4]. With use_numpy=True the same values come back as a 2D NumPy integer array instead. origin_x and origin_y move the window being generated; reshuffle=False keeps the current noise_array, so windows of the same map can be generated one after another. randseed makes the lattice, and so the map, reproducible. lattice_width and lattice_height set the size of the random lattice, which wraps around rather than having to cover the whole map; they default to the map's own size. workers splits the map into bands of rows and generates them in that many processes (0 means one per CPU core); the result is the same whatever the number of workers. output_dtype picks what the values come back as; see finish_turbulence_map(). cache_pyramid=True keeps every turbulence level of the window on the generator, so later windows inside it (with reshuffle=False) come straight out of them; that costs a full-size image per level. '''
+		
+		## Octaves?
+		## It's used for calling turbulence(), which considers that parameter to be "size".
+		## The original function declared that changing octaves changes how far in or out from the noise you are zoomed.
+		## Which seems like a decent interpretation of the results.
+		## Raising the frequency makes it spikier (which is reminiscent of zooming out).
+		## Raising the octaves make it smoother (which is reminiscent of zooming in).
+		## Note that keeping the ratios of frequency to octaves the same will keep the results looking similar!
+		## For this reason I recommend using small octave values, since that governs the recursor runtime.
 		
-			## 255 was what the Java code said, but 256 produces non-errored results. Why would it be 255 any not 256 anyways? Very strange! Is python's method of storing data really that different from Java's? Can a short in Java only be positive? Can a list in python only be positive?! Argh...
-			## ...
-			## Just use 255. The Python implementation doesn't have a Mod12 table...
-			## I don't even know if it'll be faster, since I have to rehash everything every time I regenerate the array, anyways.
-			## It's entirely possible the second table for modulus results is actually wasteful rather than helpful. Idk.
-			## ...
-			## In fact I think it raises bad new problems in Python, given my perhaps mistaken instinct to use self.noise_array in building the mod table rather than permutations_table which I think is what's supposed to be used in the Java program...
-			## I'm going to drop the mod table and leave it here as evidence of my thought processes, for at least this version.
-			self.permutations_table.append(self.noise_array[(each_number & self.hash_number)])
-			
-
-
-
 
-	def randomize_the_noise_array_seed(self, random_number_seed=None):		
-			
-		## Does not currently support random seeds. >_>
-		## The parameter is there to inspire you to write it in, of course!
-			
-			
-		## I bet handlers are un-Pythonic for some convoluted reason nobody bothered to explain to me.
-		#noise_array_seed_handler = self.noise_array_seed
-		## ^--- This didn't work because the assignment operation here made changes to noise_array_seed_handler propagate to self.noise_array_seed...
-		## Which is undesirable for repeated randomizations.
-		## Sooooo, instead, copy more explicitly:
 		
-		noise_array_seed_handler = []
 		
-		for each_number in self.noise_array_seed:
-			noise_array_seed_handler.append(each_number)
+		self.prepare_noise_lattice(width, height, reshuffle, randseed, lattice_width, lattice_height)
 		
+		if (workers is not None) and (workers != 1):
+			return self.generate_noise_in_parallel(width, height, frequency, octaves, use_numpy=use_numpy, origin_x=origin_x, origin_y=origin_y, workers=workers, output_dtype=output_dtype)
 		
 		
-		##print("DEBUG: noise_array_seed_handler == %s" % (str(noise_array_seed_handler)))
+		## Turbulating the noise array ##
 		
-		new_noise_array = []
-			
-		## This whole function is about shuffling order of the noise array's contents while keeping the individual values of its contents the same.
-		while len(noise_array_seed_handler) > 1:
-			
-			## + 1 because it needs to include the final index.
-			## ...
-			## Except random.randint DOES NOT work like range(x, y) -- it includes the zeroeth index and the maximum index, I think. Whyyyyy did they make it inconsistent!
-			## ...
-			## It's even worse -- it gave me out-of-range errors when it was simply nothing added or subtracted, too. Have to do - 1 to make it randomize properly.
-			## This is something that should really be investigated when this routine is next improved.
-			which_number_to_pick = random.randint(0, (len(noise_array_seed_handler) - 1))
+		## Every turbulence level is a smooth_noise() image of the map, worked out in one pass each.
+		## The turbulence for a cell is then just the weighted sum of that cell in every level, the same sum totally_justified_turbulence_function() does.
+		if cache_pyramid:
 			
-			## DEBUGGING
-			##print("len(noise_array_seed_handler) == %d\n  which_number_to_pick == %d" % (len(noise_array_seed_handler), which_number_to_pick))
+			## The levels are kept as a pyramid for the next window to reuse.
+			turbulence_pyramid = self.get_turbulence_pyramid(origin_x, origin_y, width, height, frequency, octaves, use_numpy)
 			
+			result = self.combine_turbulence_levels(turbulence_pyramid, origin_x, origin_y, width, height, octaves, use_numpy, output_dtype)
 			
-			## Put the number at that index into the new_noise_array.
-			new_noise_array.append(noise_array_seed_handler[which_number_to_pick])
-
-			## Remove the number at that index from the list so this doesn't go on forever.
-			noise_array_seed_handler.pop(which_number_to_pick)
+		else:
 			
-		## The last one doesn't need and doesn't want to be randinted into existence.
-		new_noise_array.append(noise_array_seed_handler[0])
+			## Each level is added in and dropped as soon as it's worked out, and that's done ROWS_PER_PASS rows at a time.
+			## So besides the map itself there's only ever the running sum and one level image for a strip of the map.
+			if use_numpy:
+				result = numpy.empty((height, width), dtype=(numpy.int64 if (output_dtype is None) else output_dtype))
+			else:
+				result = []
 			
-		## Out with the old...	
-		del self.noise_array
-	
-		## ... and in with the new:
-		self.noise_array = new_noise_array
+			for first_row in range(0, height, self.ROWS_PER_PASS):
+				
+				rows_in_pass = min(self.ROWS_PER_PASS, height - first_row)
+				
+				finished_rows = self.finish_turbulence_map(self.sum_turbulence_levels(self.generate_turbulence_levels(origin_x, origin_y + first_row, width, rows_in_pass, frequency, octaves, use_numpy), 0, 0, width, rows_in_pass, use_numpy), octaves, use_numpy, output_dtype)
+				
+				if use_numpy:
+					result[first_row:(first_row + rows_in_pass)] = finished_rows
+				else:
+					result.extend(finished_rows)
+				
+		
+		## NOTE that the NoiseGenerator does NOT save the result as state.
+		## It hands it off to whatever called its generate_noise() function.
+		## This is where this generator's entire function chain ends:
+		return result
 	
-		## DEBUG
-		##print("    Debug: self.noise_array == %s" % (str(self.noise_array)))
-		## /DEBUG
 	
-		## The randomization call should be callable on its own, so include this to make it the proper length:
-		self.double_the_noise_array()
 	
-		## This part is required because the permutations table draws from the noise array and is critical to making a new noise map. Forgot about that after taking a few days' break.
-		## Always call generate_permutations_table() when the noise array is full and doubled.	
-		self.generate_permutations_table()
 	
+	def generate_noise_bands(self, width, height, frequency, octaves, use_numpy=False, origin_x=0, origin_y=0, reshuffle=True, randseed=None, lattice_width=None, lattice_height=None, band_height=None, output_dtype=None):
 		
-		## Clean the list references:
-		del noise_array_seed_handler
-		del new_noise_array
-		## ...
-		## I think this step is likely to be unnecessary, but it rules out one problem I thought my current issue could have been.
-	
-	
-	def double_the_noise_array(self):
+		''' Generator version of generate_noise(): takes the same parameters, but yields the map a band of band_height rows at a time (default ROWS_PER_BAND), top to bottom, each band in the same form generate_noise() would return the whole map in. '''
 		
-		## Uses the supplied argument to construct a more Python-friendly way of handling the simplex noise seed.
-		## This function supports the creation (and re-creation) of the noise array. Called in the noise generator's __init__() and reseed_noise() methods.
+		## Each band's turbulence levels are summed and dropped as it's worked out, and the band itself is dropped once it's handed over.
+		## So memory stays at one band's worth however tall the map is, and whoever's consuming the bands can get to work on the first one straight away.
+		## The bands aren't cached in self.turbulence_pyramid, so streaming doesn't disturb generate_noise(cache_pyramid=True)'s cache either.
+		if band_height is None:
+			band_height = self.ROWS_PER_BAND
 		
-		noise_array_handler = []
-
+		self.prepare_noise_lattice(width, height, reshuffle, randseed, lattice_width, lattice_height)
 		
-		## I got an out-of-memory error when trying to call this on itself.
-		## It just kept reading the array after it added all the numbers and looped endlessly. Oops.
-		## Time to break out the handlers!
-		## ...
-		## After changing the range number to 3 and 1, it seems to not actually care about being doubled. o_o
-		## Some day I'll know how simplex noise works. Eventually.
-		## Untill then, we move onwards with the cargo cult programming boilerplate.
-		for number_of_times_to_double_itself in range(0, 2):
-			for each_number in self.noise_array:
-				noise_array_handler.append(each_number)
-
-				
-		del self.noise_array
-		
-		
-		self.noise_array = noise_array_handler
-		
-
+		for first_row in range(0, height, max(1, band_height)):
+			
+			yield self.generate_noise_band(width, first_row, min((first_row + band_height), height), frequency, octaves, use_numpy=use_numpy, origin_x=origin_x, origin_y=origin_y, output_dtype=output_dtype)
+	
+	
+	
+	
+	def generate_noise_band(self, width, first_row, last_row, frequency, octaves, use_numpy=False, origin_x=0, origin_y=0, output_dtype=None):
 		
+		''' Generate rows first_row up to (but not including) last_row of the map generate_noise() would make from the current lattice, without touching the cached turbulence pyramid. '''
 		
+		rows_in_this_band = ( last_row - first_row )
 		
+		band_levels = self.generate_turbulence_levels(origin_x, (origin_y + first_row), width, rows_in_this_band, frequency, octaves, use_numpy)
 		
-	def twodee_dot_product(self, supplied_gradient, x, y):
-		## here I think I need to figure out what the grad class does
-		## ...
-		## I think it's just an object with a list of coords in it, like a MapTile.
-		## Maaaaaybe.
-		return ( (supplied_gradient[0] * x) + (supplied_gradient[1] * y) )
+		return self.finish_turbulence_map(self.sum_turbulence_levels(band_levels, 0, 0, width, rows_in_this_band, use_numpy), octaves, use_numpy, output_dtype)
 	
 	
 	
 	
-	
-	def generate_octaved_noise(self, supplied_x, supplied_y, scale, octaves, persistence):
+	def generate_noise_in_parallel(self, width, height, frequency, octaves, use_numpy=False, origin_x=0, origin_y=0, workers=0, output_dtype=None):
 		
-		'''
+		''' Split the map into bands of rows, generate them in a process pool from the current lattice and stack them back up in (array[y][x] == z) order. workers is the number of processes; 0 (or less) means one per CPU core. '''
 		
-		From << http://code.google.com/p/battlestar-tux/source/browse/procedural/simplexnoise.py >>
+		## Called by generate_noise(workers=...), after the lattice has been prepared.
+		## Note that on platforms that spawn rather than fork, the calling script needs the usual if __name__ == '__main__': guard.
 		
-		" 2D Multi-Octave Simplex noise.
+		if workers < 1:
+			workers = (os.cpu_count() or 1)
 		
-		For each octave, a higher frequency/lower amplitude function will be added 
-		to the original. The higher the persistence [0-1], the more of each
-		succeeding octave will be added. "
-			
-		'''
+		## A few bands per worker, so one slow band doesn't leave the other processes idle at the end.
+		band_count = max(1, min(height, (workers * self.BANDS_PER_WORKER)))
+		band_height = max(1, -((-height) // band_count))
 		
-		total_noise_for_this_cell = 0.0
-		frequency = scale  # -_-
-		amplitude = 1.0
+		first_rows = list(range(0, height, band_height))
+		last_rows = [min((each_first_row + band_height), height) for each_first_row in first_rows]
 		
-		# " We have to keep track of the largest possible amplitude,
-		# because each octave adds more, ad we need a value in [-1, 1]. "
-		max_amplitude = 0.0
+		band_count = len(first_rows)
 		
-		for each_octave in range(octaves):
+		## The lattice can be big, so rather than pickling a copy of it for every worker, it's copied once into a shared memory block the workers all read from.
+		## Every band is worked out from the same lattice with the same arithmetic, so the map doesn't depend on how it was split up.
+		lattice_size_in_bytes = ( len(self.noise_array) * self.noise_array.itemsize )
+		
+		lattice_shared_memory = multiprocessing.shared_memory.SharedMemory(create=True, size=max(1, lattice_size_in_bytes))
+		
+		try:
 			
-			new_x = supplied_x * frequency
-			new_y = supplied_y * frequency
+			lattice_shared_memory.buf[:lattice_size_in_bytes] = self.noise_array.tobytes()
 			
-			total_noise_for_this_cell += ( self.generate_raw_unoctaved_noise(new_x, new_y) * amplitude )
-
-			frequency *= 2.0
+			with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=initialize_perlin_noise_worker, initargs=(lattice_shared_memory.name, self.noise_width, self.noise_height, self.permutations_table, self.noise_type)) as executor:
+				
+				bands = list(executor.map(generate_perlin_noise_worker_band, [width] * band_count, first_rows, last_rows, [frequency] * band_count, [octaves] * band_count, [use_numpy] * band_count, [origin_x] * band_count, [origin_y] * band_count, [output_dtype] * band_count))
 			
-			max_amplitude += amplitude
-			## max_amplitude is also what the total is divided by at the end.
-			## This implies amplitude is some sort of average over all the iterations.
+		finally:
 			
+			lattice_shared_memory.close()
+			lattice_shared_memory.unlink()
+		
+		
+		if use_numpy:
 			
-			amplitude *= persistence
-
-
-		###print("  (total_noise_for_this_cell / max_amplitude) == " + str((total_noise_for_this_cell / max_amplitude)))
+			if len(bands) == 0:
+				return numpy.zeros((0, width), dtype=(numpy.int64 if (output_dtype is None) else output_dtype))
+			
+			return numpy.concatenate(bands, axis=0)
+		
+		array_to_be_returned = []
+		
+		for each_band in bands:
+			array_to_be_returned.extend(each_band)
+			
+		return array_to_be_returned
+	
 	
-		return (total_noise_for_this_cell / max_amplitude)
 	
 	
+	def generate_noise_rows(self, width, height, frequency, octaves, use_numpy=False, origin_x=0, origin_y=0, reshuffle=True, randseed=None, lattice_width=None, lattice_height=None, band_height=None, output_dtype=None):
+		
+		''' Like generate_noise_bands(), but yields the map one row at a time. The rows are still worked out a band at a time behind the scenes, since that's cheaper than one row at a time. '''
+		
+		for each_band in self.generate_noise_bands(width, height, frequency, octaves, use_numpy, origin_x, origin_y, reshuffle, randseed, lattice_width, lattice_height, band_height, output_dtype):
+			
+			for each_row in each_band:
+				yield each_row
 	
 	
-	def generate_noise(self, supplied_x, supplied_y, scale, octaves, persistence, randseed=None):
 	
-		
-		''' The gateway function for generate_octaved_noise(), this function makes sure the noise values are formatted according to the (array[y][x] == z) format used by my MapTile constructor. '''
 	
+	def prepare_noise_lattice(self, width, height, reshuffle=True, randseed=None, lattice_width=None, lattice_height=None):
 		
-		## IMPORTANT! I think there should be a reinitialize_noise_array() function called here.
-		## That function would reshuffle or maybe change the hash value on the noise_array (the permutations table, per other sources).
-		## ...
-		## Ooooor maybe that should be optional, because we might want to generate a map from a specific hash.
-		## I know: The hash should be changeable as a function outside this one that is invoked by the main program, like "rerandomized generator".
-		## This function should also apply to the other generators too...
-		## Perlin will be similar, plasma will be more of a hack involving saving state and giving that out unless a reset is requested, maybe?
-		## Or perhaps plasma will be just the same and I'm forgetting something about the RNG calls there.
-		## Check that.
-		## ...
-		## randomize_the_noise_array_seed() now handles randomization for this generator.
-		## It may be supplied with a random seed... but only if some moxie-filled programmer supplies it with the ability to do that, first!
+		''' Make sure self.noise_array is the lattice a width-by-height map with these settings should be made from, rebuilding it if necessary. See generate_noise() for what the parameters mean. '''
 		
-		## DEBUG
-		##print("\n  Generating new array of simplex noise . . .\n")
-		## /DEBUG
+		## The lattice doesn't have to be as big as the map: smooth_noise() wraps around it with modulo, so a small lattice just gets reused.
+		## A big map over a small lattice then costs memory for the map itself, plus the working rows generate_noise() sums ROWS_PER_PASS rows at a time.
+		if lattice_width is None:
+			lattice_width = ( width if (reshuffle or (not self.noise_array)) else self.noise_width )
+		
+		if lattice_height is None:
+			lattice_height = ( height if (reshuffle or (not self.noise_array)) else self.noise_height )
 		
-		self.randomize_the_noise_array_seed(random_number_seed=randseed)
+		## The noise_array is only rebuilt when asked for, when there isn't one yet, or when a different seed or lattice size is asked for.
+		if reshuffle or (not self.noise_array) \
+		or ((randseed is not None) and (randseed != self.random_number_seed)) \
+		or (lattice_width != self.noise_width) or (lattice_height != self.noise_height):
+			self.generate_noise_lattice(lattice_width, lattice_height, random_number_seed=randseed)
 	
-		array_to_be_returned = []
 	
-		for each_y in range(0, supplied_y):
-			
-			new_row = []
-			
-			for each_x in range(0, supplied_x):
-				
-				new_z_value = self.generate_octaved_noise(each_x, each_y, scale, octaves, persistence)
-				
-				###print("    new_z_value == " + str(new_z_value))
-
-				new_row.append(new_z_value)
-			
-			array_to_be_returned.append(new_row)
+	
+	
+	def combine_turbulence_levels(self, turbulence_pyramid, origin_x, origin_y, width, height, octaves, use_numpy=False, output_dtype=None):
 		
-		##print("\n  New array of simplex noise has been generated.\n")
+		''' Add up the levels of turbulence_pyramid over the given window, the way totally_justified_turbulence_function() does for one cell, and return the map as generate_noise() does. '''
 		
-		## DEBUG
-		##print("    array_to_be_returned == %s" % (str(array_to_be_returned)))
-		## /DEBUG
+		## Where this window starts inside the (possibly larger) area the pyramid covers:
+		left_edge = ( origin_x - turbulence_pyramid['origin_x'] )
+		top_edge = ( origin_y - turbulence_pyramid['origin_y'] )
 		
-		return array_to_be_returned
+		sizes_and_images = zip(turbulence_pyramid['level_sizes'], turbulence_pyramid['level_images'])
+		
+		return self.finish_turbulence_map(self.sum_turbulence_levels(sizes_and_images, left_edge, top_edge, width, height, use_numpy), octaves, use_numpy, output_dtype)
+	
+	
+	
+	
+	def sum_turbulence_levels(self, sizes_and_images, left_edge, top_edge, width, height, use_numpy=False):
 		
+		''' Return the weighted sum of the (size, level image) pairs from sizes_and_images over the width by height window whose upper left cell is (left_edge, top_edge) in the images: a 2D float64 NumPy array with use_numpy=True, or a list of array.array('d') rows. The pairs are taken one at a time, so they can come from generate_turbulence_levels() without ever all being around at once. '''
 		
+		## Each cell gets its levels added in the same order totally_justified_turbulence_function() adds them, so the sums are identical.
+		if use_numpy:
+			
+			noise_value = numpy.zeros((height, width), dtype=numpy.float64)
+			
+			for size, level_image in sizes_and_images:
+				noise_value += ( level_image[top_edge:(top_edge + height), left_edge:(left_edge + width)] * size )
+			
+			return noise_value
 		
+		noise_value_rows = [array.array('d', bytes(8 * width)) for each_y in range(0, height)]
 		
-	def generate_raw_unoctaved_noise(self, supplied_x, supplied_y):
-	
-		## After some review...
-		## The "skewing" is just multiplying the coord numbers by a constant so that everything we want to do on an x,y Cartesian board gets translated onto a simplex board.
-		## i and j are the "coordinates" when translated into simplexese.
-		## t uses G2 because it can't just do subtraction from the already-worked s value baked into i and j.
-		## t is, I think, the Cartesian midpoint coordinate.
-		## So essentially all the s, i, j, t, x0, y0 defining-lines are about getting simplex-to-Cartesian and vice versa translations.
+		for size, level_image in sizes_and_images:
+			
+			for each_y, noise_value_row in enumerate(noise_value_rows):
+				
+				level_row = level_image[top_edge + each_y][left_edge:(left_edge + width)]
+				
+				## Rebuilt in one go rather than updated a cell at a time, which is a lot quicker in plain Python.
+				noise_value_rows[each_y] = array.array('d', [(each_noise_value + (each_level_value * size)) for each_noise_value, each_level_value in zip(noise_value_row, level_row)])
+		
+		return noise_value_rows
 	
 	
 	
 	
-		## "Skew the input space to determine which simplex cell we're in"
-		s = (supplied_x + supplied_y) * self.F2	# they also said something about "hairy skew factor" ... wat.
+	def finish_turbulence_map(self, noise_value, octaves, use_numpy=False, output_dtype=None):
+		
+		''' Turn the summed turbulence levels from sum_turbulence_levels() into the map generate_noise() returns, reusing noise_value's memory where it can. By default the values are int()ed into lists of ints (or an int64 array). output_dtype can instead be 'float32' or 'float64' for the unrounded values, 'uint8' for the usual whole numbers clipped to 0-255, or 'uint16' for the values times 256, clipped to 0-65535, which keeps eight bits of the fraction. Each row is then an array.array of that type, or the whole map one NumPy array of that dtype with use_numpy=True. '''
+		
+		if (output_dtype is not None) and (output_dtype not in self.OUTPUT_DTYPES):
+			raise ValueError("output_dtype must be None or one of %s, not %r." % (", ".join(sorted(self.OUTPUT_DTYPES)), output_dtype))
+		
+		initial_size = ( octaves * 1.0 )
+		
+		if use_numpy:
 			
-		i = int((supplied_x + s))	# how is this supposed to work?!
+			## Everything is done in place on the sum, which then becomes the map (float64) or is converted once into it (the rest).
+			noise_value /= initial_size
+			noise_value *= 128.0
 			
-		j = int((supplied_y + s))
-		## I THINK the values of x and y are always 0 or 1... (?)
-		## Which would be how all of these things can just add and subtract from eachother sensibly.
-		## Maybe?!? This IS what I'm trying to find out by translating it from Java...
-		## It isn't magic programming if I'm actually trying to understand how it works!
+			## int() truncates towards zero, and so does this.
+			if output_dtype is None:
+				
+				numpy.trunc(noise_value, out=noise_value)
+				
+				return noise_value.astype(numpy.int64, copy=False)
+			
+			output_scale, output_maximum = self.OUTPUT_DTYPES[output_dtype][1:]
+			
+			if output_maximum is not None:
+				
+				noise_value *= output_scale
+				
+				numpy.trunc(noise_value, out=noise_value)
+				numpy.clip(noise_value, 0, output_maximum, out=noise_value)
+			
+			## float32 is rounded once from the float64 sum, as the plain Python path does, rather than summed in float32.
+			return noise_value.astype(output_dtype, copy=False)
+		
+		
+		if output_dtype is not None:
+			output_typecode, output_scale, output_maximum = self.OUTPUT_DTYPES[output_dtype]
+		
+		result = []
+		
+		for noise_value_row in noise_value:
+			
+			## Same order of operations as totally_justified_turbulence_function(), so the values are identical.
+			if output_dtype is None:
+				
+				turbulated_noise_row_handler = [int((each_noise_value / initial_size) * 128.0) for each_noise_value in noise_value_row]
+				
+			elif output_maximum is None:
+				
+				## float64 rows are finished in place; float32 ones are rounded from them as they're copied.
+				for each_x in range(0, len(noise_value_row)):
+					noise_value_row[each_x] = ( (noise_value_row[each_x] / initial_size) * 128.0 )
+				
+				turbulated_noise_row_handler = ( noise_value_row if (output_typecode == 'd') else array.array(output_typecode, noise_value_row) )
+				
+			else:
+				
+				## A zeroed row of the right type, filled in place below. Each row is its own array.array, not a view into one buffer for the whole map.
+				## Note that the whole number types still make one Python int per cell on the way in: array.array only takes ints for them. Only the NumPy path avoids that.
+				turbulated_noise_row_handler = array.array(output_typecode, bytes(array.array(output_typecode).itemsize * len(noise_value_row)))
+				
+				for each_x, each_noise_value in enumerate(noise_value_row):
+					
+					quantized_noise_value = int(((each_noise_value / initial_size) * 128.0) * output_scale)
+					turbulated_noise_row_handler[each_x] = ( 0 if (quantized_noise_value < 0) else min(quantized_noise_value, output_maximum) )
 			
-		t = (float(i + j) * self.G2)
+			result.append(turbulated_noise_row_handler)
+		
+		return result
 	
 	
 	
-		## "Unskew the cell origin back to (x, y) space" <--- "(x, y) space" means the whole Cartesian square coordinate thing, rather than... simplex-adjusted coordinates.
-		unskewed_x_zero = (i - t)
-		unskewed_y_zero = (j - t)
+	
+	def generate_noise_lattice(self, width, height, random_number_seed=None):
+		
+		''' Point self.noise_array at a width-by-height grid of random values between 0 and 1, stored row by row in one flat array of doubles, and build the matching permutations table for gradient noise. Seeded lattices are shared through the class's lattice_cache, so asking for the same (seed, width, height) again costs nothing. Any cached turbulence pyramid is thrown out if the lattice actually changes. '''
+		
+		## actually self.noise_array is used internally to the generator's function and does not save the actual noise map.
+		## Interesting, that.
+		## It's never written to once it's built, which is what makes sharing it between generators safe.
+		lattice_cache = self.lattice_cache
+		lattice_key = (random_number_seed, width, height)
+		
+		if (random_number_seed is not None) and (lattice_key in lattice_cache):
 			
+			## Least recently used lattices get dropped first, so bump this one to the back of the line.
+			lattice_cache.move_to_end(lattice_key)
+			new_noise_array, new_permutations_table = lattice_cache[lattice_key]
 			
+		else:
 			
-		## "The x,y distances from the cell origin" <--- by x,y they mean Cartesian rather than simplex-ian
-		x0 = (supplied_x - unskewed_x_zero)
-		y0 = (supplied_y - unskewed_y_zero)
+			## Seeded lattices get their own Random so the seed alone decides the values; unseeded ones draw from this generator's own Random.
+			if random_number_seed is not None:
+				lattice_random_number_generator = random.Random(random_number_seed)
+			else:
+				lattice_random_number_generator = self.random_number_generator
 			
+			## Same values random.randint(0, 1000) / 1000.0 would give, drawn for the whole lattice in one call.
+			new_noise_array = array.array('d', lattice_random_number_generator.choices(self.LATTICE_VALUES, k=(width * height)))
 			
-		## "For the twodee case, the simplex shape is an equilateral triangle."
-		## "Determine which simplex we are in."
-		## i1, j1 are "offsets for second (middle) corner of simplex in (i, j) coords"
-		## It's basically going top, right, bottom along the triangle, if I understand correctly.
-		if x0 > y0:
-			## "lower triangle, XY order: (0, 0) --> (1, 0) --> (1, 1)"
-			i1 = 1
-			j1 = 0
-		else:
-			## "upper triangle, YX order: (0, 0) --> (0, 1) --> (1, 1)"
-			i1 = 0
-			j1 = 1
-	
+			## The permutations table is drawn after the lattice values, so adding it didn't change any seeded value lattice.
+			## It has an entry for every column and row of the lattice (and at least the usual 256), so the gradients only repeat when the lattice does.
+			new_permutations_table = list(range(0, max(256, width, height)))
+			lattice_random_number_generator.shuffle(new_permutations_table)
 			
+			## Doubled so the hash in smooth_gradient_noise() never has to wrap its index.
+			new_permutations_table = ( new_permutations_table * 2 )
 			
-		## "  A step of (1,0) in (i,j) means a step of (1-c,-c) in (x,y), and
-		## a step of (0,1) in (i,j) means a step of (-c,1-c) in (x,y), where
-		## c = (3-sqrt(3))/6  " ((c == G2))
-	
+			if random_number_seed is not None:
+				
+				lattice_cache[lattice_key] = (new_noise_array, new_permutations_table)
+				
+				if len(lattice_cache) > self.LATTICE_CACHE_SIZE:
+					lattice_cache.popitem(last=False)
+		
+		self.random_number_seed = random_number_seed
+		
+		if (new_noise_array is self.noise_array) and (width == self.noise_width) and (height == self.noise_height):
+			return
+		
+		self.load_noise_lattice(new_noise_array, width, height, new_permutations_table)
 	
-		## "Offsets for second (middle) corner of simplex in (x,y) unskewed coords"
-		x1 = (x0 - i1 + self.G2)
-		y1 = (y0 - j1 + self.G2)
 	
 	
-		## "Offsets for last corner in (x,y) unskewed coords"
-		x2 = x0 - 1.0 + 2.0 * self.G2  # Why do people think not using parens on math is a good idea?
-		y2 = y0 - 1.0 + 2.0 * self.G2  # I don't care about OoP. It's just sensible to give punctuation to that sort of thing. Someone COULD easily make a mistake, but with punctuation you trade the reader's interpretation time for safety, which is far better, imo.
 	
+	def load_noise_lattice(self, noise_array, noise_width, noise_height, permutations_table):
+		
+		''' Take on a lattice built elsewhere (by another generator, or shared by the parent process in parallel mode): noise_array is the flat lattice of noise_width by noise_height values, and permutations_table the doubled gradient hash to go with it. '''
+		
+		self.noise_array = noise_array
+		self.permutations_table = permutations_table
+		
+		## Looking the gradient components up by hash value directly saves a GRADIENTS lookup per corner.
+		self.gradient_x_table = [self.GRADIENTS[each_entry & 7][0] for each_entry in permutations_table]
+		self.gradient_y_table = [self.GRADIENTS[each_entry & 7][1] for each_entry in permutations_table]
+		
+		self.turbulence_pyramid = None
+		self.noise_lattice_array = None
+		self.gradient_table_arrays = None
+		
+		## Note that the NoiseGenerator saves these as state because they need to be referenced in the sub-functions below.
+		self.noise_width = noise_width
+		self.noise_height = noise_height
 	
 	
-		## "Work out the hashed gradient indices of the three simplex corners"
-		## I think th
-		## ...
-		## I don't know why they would bother hashing it with 255.
-		## Why does that even matter? Why not just do the operations on the base numbers?
-			
-		## It was 255 in the Java.
-		## But I have no idea how that was supposed to work. Isn't it supposed to be 256 anyways?
-		## ... the Python code I saw also uses 255 and had the 512 permutations buffer thing fixed by copying the array onto itself, which is what I'm gonna use, so I'll try the 255 thing again too.
-		ii = int(i) & self.hash_number
-		jj = int(j) & self.hash_number
 	
 	
-		'''
+	def clear_lattice_cache(self):
 		
-		## NOTE: All of the following in this commented block is tainted by my mistaken mod table.
-		## It was probably the reason I went through such trouble to debug it this way. Blah.
-	
-		####print("  Gradient DEBUG:\n  index of self.permutations_table[jj] == " + str(jj))
-		####print("    Gradient DEBUG:\n    index of self.permutations_table_Mod12[(ii + self.permutations_table[jj])] == " + str((ii + self.permutations_table[jj])))
-		####print("      Gradient DEBUG:\n      gradient_i_zero == " + str(self.permutations_table_Mod12[(ii + self.permutations_table[jj])]) + "\n")
-		#gradient_i_zero = self.permutations_table_Mod12[ii + self.permutations_table[jj]]
-
-		####print("  Gradient DEBUG:\n  index of self.permutations_table[(jj+j1)] == " + str((jj+j1)))
-		####print("    Gradient DEBUG:\n    index of self.permutations_table_Mod12[(ii + i1 + self.permutations_table[(jj+j1)])] == " + str((ii + i1 + self.permutations_table[(jj+j1)])))
-		####print("      Gradient DEBUG:\n      gradient_i_one == " + str(self.permutations_table_Mod12[(ii + i1 + self.permutations_table[(jj+j1)])]) + "\n")
-		#gradient_i_one = self.permutations_table_Mod12[ii + i1 + self.permutations_table[jj+j1]]
-
+		''' Forget every cached seeded lattice. The cache is shared by all PerlinNoiseGenerators. '''
 		
-		####print("  Gradient DEBUG:\n  index of self.permutations_table[(jj+j1)] == " + str((jj+j1)))
-		####print("    Gradient DEBUG:\n    index of self.permutations_table_Mod12[(ii + 1 + self.permutations_table[(jj+1)])] == " + str((ii + 1 + self.permutations_table[(jj+1)])))
-		####print("      Gradient DEBUG:\n      gradient_i_two == " + str(self.permutations_table_Mod12[(ii + 1 + self.permutations_table[(jj+1)])]) + "\n")
-		#gradient_i_two = self.permutations_table_Mod12[ii + 1 + self.permutations_table[jj+1]]
+		self.lattice_cache.clear()
 	
 	
-		'''
+	
+	
+	def get_turbulence_pyramid(self, origin_x, origin_y, width, height, frequency, octaves, use_numpy=False):
 		
+		''' Return the turbulence pyramid covering the given window: a dict holding the level sizes, one smooth_noise() (or smooth_gradient_noise()) image per level, and the origin of the area the images cover. The pyramid from the previous call is reused if it was built from the same noise_array, noise_type, frequency and octaves and already covers the window. '''
 		
+		## So panning or cropping inside an area that's already been generated doesn't cost any smoothing at all.
+		turbulence_pyramid = self.turbulence_pyramid
 		
-		## Note that the 1 constants are balanced with omitted 0 constants in the lines with "missing" elements.
-		gradient_i_zero = self.permutations_table[ii +      self.permutations_table[jj     ]] % 12
-		gradient_i_one  = self.permutations_table[ii + i1 + self.permutations_table[jj + j1]] % 12	
-		gradient_i_two  = self.permutations_table[ii +  1 + self.permutations_table[jj +  1]] % 12
-
+		if turbulence_pyramid is not None \
+		and turbulence_pyramid['parameters'] == (self.noise_type, frequency, octaves, use_numpy) \
+		and turbulence_pyramid['origin_x'] <= origin_x \
+		and turbulence_pyramid['origin_y'] <= origin_y \
+		and (origin_x + width) <= (turbulence_pyramid['origin_x'] + turbulence_pyramid['width']) \
+		and (origin_y + height) <= (turbulence_pyramid['origin_y'] + turbulence_pyramid['height']):
+			return turbulence_pyramid
 		
-			
-		## "Calculate the contribution from the three corners"
-		t0 = 0.5 - x0*x0 - y0*y0  # I really wish people would use parens in all multi-operator statements.
-			
-		if t0 < 0:
-			n0 = 0.0
-		else:
-			t0 *= t0
-				
-			## " (x,y) of grad3 used for twodee gradient "
-			###print("\n DEBUG:\n  t0 == " + str(t0) + "\n  twodee_dot_product == " + str(self.twodee_dot_product(self.grad3[gradient_i_zero], x0, y0)))
-			n0 = t0 * t0 * self.twodee_dot_product(self.grad3[gradient_i_zero], x0, y0)
+		self.turbulence_pyramid = self.build_turbulence_pyramid(origin_x, origin_y, width, height, frequency, octaves, use_numpy)
+		
+		return self.turbulence_pyramid
 	
 	
 	
-		t1 = 0.5 - x1*x1 - y1*y1
+	
+	def build_turbulence_pyramid(self, origin_x, origin_y, width, height, frequency, octaves, use_numpy=False):
+		
+		''' Work out a fresh turbulence pyramid covering exactly the given window. See get_turbulence_pyramid() for what's in it. '''
+		
+		level_sizes = []
+		level_images = []
+		
+		for size, level_image in self.generate_turbulence_levels(origin_x, origin_y, width, height, frequency, octaves, use_numpy):
 			
-		if t1 < 0:
-			n1 = 0.0
-		else:
-			t1 *= t1
-			n1 = t1 * t1 * self.twodee_dot_product(self.grad3[gradient_i_one], x1, y1)
+			level_sizes.append(size)
+			level_images.append(level_image)
+		
+		return {'parameters': (self.noise_type, frequency, octaves, use_numpy), 'origin_x': origin_x, 'origin_y': origin_y, 'width': width, 'height': height, 'level_sizes': level_sizes, 'level_images': level_images}
 	
 	
-		###print("\nDEBUGGING x0 == " + str(x0))
-		###print("DEBUGGING x1 == " + str(x1))
-		###print("DEBUGGING x2 == " + str(x2))		
-		
-		###print("\nDEBUGGING y0 == " + str(y0))
-		###print("DEBUGGING y1 == " + str(y1))
-		###print("DEBUGGING y2 == " + str(y2))				
 	
-		###print("\nDEBUGGING (x2 * x2) == " + str((x2 * x2)))
-		###print("DEBUGGING (y2 * y2) == " + str((y2 * y2)))
-		###print("DEBUGGING ((x2 * x2) - (y2 * y2)) == " + str((x2 * x2) - (y2 * y2)))
-		###print("DEBUGGING (0.5 - ((x2 * x2) - (y2 * y2))) == " + str((0.5 - ((x2 * x2) - (y2 * y2)))))
 	
-		## Apparently some clown thought it would be funny to allow order of operations to work all screwy in Java, or maybe someone sabatoged the code I was looking at.
-		## I really couldn't guess why, but this was the original code, written in Java:
-		## double t2 = 0.5 - x2*x2-y2*y2;
-		## There were no parentheses anywhere there.
+	def generate_turbulence_levels(self, origin_x, origin_y, width, height, frequency, octaves, use_numpy=False):
 		
-		t2 = 0.5 - x2*x2 - y2*y2
+		''' Lazily yield (size, level image) for each turbulence level over the given window, biggest size first: the smooth_noise() (or smooth_gradient_noise()) image of the window at that size, as a 2D NumPy array with use_numpy=True or a list of rows. '''
+		
+		## The level sizes are the same halving sequence totally_justified_turbulence_function() walks through.
+		level_sizes = []
+		
+		size = ( octaves * 1.0 )
+		
+		while (size >= 1):
+			level_sizes.append(size)
+			size /= 2.0
+		
+		## Note: Frequency is rolled into the coordinates here!
+		if use_numpy:
 			
+			if numpy is None:
+				raise ImportError("PerlinNoiseGenerator's array backend requires NumPy.")
 			
-		###print("DEBUGGING t0 == " + str(t0))	
-		###print("DEBUGGING t1 == " + str(t1))	
-		###print("DEBUGGING t2 == " + str(t2))	
+			x_coordinates = ( (numpy.arange(width, dtype=numpy.float64) + origin_x) * frequency )
+			y_coordinates = ( (numpy.arange(height, dtype=numpy.float64) + origin_y) * frequency )
+			
+			if self.noise_type == 'gradient':
+				
+				for size in level_sizes:
+					yield (size, self.smooth_gradient_noise_array((x_coordinates / size), (y_coordinates / size)))
+				
+			else:
+				
+				if self.noise_lattice_array is None:
+					## A view straight onto the flat lattice; nothing gets copied.
+					## Seeded lattices are shared through lattice_cache by every generator with the same seed and size, so the view is read-only: writing to it would change all their maps.
+					self.noise_lattice_array = numpy.frombuffer(self.noise_array, dtype=numpy.float64).reshape(self.noise_height, self.noise_width)
+					self.noise_lattice_array.flags.writeable = False
+				
+				for size in level_sizes:
+					yield (size, self.smooth_noise_array((x_coordinates / size), (y_coordinates / size), self.noise_lattice_array))
+			
+		else:
+			
+			x_coordinates = [((origin_x + each_x) * frequency) for each_x in range(0, width)]
+			y_coordinates = [((origin_y + each_y) * frequency) for each_y in range(0, height)]
 			
+			if self.noise_type == 'gradient':
+				generate_level_image = self.smooth_gradient_noise_image
+			else:
+				generate_level_image = self.smooth_noise_image
+			
+			for size in level_sizes:
+				yield (size, generate_level_image([(each_x / size) for each_x in x_coordinates], [(each_y / size) for each_y in y_coordinates]))
+			
+	
+	
+	
+	
+	
+
+	def totally_justified_turbulence_function(self, x, y, size):
 		
-		## I think I understand it now! the t's are ticking down like octaves in the perlin generator, or something?
-		## hrm it's multiplying, not dividing, so it couldn't get below zero that way unless it already was negative. ><
-		## Nevermind. Still don't understand it yet.
+		## noise_value is "built up" by smooth_noise():
+		noise_value = 0.0
 		
-		if t2 < 0:
-			n2 = 0.0
-		else:
-			t2 *= t2
-			n2 = t2 * t2 * self.twodee_dot_product(self.grad3[gradient_i_two], x2, y2)
+		## Floats it:
+		size *= 1.0
+		
+		initial_size = size
+		
+		
+		## This is kind of like fractally splitting a grid, except it just sort of "resonates" itself in half and applies noise smoothening or something. Octaves.
+		while (size >= 1):
+			
+			
+			if self.noise_type == 'gradient':
+				the_smooth_noise = self.smooth_gradient_noise((x / size), (y / size))
+			else:
+				the_smooth_noise = self.smooth_noise((x / size), (y / size))
+			
+			the_smooth_noise *= size
+			
+			## Add it to the noise_value pile:
+			noise_value += the_smooth_noise
+			
+			## Paring down the size... iterating downwards...
+			size /= 2.0
+			
+			
+		## Order of Operations suggests division before multiplication, so:
+		noise_value /= initial_size	
+			
+		## ???
+		## Experiment to figure out what it does! o_o	
+		## ...
+		## Biases the resulting z values to average out at this number:
+		noise_value *= 128.0
+
+		
+		return noise_value
+			
+			
 	
+
 			
+	
+
+	def smooth_noise(self, x, y):
+
+		''' Return the average value of the 4 neighbors of the point (x, y) from self.noise_array. '''
 			
-		## "Add contributions from each corner to get the final noise value."
-		## "The result is scaled to return values in the interval [-1, 1]."
+		## NOTE! self.noise_array is a cranny full of state used for THIS FUNCTION ONLY.
 		
-		###print("\nDEBUGGING n0 == " + str(n0))
-		###print("\nDEBUGGING n1 == " + str(n1))
-		###print("\nDEBUGGING n2 == " + str(n2))		
-		####print("\nDEBUGGING return " + str(70.0 * (n0 + n1 + n2)))
+		## The following is necessary because of modulo calls further down that would ignore it, but it needs to be saved.
+		## Get the trailing part of the floats of x and y:
+		fractional_element_of_x = ( x - int(x) )
+		fractional_element_of_y = ( y - int(y) )
+
+
+		
+		x1 = ( (int(x) + self.noise_width) % self.noise_width )
+		y1 = ( (int(y) + self.noise_height) % self.noise_height )
 		
-		#return 70.0 * (n0 + n1 + n2)
 		
+		## I think the -1 is to compensate for the fractional_element_of_foo being extracted earlier.
+		## Remember, that fractional_element is added back in below.
+		## Apart from that, this is exactly the same as \
+		## figuring out the length of a line between \
+		## (x1, y1) and (x2, y2) in a noise plane.
+		## Or something like that. Surely.
+		x2 = ( (x1 + self.noise_width - 1) % self.noise_width )
+		y2 = ( (y1 + self.noise_height - 1) % self.noise_height )
 
-		number_to_return = ( 70.0 * (n0 + n1 + n2) )
+
+
+		## Take NOTE of the use of self.noise_array below...
+		## It's the place it really matters in this ridiculous three-function chain, \
+		## even though it's stored at the object level.
+		## It's flat, so each row starts noise_width values after the last one.
+		noise_array = self.noise_array
+		row_y1 = ( y1 * self.noise_width )
+		row_y2 = ( y2 * self.noise_width )
+			
+		## Begin the cooking process by taking out a bowl.
+		value = 0.0
+
+		## Place inside the bowl the fractional element of X times the fractional element of Y times the noise value at location (y1, x1)
+		value += ( fractional_element_of_x * fractional_element_of_y * noise_array[row_y1 + x1] )
+
+		## Next, stir in the fractional element of X times (one minus the fractional element of y) times the noise value at location (y2, x1)
+		value += ( fractional_element_of_x * (1 - fractional_element_of_y) * noise_array[row_y2 + x1] )
+
+		## Sprinkle liberal amounts of (one minus the fractional element of X) times the fractional element of Y times the noise value at location (y1, x2)
+		value += ( (1 - fractional_element_of_x) * fractional_element_of_y * noise_array[row_y1 + x2] )
 		
-		## My program would work better with a result scaled to 0-255. Therefore...		
-		number_to_return += 1
-		number_to_return *= 128.0
-		## blah, getting NoneTypes after the octaves were added. Hrm...
+		## Line baking pan with a mixture of (one minus the fractional element of X) times (one minus the fractional element of Y) times the noise value at location (y2, x2)
+		value += ( (1 - fractional_element_of_x) * (1 - fractional_element_of_y) * noise_array[row_y2 + x2] )
 		
-		## debug:
-		###print("\n number_to_return == " + str(number_to_return))
+		## I'm not yet sure how adding four things and then not dividing by four returns the AVERAGE value of the four neighbors of point (x, y) in the noise array. (Maybe it's already taken into account?)
+		## But slap that pan in the oven and let it burn for 0.002 ms.
+		
+		
+		return value
+	
+	
+	
+	
+	def smooth_noise_image(self, x_coordinates, y_coordinates):
+		
+		''' Returns the grid of smooth_noise() values for every (x, y) pair from the two coordinate lists, as a list of rows, one row per y coordinate. '''
+		
+		## smooth_noise()'s fractions and lattice indices only depend on one axis each, so they're worked out once per column and once per row instead of once per cell.
+		noise_width = self.noise_width
+		noise_height = self.noise_height
+		noise_array = self.noise_array
+		
+		column_terms = []
+		
+		for x in x_coordinates:
+			
+			fractional_element_of_x = ( x - int(x) )
+			
+			x1 = ( (int(x) + noise_width) % noise_width )
+			x2 = ( (x1 + noise_width - 1) % noise_width )
+			
+			column_terms.append((fractional_element_of_x, (1 - fractional_element_of_x), x1, x2))
+		
+		level_image = []
+		
+		for y in y_coordinates:
+			
+			fractional_element_of_y = ( y - int(y) )
+			one_minus_fractional_element_of_y = ( 1 - fractional_element_of_y )
+			
+			y1 = ( (int(y) + noise_height) % noise_height )
+			y2 = ( (y1 + noise_height - 1) % noise_height )
+			
+			## Slicing the two lattice rows out once per row keeps the indexing in the inner loop simple.
+			noise_row_y1 = noise_array[(y1 * noise_width):((y1 + 1) * noise_width)]
+			noise_row_y2 = noise_array[(y2 * noise_width):((y2 + 1) * noise_width)]
+			
+			## The four terms are added in the same order as smooth_noise() adds them.
+			level_image.append([
+				( (fractional_element_of_x * fractional_element_of_y * noise_row_y1[x1])
+				+ (fractional_element_of_x * one_minus_fractional_element_of_y * noise_row_y2[x1])
+				+ (one_minus_fractional_element_of_x * fractional_element_of_y * noise_row_y1[x2])
+				+ (one_minus_fractional_element_of_x * one_minus_fractional_element_of_y * noise_row_y2[x2]) )
+				for fractional_element_of_x, one_minus_fractional_element_of_x, x1, x2 in column_terms])
+		
+		return level_image
+	
+	
+	
+	
+	def smooth_noise_array(self, x_coordinates, y_coordinates, noise_lattice):
+		
+		''' Array version of smooth_noise(): one bilinear interpolation pass over the grid of every (x, y) pair from the 1D coordinate arrays, reading from noise_lattice (self.noise_array as a 2D NumPy array). '''
+		
+		## The fractions and lattice indices only depend on one axis each, so they're worked out once per column and once per row and then broadcast.
+		x_whole_parts = numpy.trunc(x_coordinates)
+		y_whole_parts = numpy.trunc(y_coordinates)
+		
+		fractional_element_of_x = ( x_coordinates - x_whole_parts ).reshape(1, -1)
+		fractional_element_of_y = ( y_coordinates - y_whole_parts ).reshape(-1, 1)
+		
+		x1 = ( (x_whole_parts.astype(numpy.int64) + self.noise_width) % self.noise_width )
+		y1 = ( (y_whole_parts.astype(numpy.int64) + self.noise_height) % self.noise_height )
+		
+		x2 = ( (x1 + self.noise_width - 1) % self.noise_width )
+		y2 = ( (y1 + self.noise_height - 1) % self.noise_height )
+		
+		## Row index arrays as columns and column index arrays as rows, so each gather picks out the whole grid.
+		y1 = y1.reshape(-1, 1)
+		y2 = y2.reshape(-1, 1)
+		x1 = x1.reshape(1, -1)
+		x2 = x2.reshape(1, -1)
+		
+		## The four terms, added in the same order as smooth_noise() adds them.
+		value = ( fractional_element_of_x * fractional_element_of_y * noise_lattice[y1, x1] )
+		value += ( fractional_element_of_x * (1 - fractional_element_of_y) * noise_lattice[y2, x1] )
+		value += ( (1 - fractional_element_of_x) * fractional_element_of_y * noise_lattice[y1, x2] )
+		value += ( (1 - fractional_element_of_x) * (1 - fractional_element_of_y) * noise_lattice[y2, x2] )
+		
+		return value
+	
+	
+	
+	
+	def smooth_gradient_noise(self, x, y):
+		
+		''' Return the gradient noise value at the point (x, y), between 0 and 1 like smooth_noise()'s. The lattice wraps around every noise_width by noise_height points, the same as smooth_noise()'s does. '''
+		
+		## The lattice cell the point is in, wrapped around the lattice, and where the point is inside it.
+		whole_part_of_x = math.floor(x)
+		whole_part_of_y = math.floor(y)
+		
+		fractional_element_of_x = ( x - whole_part_of_x )
+		fractional_element_of_y = ( y - whole_part_of_y )
+		
+		x1 = ( whole_part_of_x % self.noise_width )
+		y1 = ( whole_part_of_y % self.noise_height )
+		x2 = ( (x1 + 1) % self.noise_width )
+		y2 = ( (y1 + 1) % self.noise_height )
+		
+		## The fade curve, 6t^5 - 15t^4 + 10t^3, has zero first and second derivatives at the cell edges, which is what hides the grid.
+		x_fade = ( fractional_element_of_x * fractional_element_of_x * fractional_element_of_x * ((fractional_element_of_x * ((fractional_element_of_x * 6.0) - 15.0)) + 10.0) )
+		y_fade = ( fractional_element_of_y * fractional_element_of_y * fractional_element_of_y * ((fractional_element_of_y * ((fractional_element_of_y * 6.0) - 15.0)) + 10.0) )
+		
+		## Hash each corner to its gradient...
+		permutations_table = self.permutations_table
+		gradient_x_table = self.gradient_x_table
+		gradient_y_table = self.gradient_y_table
+		
+		## x1 and y1 are already wrapped to the lattice, which is never bigger than the permutations table, so they index it as they are.
+		hash_x1 = permutations_table[x1]
+		hash_x2 = permutations_table[x2]
+		
+		hash_11 = ( hash_x1 + y1 )
+		hash_21 = ( hash_x2 + y1 )
+		hash_12 = ( hash_x1 + y2 )
+		hash_22 = ( hash_x2 + y2 )
+		
+		## ... and dot it with the offset from that corner to the point.
+		corner_11 = ( (gradient_x_table[hash_11] * fractional_element_of_x) + (gradient_y_table[hash_11] * fractional_element_of_y) )
+		corner_21 = ( (gradient_x_table[hash_21] * (fractional_element_of_x - 1.0)) + (gradient_y_table[hash_21] * fractional_element_of_y) )
+		corner_12 = ( (gradient_x_table[hash_12] * fractional_element_of_x) + (gradient_y_table[hash_12] * (fractional_element_of_y - 1.0)) )
+		corner_22 = ( (gradient_x_table[hash_22] * (fractional_element_of_x - 1.0)) + (gradient_y_table[hash_22] * (fractional_element_of_y - 1.0)) )
+		
+		## Blend the four corners along x, then along y, with the faded fractions.
+		top_edge = ( corner_11 + (x_fade * (corner_21 - corner_11)) )
+		bottom_edge = ( corner_12 + (x_fade * (corner_22 - corner_12)) )
+		
+		value = ( top_edge + (y_fade * (bottom_edge - top_edge)) )
+		
+		## Gradient noise runs from -1 to 1; the turbulence levels expect 0 to 1, like the value lattice.
+		return ( (value + 1.0) * 0.5 )
+	
+	
+	
+	
+	def smooth_gradient_noise_image(self, x_coordinates, y_coordinates):
+		
+		''' Returns the grid of smooth_gradient_noise() values for every (x, y) pair from the two coordinate lists, as a list of rows, one row per y coordinate. '''
+		
+		## As in smooth_noise_image(), everything that only depends on one axis is worked out once per column or once per row.
+		noise_width = self.noise_width
+		noise_height = self.noise_height
+		permutations_table = self.permutations_table
+		gradient_x_table = self.gradient_x_table
+		gradient_y_table = self.gradient_y_table
+		floor = math.floor
+		
+		column_terms = []
+		
+		for x in x_coordinates:
+			
+			whole_part_of_x = floor(x)
+			fractional_element_of_x = ( x - whole_part_of_x )
+			
+			x1 = ( whole_part_of_x % noise_width )
+			x2 = ( (x1 + 1) % noise_width )
+			
+			x_fade = ( fractional_element_of_x * fractional_element_of_x * fractional_element_of_x * ((fractional_element_of_x * ((fractional_element_of_x * 6.0) - 15.0)) + 10.0) )
+			
+			column_terms.append((fractional_element_of_x, (fractional_element_of_x - 1.0), x_fade, permutations_table[x1], permutations_table[x2]))
+		
+		level_image = []
+		
+		for y in y_coordinates:
+			
+			whole_part_of_y = floor(y)
+			fractional_element_of_y = ( y - whole_part_of_y )
+			fractional_element_of_y_minus_one = ( fractional_element_of_y - 1.0 )
+			
+			y1 = ( whole_part_of_y % noise_height )
+			y2 = ( (y1 + 1) % noise_height )
+			
+			y_fade = ( fractional_element_of_y * fractional_element_of_y * fractional_element_of_y * ((fractional_element_of_y * ((fractional_element_of_y * 6.0) - 15.0)) + 10.0) )
+			
+			level_row = []
+			
+			for fractional_element_of_x, fractional_element_of_x_minus_one, x_fade, hash_x1, hash_x2 in column_terms:
+				
+				## Same operations in the same order as smooth_gradient_noise().
+				hash_11 = ( hash_x1 + y1 )
+				hash_21 = ( hash_x2 + y1 )
+				hash_12 = ( hash_x1 + y2 )
+				hash_22 = ( hash_x2 + y2 )
+				
+				corner_11 = ( (gradient_x_table[hash_11] * fractional_element_of_x) + (gradient_y_table[hash_11] * fractional_element_of_y) )
+				corner_21 = ( (gradient_x_table[hash_21] * fractional_element_of_x_minus_one) + (gradient_y_table[hash_21] * fractional_element_of_y) )
+				corner_12 = ( (gradient_x_table[hash_12] * fractional_element_of_x) + (gradient_y_table[hash_12] * fractional_element_of_y_minus_one) )
+				corner_22 = ( (gradient_x_table[hash_22] * fractional_element_of_x_minus_one) + (gradient_y_table[hash_22] * fractional_element_of_y_minus_one) )
+				
+				top_edge = ( corner_11 + (x_fade * (corner_21 - corner_11)) )
+				bottom_edge = ( corner_12 + (x_fade * (corner_22 - corner_12)) )
+				
+				level_row.append( ((top_edge + (y_fade * (bottom_edge - top_edge))) + 1.0) * 0.5 )
+			
+			level_image.append(level_row)
+		
+		return level_image
+	
+	
+	
+	
+	def smooth_gradient_noise_array(self, x_coordinates, y_coordinates):
+		
+		''' Array version of smooth_gradient_noise(): one pass over the grid of every (x, y) pair from the 1D coordinate arrays. '''
+		
+		## The hash and gradient tables as NumPy arrays, built once per lattice.
+		if self.gradient_table_arrays is None:
+			self.gradient_table_arrays = ( numpy.array(self.permutations_table, dtype=numpy.int64), numpy.array(self.gradient_x_table, dtype=numpy.float64), numpy.array(self.gradient_y_table, dtype=numpy.float64) )
+		
+		permutations_table, gradient_x_table, gradient_y_table = self.gradient_table_arrays
+		
+		## Every line mirrors smooth_gradient_noise(), so the two agree exactly. Per-column terms are shaped as rows and per-row terms as columns, so they broadcast to the grid.
+		whole_part_of_x = numpy.floor(x_coordinates)
+		whole_part_of_y = numpy.floor(y_coordinates)
+		
+		fractional_element_of_x = ( x_coordinates - whole_part_of_x ).reshape(1, -1)
+		fractional_element_of_y = ( y_coordinates - whole_part_of_y ).reshape(-1, 1)
+		
+		x1 = ( whole_part_of_x.astype(numpy.int64) % self.noise_width )
+		y1 = ( whole_part_of_y.astype(numpy.int64) % self.noise_height )
+		x2 = ( (x1 + 1) % self.noise_width )
+		y2 = ( (y1 + 1) % self.noise_height )
+		
+		x_fade = ( fractional_element_of_x * fractional_element_of_x * fractional_element_of_x * ((fractional_element_of_x * ((fractional_element_of_x * 6.0) - 15.0)) + 10.0) )
+		y_fade = ( fractional_element_of_y * fractional_element_of_y * fractional_element_of_y * ((fractional_element_of_y * ((fractional_element_of_y * 6.0) - 15.0)) + 10.0) )
+		
+		hash_x1 = permutations_table[x1].reshape(1, -1)
+		hash_x2 = permutations_table[x2].reshape(1, -1)
+		y1 = y1.reshape(-1, 1)
+		y2 = y2.reshape(-1, 1)
+		
+		hash_11 = ( hash_x1 + y1 )
+		hash_21 = ( hash_x2 + y1 )
+		hash_12 = ( hash_x1 + y2 )
+		hash_22 = ( hash_x2 + y2 )
+		
+		corner_11 = ( (gradient_x_table[hash_11] * fractional_element_of_x) + (gradient_y_table[hash_11] * fractional_element_of_y) )
+		corner_21 = ( (gradient_x_table[hash_21] * (fractional_element_of_x - 1.0)) + (gradient_y_table[hash_21] * fractional_element_of_y) )
+		corner_12 = ( (gradient_x_table[hash_12] * fractional_element_of_x) + (gradient_y_table[hash_12] * (fractional_element_of_y - 1.0)) )
+		corner_22 = ( (gradient_x_table[hash_22] * (fractional_element_of_x - 1.0)) + (gradient_y_table[hash_22] * (fractional_element_of_y - 1.0)) )
+		
+		top_edge = ( corner_11 + (x_fade * (corner_21 - corner_11)) )
+		bottom_edge = ( corner_12 + (x_fade * (corner_22 - corner_12)) )
 		
+		value = ( top_edge + (y_fade * (bottom_edge - top_edge)) )
+		
+		return ( (value + 1.0) * 0.5 )
+
+	
+	
+	
+	
+	
+
+class SimplexNoiseGenerator:	
+	
+	
+	## These things are true for every instance of this class and does not require re-initting.
+	
+	## I don't really know what's going on here. Halp plix.
+	## ...
+	## The way it's referenced suggests that grad3 is an ordered list of simplex vertices.
+	## gi0/gi1/gi2 gives numbers that somehow map to indices of this list via a quite arcane mathemagical cantrip with no justification given. See below in the noise generator.
+	## I'm just gonna interpret all those Grad objects as simple boxes for vertex coordinates.
+	grad3 = [   [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],  \
+				[1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],	 \
+				[0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1]   ]
+	## ...
+	## Wow I think they actually decided not to include a grad2 table because the mapping for grad3 technically works for grad2 too.
+	## Wow.
+	## I'm gonna go ahead and make a grad2 table based on my interpretation of what is going on here.
+	grad2 = [	[1, 1], [-1, 1], [1, -1], [-1, -1],  \
+				[1, 0], [-1, 0], [1, 0], [-1, 0],    \
+				[0, 1], [0, -1], [0, 1], [0, -1]     ]
+	## Nooope does not make more sense now.
+	## I'm going to put all of my trust in the implicit knowledge of the Java coder here.
+	## Just going to assume using the first two columns of the grad3 table works.
+	## It probably should, given that in grad2, there are precisely 4 instances of each specific value across the table, in varying combinations.
+	## So even though there are repeats I guess it still works somehow?!
+	## Maybe the fact there's some modulus going on ensures the repeated indices get skipped or something?
+	
+	
+		
+	## The next section initializes the skewing and unskewing factors.
+	## I looked in the Java code and these are just constants.
+	## They should probably be called in preprocessing somehow, maybe at the top of this module...
+	## But I want the generators to be able to whip out new worlds at high speeds...
+	## So it's either top of the module, presolved here, or it takes too long. Choose one.
+	
+	#F2 = 0.3660254037844386 # 0.5*(Math.sqrt(3.0)-1.0); <-- IDLE gives me 0.3660254037844386 instead of what I had -- the lower-precision 0.36602540378 ... I clearly made a mistake while putting the formula into Google as an impromptu calculator substitute. Whatever, I hadn't considered putting the stuff in the base class at that time.
+	#G2 = 0.21132486540518713 # (3.0-Math.sqrt(3.0))/6.0; apparently I copied it incorrectly. I had 2.71132486541 before I changed it to 0.21132486540518713
+		
+	## Trying out the math module for debugging purposes and it sort of makes it better anyways?
+	F2 = ( 0.5 * (math.sqrt(3.0) - 1.0) )
+	G2 = (  ( 3.0 - math.sqrt(3.0) ) / 6.0  )
+
+	
+	
+	## How many row bands generate_noise_in_parallel() hands each worker process.
+	BANDS_PER_WORKER = 4
+	
+	
+	## Precomputed so the hot loop doesn't redo the multiplication every sample. Same value as writing 2.0 * G2 out in full.
+	G2_doubled = ( 2.0 * G2 )
+	
+	
+	## The 2D evaluators multiply their raw sum by 70.0 and then by 128.0 on the way to 0-255, so the derivatives get scaled by both.
+	DERIVATIVE_RESCALE = ( 70.0 * 128.0 )
+	
+	
+	## Where generate_domain_warped_noise() samples its x and y warp fields, in map cells from the cell being warped.
+	## Anything far enough apart works; these are just big, unrelated offsets so the two warp fields don't resemble each other or the final field.
+	WARP_FIELD_OFFSETS = ( (1731.3, 2897.1), (4523.9, 823.7) )
+	
+	
+	## Skewing and unskewing factors for the 3D and 4D evaluators, same idea as F2 and G2, along with their precomputed multiples.
+	F3 = ( 1.0 / 3.0 )
+	G3 = ( 1.0 / 6.0 )
+	G3_doubled = ( 2.0 * G3 )
+	G3_tripled = ( 3.0 * G3 )
+	
+	F4 = (  ( math.sqrt(5.0) - 1.0 ) / 4.0  )
+	G4 = (  ( 5.0 - math.sqrt(5.0) ) / 20.0  )
+	G4_doubled =    ( 2.0 * G4 )
+	G4_tripled =    ( 3.0 * G4 )
+	G4_quadrupled = ( 4.0 * G4 )
+	
+	
+	## The 4D evaluator needs its own gradients: the 32 midpoints of the edges of a 4D hypercube.
+	## grad3 above does the same job for 2D (first two columns) and 3D.
+	grad4 = [   [0, 1, 1, 1], [0, 1, 1, -1], [0, 1, -1, 1], [0, 1, -1, -1],          \
+				[0, -1, 1, 1], [0, -1, 1, -1], [0, -1, -1, 1], [0, -1, -1, -1],      \
+				[1, 0, 1, 1], [1, 0, 1, -1], [1, 0, -1, 1], [1, 0, -1, -1],          \
+				[-1, 0, 1, 1], [-1, 0, 1, -1], [-1, 0, -1, 1], [-1, 0, -1, -1],      \
+				[1, 1, 0, 1], [1, 1, 0, -1], [1, -1, 0, 1], [1, -1, 0, -1],          \
+				[-1, 1, 0, 1], [-1, 1, 0, -1], [-1, -1, 0, 1], [-1, -1, 0, -1],      \
+				[1, 1, 1, 0], [1, 1, -1, 0], [1, -1, 1, 0], [1, -1, -1, 0],          \
+				[-1, 1, 1, 0], [-1, 1, -1, 0], [-1, -1, 1, 0], [-1, -1, -1, 0]       ]
+	
+	
+	## Every table that's rebuilt from the noise array when it's reshuffled. These are what the per-seed cache saves and restores, in this order.
+	PERMUTATION_STATE_NAMES = ( 'noise_array', 'permutations_table', 'permutations_table_Mod12', 'gradient_x_table', 'gradient_y_table', 'gradient_z_table', \
+								'gradient4_x_table', 'gradient4_y_table', 'gradient4_z_table', 'gradient4_w_table' )
+	
+	
+	## There's a fastfloor algorithm in the Java code.
+	## It turns out it matters: int() rounds toward zero, which puts every negative coordinate in the wrong cell.
+	## In Python the fastfloor is just math.floor(), which generate_raw_unoctaved_noise() now uses.
+	
+	
+	
+	
+	
+	def __init__(self, supplied_hash=255, random_number_seed=None, reshuffle=True):
+	
+		## The following section initializes self.noise_array.
+		## NOTE: The Java example just runs through the same list twice -- in Python this approach makes index errors with all the easy ways to do that behavior, so I'm using a separate Python implementation's technique of repeating the list twice, instead.
+		## The list contains every integer from 0 to 255.
+		self.noise_array_seed = [151,160,137,91,90,15, \
+		131,13,201,95,96,53,194,233,7,225,140,36,103,30,69,142,8,99,37,240,21,10,23, \
+		190, 6,148,247,120,234,75,0,26,197,62,94,252,219,203,117,35,11,32,57,177,33, \
+		88,237,149,56,87,174,20,125,136,171,168, 68,175,74,165,71,134,139,48,27,166, \
+		77,146,158,231,83,111,229,122,60,211,133,230,220,105,92,41,55,46,245,40,244, \
+		102,143,54, 65,25,63,161, 1,216,80,73,209,76,132,187,208, 89,18,169,200,196, \
+		135,130,116,188,159,86,164,100,109,198,173,186, 3,64,52,217,226,250,124,123, \
+		5,202,38,147,118,126,255,82,85,212,207,206,59,227,47,16,58,17,182,189,28,42, \
+		223,183,170,213,119,248,152, 2,44,154,163, 70,221,153,101,155,167, 43,172,9, \
+		129,22,39,253, 19,98,108,110,79,113,224,232,178,185, 112,104,218,246,97,228, \
+		251,34,242,193,238,210,144,12,191,179,162,241, 81,51,145,235,249,14,239,107, \
+		49,192,214, 31,181,199,106,157,184, 84,204,176,115,121,50,45,127, 4,150,254, \
+		138,236,205,93,222,114,67,29,24,72,243,141,128,195,78,66,215,61,156,180]
+		
+		## Prep the noise_array variable for subsequent randomization. Remember, this is the __init__() for the generator. Things have to be initialized somewhere.
+		self.noise_array = []
+		
+		## Hash number is a variable because someone might think to make the seed some other number than 255 and would want to change the hash to match.
+		self.hash_number = supplied_hash
+
+	
+	
+		## in Java I think you need to explicitly set the size of the array; not so in Python
+		self.permutations_table       = []
+		
+		## Gradient lookup tables, rebuilt alongside the permutations table. See build_gradient_lookup_tables().
+		self.permutations_table_Mod12 = []
+		self.gradient_x_table         = []
+		self.gradient_y_table         = []
+		self.gradient_z_table         = []
+		self.gradient4_x_table        = []
+		self.gradient4_y_table        = []
+		self.gradient4_z_table        = []
+		self.gradient4_w_table        = []
+		
+		## NumPy copies of the lookup tables for the array backend. Built on demand by get_lookup_table_arrays().
+		self.lookup_table_arrays = None
+		
+		## The generator's own RNG for unseeded shuffles, and the per-seed table cache used by randomize_the_noise_array_seed().
+		self.random_number_generator = random.Random()
+		self.permutation_tables_by_seed = {}
+		
+		## The seed the current permutations table was shuffled from, or None if it was an unseeded shuffle.
+		self.random_number_seed = None
+	
+	
+			
+		## Randomize the seed distribution. Supplying random_number_seed here fixes the world this generator produces when generate_noise() is called with reshuffle=False.
+		## reshuffle=False leaves the tables empty, for a generator that's about to be handed them by load_permutations_table().
+		if reshuffle:
+			self.randomize_the_noise_array_seed(random_number_seed=random_number_seed)
+		
+	
+
+	
+		## This may only be called after self.hash_number has been established.
+		#self.generate_permutations_table()
+	
+	
+	
+	
+	
+	
+	def generate_permutations_table(self):
+	
+		if self.hash_number == None:
+			
+			## Note that this presumes generate_permutations_table() will never be called when self.noise_array is zeroed out for regeneration or only half its normal size, which ought to always be the case.
+			self.hash_number = ((len(self.noise_array) // 2) - 1)
+			## The reasoning behind this is somewhat complex. It has to do with there being 512 numbers in the noise array...
+			## which is constructed by taking the 256 numbers in the initial noise array and putting them in again on the end in the same order.
+			## The noise array is that doubled size because of some sort of wraparound thing the simplex grid needs, I think.
+			## But for the hash number, it needs to be 255 if there are 256 distinct values. Why, I forget, but it's somewhere in the logic behind needing a permutations_table.
+			
+	
+		del self.permutations_table
+	
+		self.permutations_table = []
+		self.lookup_table_arrays = None
+	
+	
+		## I changed 512 to 256 because it was giving me "list index out of range"
+		## This was probably not a good idea but I'll figure out why once it gives me more meaningful results with its errors
+		## ...
+		## Comparing the java and python versions convinced me it should be the other way. Their tables are both supposed to be 512.
+		## ...
+		## Made hash number changeable.
+		## Note that the permutations_table must be the size of the noise_array, since it is the table of permutations of that noise array's values, with a 1:1 correspondence (bijection??)
+		## 255 was what the Java code said, but 256 produces non-errored results. Why would it be 255 any not 256 anyways? Very strange! Is python's method of storing data really that different from Java's? Can a short in Java only be positive? Can a list in python only be positive?! Argh...
+		## ...
+		## Just use 255. The Python implementation doesn't have a Mod12 table...
+		## I don't even know if it'll be faster, since I have to rehash everything every time I regenerate the array, anyways.
+		## It's entirely possible the second table for modulus results is actually wasteful rather than helpful. Idk.
+		## ...
+		## In fact I think it raises bad new problems in Python, given my perhaps mistaken instinct to use self.noise_array in building the mod table rather than permutations_table which I think is what's supposed to be used in the Java program...
+		## I'm going to drop the mod table and leave it here as evidence of my thought processes, for at least this version.
+		## Built in one comprehension rather than an append loop; it's the same table either way.
+		noise_array = self.noise_array
+		hash_number = self.hash_number
+		self.permutations_table = [noise_array[(each_number & hash_number)] for each_number in range(0, len(noise_array))]
+		
+		## The gradient lookups depend only on the permutations table, so they're built once here rather than once per sample.
+		self.build_gradient_lookup_tables()
+	
+	
+	
+	
+	def build_gradient_lookup_tables(self):
+		
+		''' Precompute, for every index into the permutations table, the grad3 row it hashes to and that row's gradient components, plus the matching grad4 components for the 4D evaluator. '''
+		
+		## So it turns out the Mod12 table was a good idea after all, it just has to be built from permutations_table rather than noise_array.
+		## permutations_table_Mod12[k] == permutations_table[k] % 12, which is the grad3 row for a corner whose hashed index is k.
+		## The gradient tables go one step further and store the x and y components of that row directly,
+		## so generate_raw_unoctaved_noise() can skip the modulo, the grad3 lookup and the twodee_dot_product() call entirely.
+		self.permutations_table_Mod12 = [(each_permutation % 12) for each_permutation in self.permutations_table]
+		self.gradient_x_table = [self.grad3[each_gradient_index][0] for each_gradient_index in self.permutations_table_Mod12]
+		self.gradient_y_table = [self.grad3[each_gradient_index][1] for each_gradient_index in self.permutations_table_Mod12]
+		self.gradient_z_table = [self.grad3[each_gradient_index][2] for each_gradient_index in self.permutations_table_Mod12]
+		
+		## Same again for grad4, which has 32 rows instead of 12.
+		gradient4_rows = [self.grad4[(each_permutation % 32)] for each_permutation in self.permutations_table]
+		self.gradient4_x_table = [each_row[0] for each_row in gradient4_rows]
+		self.gradient4_y_table = [each_row[1] for each_row in gradient4_rows]
+		self.gradient4_z_table = [each_row[2] for each_row in gradient4_rows]
+		self.gradient4_w_table = [each_row[3] for each_row in gradient4_rows]
+		
+		self.lookup_table_arrays = None
+			
+
+
+
+
+	def randomize_the_noise_array_seed(self, random_number_seed=None):		
+		
+		''' Shuffle the seed values into a new noise array, then double it and rebuild the permutations table. A supplied random_number_seed makes the shuffle reproducible, and the resulting tables are cached so that seed never has to be shuffled again. '''
+		
+		## Seeded tables are remembered per (seed, hash) pair. Regenerating a known world just swaps the saved lists back in.
+		cache_key = (random_number_seed, self.hash_number)
+		
+		self.random_number_seed = random_number_seed
+		
+		if (random_number_seed is not None) and (cache_key in self.permutation_tables_by_seed):
+			
+			for each_name, each_table in zip(self.PERMUTATION_STATE_NAMES, self.permutation_tables_by_seed[cache_key]):
+				setattr(self, each_name, each_table)
+				
+			self.lookup_table_arrays = None
+			
+			return
+		
+		
+		## Draw from a private random.Random so the global random module's state is neither used nor disturbed.
+		## Unseeded calls share the generator's own RNG; seeded calls get a fresh one so the same seed always gives the same shuffle.
+		if random_number_seed is None:
+			random_number_generator = self.random_number_generator
+		else:
+			random_number_generator = random.Random(random_number_seed)
+		
+		## Copy the seed list so repeated randomizations always start from the same values...
+		new_noise_array = list(self.noise_array_seed)
+		
+		## ... and shuffle the copy in place. random.shuffle() is a Fisher-Yates shuffle, so this is linear rather than the old randint-and-pop loop.
+		random_number_generator.shuffle(new_noise_array)
+		
+		self.noise_array = new_noise_array
+	
+		## The randomization call should be callable on its own, so include this to make it the proper length:
+		self.double_the_noise_array()
+	
+		## This part is required because the permutations table draws from the noise array and is critical to making a new noise map. Forgot about that after taking a few days' break.
+		## Always call generate_permutations_table() when the noise array is full and doubled.	
+		self.generate_permutations_table()
+		
+		if random_number_seed is not None:
+			self.permutation_tables_by_seed[cache_key] = tuple(getattr(self, each_name) for each_name in self.PERMUTATION_STATE_NAMES)
+	
+	
+	
+	
+	def clear_permutation_table_cache(self):
+		
+		''' Forget every cached per-seed permutation table. '''
+		
+		self.permutation_tables_by_seed.clear()
+	
+	
+	def double_the_noise_array(self):
+		
+		## Uses the supplied argument to construct a more Python-friendly way of handling the simplex noise seed.
+		## This function supports the creation (and re-creation) of the noise array. Called in the noise generator's __init__() and reseed_noise() methods.
+		
+		## The noise array followed by a second copy of itself, in the same order.
+		## List multiplication builds a new list, so there's no risk of the array reading its own appended values forever.
+		self.noise_array = self.noise_array * 2
+		
+		
+		
+		
+		
+		
+	def twodee_dot_product(self, supplied_gradient, x, y):
+		## here I think I need to figure out what the grad class does
+		## ...
+		## I think it's just an object with a list of coords in it, like a MapTile.
+		## Maaaaaybe.
+		return ( (supplied_gradient[0] * x) + (supplied_gradient[1] * y) )
+	
+	
+	
+	
+	
+	def generate_octave_schedule(self, scale, octaves, persistence):
+		
+		''' Return (list of (frequency, amplitude) pairs, max_amplitude) for the given octave settings. '''
+		
+		## None of this depends on the cell being sampled, so generate_noise() works it out once per map and hands it to every cell,
+		## rather than every cell rebuilding the same frequencies and amplitudes and re-adding up max_amplitude.
+		## The arithmetic is exactly what the per-cell loop used to do, so the numbers are identical.
+		octave_schedule = []
+		frequency = scale  # -_-
+		amplitude = 1.0
+		
+		# " We have to keep track of the largest possible amplitude,
+		# because each octave adds more, ad we need a value in [-1, 1]. "
+		max_amplitude = 0.0
+		
+		for each_octave in range(octaves):
+			
+			octave_schedule.append((frequency, amplitude))
+			
+			frequency *= 2.0
+			
+			max_amplitude += amplitude
+			## max_amplitude is also what the total is divided by at the end.
+			## This implies amplitude is some sort of average over all the iterations.
+			
+			amplitude *= persistence
+			
+		return (octave_schedule, max_amplitude)
+	
+	
+	
+	
+	def generate_octaved_noise(self, supplied_x, supplied_y, scale, octaves, persistence, octave_schedule=None):
+		
+		'''
+		
+		From << http://code.google.com/p/battlestar-tux/source/browse/procedural/simplexnoise.py >>
+		
+		" 2D Multi-Octave Simplex noise.
+		
+		For each octave, a higher frequency/lower amplitude function will be added 
+		to the original. The higher the persistence [0-1], the more of each
+		succeeding octave will be added. "
+		
+		octave_schedule, if supplied, is what generate_octave_schedule() returned for these same settings.
+			
+		'''
+		
+		if octave_schedule is None:
+			octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+		
+		frequencies_and_amplitudes, max_amplitude = octave_schedule
+		
+		total_noise_for_this_cell = 0.0
+		
+		## Bound once instead of looked up every octave.
+		generate_raw_unoctaved_noise = self.generate_raw_unoctaved_noise
+		
+		for frequency, amplitude in frequencies_and_amplitudes:
+			
+			total_noise_for_this_cell += ( generate_raw_unoctaved_noise((supplied_x * frequency), (supplied_y * frequency)) * amplitude )
+
+
+		###print("  (total_noise_for_this_cell / max_amplitude) == " + str((total_noise_for_this_cell / max_amplitude)))
+	
+		return (total_noise_for_this_cell / max_amplitude)
+	
+	
+	
+	
+	def generate_noise(self, supplied_x, supplied_y, scale, octaves, persistence, randseed=None, use_numpy=False, reshuffle=True, origin_x=0, origin_y=0, workers=None):
+	
+		
+		''' The gateway function for generate_octaved_noise(), this function makes sure the noise values are formatted according to the (array[y][x] == z) format used by my MapTile constructor. With use_numpy=True the whole map is computed by generate_octaved_noise_array() and returned as a 2D NumPy array instead of a list of lists. With reshuffle=False the current permutations table is kept (persistent-world mode) and origin_x, origin_y pick which part of that world is sampled. workers > 1 (or 0 for every core) splits the map into row bands generated in a process pool; the result is identical to the serial path. '''
+	
+		
+		## IMPORTANT! I think there should be a reinitialize_noise_array() function called here.
+		## That function would reshuffle or maybe change the hash value on the noise_array (the permutations table, per other sources).
+		## ...
+		## Ooooor maybe that should be optional, because we might want to generate a map from a specific hash.
+		## I know: The hash should be changeable as a function outside this one that is invoked by the main program, like "rerandomized generator".
+		## This function should also apply to the other generators too...
+		## Perlin will be similar, plasma will be more of a hack involving saving state and giving that out unless a reset is requested, maybe?
+		## Or perhaps plasma will be just the same and I'm forgetting something about the RNG calls there.
+		## Check that.
+		## ...
+		## randomize_the_noise_array_seed() now handles randomization for this generator.
+		## It may be supplied with a random seed... but only if some moxie-filled programmer supplies it with the ability to do that, first!
+		
+		## DEBUG
+		##print("\n  Generating new array of simplex noise . . .\n")
+		## /DEBUG
+		
+		## Requires NumPy. Checked before anything is reshuffled or any worker is started.
+		if use_numpy and (numpy is None):
+			raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+		
+		## Persistent-world mode: with reshuffle=False the table is only rebuilt if a different seed is asked for, and even then a previously seen seed comes straight out of the cache.
+		## That's what lets several calls with different origins line up as parts of the same world.
+		if reshuffle or ((randseed is not None) and (randseed != self.random_number_seed)):
+			self.randomize_the_noise_array_seed(random_number_seed=randseed)
+		
+		
+		## Multi-process mode. Rows don't depend on each other, so bands of them can be farmed out and stacked back up in order.
+		if (workers is not None) and (workers != 1):
+			return self.generate_noise_in_parallel(supplied_x, supplied_y, scale, octaves, persistence, use_numpy=use_numpy, origin_x=origin_x, origin_y=origin_y, workers=workers)
+		
+		return self.generate_noise_band(supplied_x, 0, supplied_y, scale, octaves, persistence, use_numpy=use_numpy, origin_x=origin_x, origin_y=origin_y)
+		
+		
+		
+		
+	def generate_noise_band(self, supplied_x, first_row, last_row, scale, octaves, persistence, use_numpy=False, origin_x=0, origin_y=0):
+		
+		''' Return rows first_row up to (but not including) last_row of the map generate_noise() would make, using the current permutations table as-is. '''
+		
+		## Both generate_noise() and the process pool workers come through here, which is what guarantees the parallel path gives exactly the same numbers as the serial one.
+		
+		if use_numpy:
+			
+			## Requires NumPy. See the import section at the top of the module.
+			if numpy is None:
+				raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+			
+			## The x coordinates are one row and the y coordinates are one column; broadcasting turns them into the full grid inside the array methods without ever building two full-size coordinate arrays.
+			x_coordinates = (numpy.arange(supplied_x, dtype=numpy.float64).reshape(1, supplied_x) + origin_x)
+			y_coordinates = (numpy.arange(first_row, last_row, dtype=numpy.float64).reshape((last_row - first_row), 1) + origin_y)
+			
+			return self.generate_octaved_noise_array(x_coordinates, y_coordinates, scale, octaves, persistence)
+		
+	
+		array_to_be_returned = []
+		
+		## Bound once instead of looked up for every cell, and the octave schedule worked out once for the whole band.
+		generate_octaved_noise = self.generate_octaved_noise
+		octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+	
+		for each_y in range(first_row, last_row):
+			
+			new_row = []
+			
+			for each_x in range(0, supplied_x):
+				
+				new_z_value = generate_octaved_noise((origin_x + each_x), (origin_y + each_y), scale, octaves, persistence, octave_schedule)
+				
+				###print("    new_z_value == " + str(new_z_value))
+
+				new_row.append(new_z_value)
+			
+			array_to_be_returned.append(new_row)
+		
+		##print("\n  New array of simplex noise has been generated.\n")
+		
+		## DEBUG
+		##print("    array_to_be_returned == %s" % (str(array_to_be_returned)))
+		## /DEBUG
+		
+		return array_to_be_returned
+	
+	
+	
+	
+	def generate_noise_in_parallel(self, supplied_x, supplied_y, scale, octaves, persistence, use_numpy=False, origin_x=0, origin_y=0, workers=0):
+		
+		''' Split the map into bands of rows, generate them in a process pool and stack them back up in (array[y][x] == z) order. workers is the number of processes; 0 (or less) means one per CPU core. '''
+		
+		## Called by generate_noise(workers=...), after any reshuffling has already happened.
+		## Note that on platforms that spawn rather than fork, the calling script needs the usual if __name__ == '__main__': guard.
+		
+		if workers < 1:
+			workers = (os.cpu_count() or 1)
+		
+		## A few bands per worker, so one slow band doesn't leave the other processes idle at the end.
+		band_count = max(1, min(supplied_y, (workers * self.BANDS_PER_WORKER)))
+		band_height = max(1, -((-supplied_y) // band_count))
+		
+		first_rows = list(range(0, supplied_y, band_height))
+		last_rows = [min((each_first_row + band_height), supplied_y) for each_first_row in first_rows]
+		
+		band_count = len(first_rows)
+		
+		## The permutations table goes to each worker once, through the pool initializer, instead of once per band.
+		with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=initialize_simplex_noise_worker, initargs=(self.hash_number, self.noise_array, self.permutations_table, self.random_number_seed)) as executor:
+			
+			bands = list(executor.map(generate_simplex_noise_worker_band, [supplied_x] * band_count, first_rows, last_rows, [scale] * band_count, [octaves] * band_count, [persistence] * band_count, [use_numpy] * band_count, [origin_x] * band_count, [origin_y] * band_count))
+		
+		
+		if use_numpy:
+			
+			if len(bands) == 0:
+				return numpy.zeros((0, supplied_x), dtype=numpy.float64)
+			
+			return numpy.concatenate(bands, axis=0)
+		
+		array_to_be_returned = []
+		
+		for each_band in bands:
+			array_to_be_returned.extend(each_band)
+			
+		return array_to_be_returned
+	
+	
+	
+	
+	def load_permutations_table(self, noise_array, permutations_table, random_number_seed=None):
+		
+		''' Adopt an already-built noise array and permutations table (from another generator, say) without reshuffling, and rebuild the lookup tables that go with them. random_number_seed is the seed they were shuffled from, or None if that's unknown or they weren't seeded. '''
+		
+		self.noise_array = list(noise_array)
+		self.permutations_table = list(permutations_table)
+		self.random_number_seed = random_number_seed
+		
+		self.build_gradient_lookup_tables()
+		
+		
+		
+		
+	def generate_region(self, origin_x, origin_y, width, height, scale, octaves, persistence, randseed=None, use_numpy=False):
+		
+		''' Return the width by height piece of this generator's world whose upper left cell is (origin_x, origin_y), in the usual (array[y][x] == z) format. The permutations table is never reshuffled, so regions that touch line up seamlessly. '''
+		
+		## randseed switches worlds (through the per-seed cache); leaving it as None keeps using the current one.
+		return self.generate_noise(width, height, scale, octaves, persistence, randseed=randseed, use_numpy=use_numpy, reshuffle=False, origin_x=origin_x, origin_y=origin_y)
+	
+	
+	
+	
+	def generate_chunks(self, chunk_coordinates, chunk_width, chunk_height, scale, octaves, persistence, randseed=None, use_numpy=False):
+		
+		''' Lazily yield (chunk_x, chunk_y, chunk) for each (chunk_x, chunk_y) pair in chunk_coordinates, where chunk is the fixed-size tile generate_region() returns for that spot in the chunk grid. '''
+		
+		## chunk_coordinates can itself be a generator, so a streaming client only pays for the chunks it actually asks for.
+		## Chunk (0, 0) starts at world cell (0, 0), chunk (1, 0) starts at world cell (chunk_width, 0), and so on.
+		for chunk_x, chunk_y in chunk_coordinates:
+			
+			yield (chunk_x, chunk_y, self.generate_region((chunk_x * chunk_width), (chunk_y * chunk_height), chunk_width, chunk_height, scale, octaves, persistence, randseed=randseed, use_numpy=use_numpy))
+	
+	
+	
+	
+	def generate_raw_unoctaved_noise(self, supplied_x, supplied_y):
+	
+		## After some review...
+		## The "skewing" is just multiplying the coord numbers by a constant so that everything we want to do on an x,y Cartesian board gets translated onto a simplex board.
+		## i and j are the "coordinates" when translated into simplexese.
+		## t uses G2 because it can't just do subtraction from the already-worked s value baked into i and j.
+		## t is, I think, the Cartesian midpoint coordinate.
+		## So essentially all the s, i, j, t, x0, y0 defining-lines are about getting simplex-to-Cartesian and vice versa translations.
+	
+	
+	
+	
+		## The class constants are bound locally once per call; every extra self.foo in here gets paid for millions of times per map.
+		F2 = self.F2
+		G2 = self.G2
+		G2_doubled = self.G2_doubled
+		
+		
+		## "Skew the input space to determine which simplex cell we're in"
+		s = (supplied_x + supplied_y) * F2	# they also said something about "hairy skew factor" ... wat.
+		
+		## int() truncates toward zero, so for negative values it lands one cell too high.
+		## math.floor() gets that right, hands back an int, and is several times quicker than int() on a float besides.
+		floor = math.floor
+		
+		i = floor(supplied_x + s)	# how is this supposed to work?!
+			
+		j = floor(supplied_y + s)
+		## I THINK the values of x and y are always 0 or 1... (?)
+		## Which would be how all of these things can just add and subtract from eachother sensibly.
+		## Maybe?!? This IS what I'm trying to find out by translating it from Java...
+		## It isn't magic programming if I'm actually trying to understand how it works!
+			
+		## No float() needed: an int times a float is already a float, and the call isn't free.
+		t = ((i + j) * G2)
+	
+	
+	
+		## "Unskew the cell origin back to (x, y) space" <--- "(x, y) space" means the whole Cartesian square coordinate thing, rather than... simplex-adjusted coordinates.
+		unskewed_x_zero = (i - t)
+		unskewed_y_zero = (j - t)
+			
+			
+			
+		## "The x,y distances from the cell origin" <--- by x,y they mean Cartesian rather than simplex-ian
+		x0 = (supplied_x - unskewed_x_zero)
+		y0 = (supplied_y - unskewed_y_zero)
+			
+			
+		## "For the twodee case, the simplex shape is an equilateral triangle."
+		## "Determine which simplex we are in."
+		## i1, j1 are "offsets for second (middle) corner of simplex in (i, j) coords"
+		## It's basically going top, right, bottom along the triangle, if I understand correctly.
+		if x0 > y0:
+			## "lower triangle, XY order: (0, 0) --> (1, 0) --> (1, 1)"
+			i1 = 1
+			j1 = 0
+		else:
+			## "upper triangle, YX order: (0, 0) --> (0, 1) --> (1, 1)"
+			i1 = 0
+			j1 = 1
+	
+			
+			
+		## "  A step of (1,0) in (i,j) means a step of (1-c,-c) in (x,y), and
+		## a step of (0,1) in (i,j) means a step of (-c,1-c) in (x,y), where
+		## c = (3-sqrt(3))/6  " ((c == G2))
+	
+	
+		## "Offsets for second (middle) corner of simplex in (x,y) unskewed coords"
+		x1 = (x0 - i1 + G2)
+		y1 = (y0 - j1 + G2)
+	
+	
+		## "Offsets for last corner in (x,y) unskewed coords"
+		x2 = x0 - 1.0 + G2_doubled  # Why do people think not using parens on math is a good idea?
+		y2 = y0 - 1.0 + G2_doubled  # I don't care about OoP. It's just sensible to give punctuation to that sort of thing. Someone COULD easily make a mistake, but with punctuation you trade the reader's interpretation time for safety, which is far better, imo.
+	
+	
+	
+		## "Work out the hashed gradient indices of the three simplex corners"
+		## I think th
+		## ...
+		## I don't know why they would bother hashing it with 255.
+		## Why does that even matter? Why not just do the operations on the base numbers?
+			
+		## It was 255 in the Java.
+		## But I have no idea how that was supposed to work. Isn't it supposed to be 256 anyways?
+		## ... the Python code I saw also uses 255 and had the 512 permutations buffer thing fixed by copying the array onto itself, which is what I'm gonna use, so I'll try the 255 thing again too.
+		## i and j are already ints after math.floor(). & works on negative ints the way the wraparound needs it to.
+		hash_number = self.hash_number
+		ii = i & hash_number
+		jj = j & hash_number
+	
+	
+		'''
+		
+		## NOTE: All of the following in this commented block is tainted by my mistaken mod table.
+		## It was probably the reason I went through such trouble to debug it this way. Blah.
+	
+		####print("  Gradient DEBUG:\n  index of self.permutations_table[jj] == " + str(jj))
+		####print("    Gradient DEBUG:\n    index of self.permutations_table_Mod12[(ii + self.permutations_table[jj])] == " + str((ii + self.permutations_table[jj])))
+		####print("      Gradient DEBUG:\n      gradient_i_zero == " + str(self.permutations_table_Mod12[(ii + self.permutations_table[jj])]) + "\n")
+		#gradient_i_zero = self.permutations_table_Mod12[ii + self.permutations_table[jj]]
+
+		####print("  Gradient DEBUG:\n  index of self.permutations_table[(jj+j1)] == " + str((jj+j1)))
+		####print("    Gradient DEBUG:\n    index of self.permutations_table_Mod12[(ii + i1 + self.permutations_table[(jj+j1)])] == " + str((ii + i1 + self.permutations_table[(jj+j1)])))
+		####print("      Gradient DEBUG:\n      gradient_i_one == " + str(self.permutations_table_Mod12[(ii + i1 + self.permutations_table[(jj+j1)])]) + "\n")
+		#gradient_i_one = self.permutations_table_Mod12[ii + i1 + self.permutations_table[jj+j1]]
+
+		
+		####print("  Gradient DEBUG:\n  index of self.permutations_table[(jj+j1)] == " + str((jj+j1)))
+		####print("    Gradient DEBUG:\n    index of self.permutations_table_Mod12[(ii + 1 + self.permutations_table[(jj+1)])] == " + str((ii + 1 + self.permutations_table[(jj+1)])))
+		####print("      Gradient DEBUG:\n      gradient_i_two == " + str(self.permutations_table_Mod12[(ii + 1 + self.permutations_table[(jj+1)])]) + "\n")
+		#gradient_i_two = self.permutations_table_Mod12[ii + 1 + self.permutations_table[jj+1]]
+	
+	
+		'''
+		
+		
+		
+		## Each corner's hashed index points straight into the precomputed gradient tables; see build_gradient_lookup_tables().
+		## Note that the 1 constants are balanced with omitted 0 constants in the lines with "missing" elements.
+		permutations_table = self.permutations_table
+		gradient_x_table = self.gradient_x_table
+		gradient_y_table = self.gradient_y_table
+		
+		gradient_i_zero = ii +      permutations_table[jj     ]
+		gradient_i_one  = ii + i1 + permutations_table[jj + j1]
+		gradient_i_two  = ii +  1 + permutations_table[jj +  1]
+
+		
+			
+		## "Calculate the contribution from the three corners"
+		t0 = 0.5 - x0*x0 - y0*y0  # I really wish people would use parens in all multi-operator statements.
+			
+		if t0 < 0:
+			n0 = 0.0
+		else:
+			t0 *= t0
+				
+			## " (x,y) of grad3 used for twodee gradient ", written out inline instead of going through twodee_dot_product().
+			n0 = t0 * t0 * ( (gradient_x_table[gradient_i_zero] * x0) + (gradient_y_table[gradient_i_zero] * y0) )
+	
+	
+	
+		t1 = 0.5 - x1*x1 - y1*y1
+			
+		if t1 < 0:
+			n1 = 0.0
+		else:
+			t1 *= t1
+			n1 = t1 * t1 * ( (gradient_x_table[gradient_i_one] * x1) + (gradient_y_table[gradient_i_one] * y1) )
+	
+	
+		###print("\nDEBUGGING x0 == " + str(x0))
+		###print("DEBUGGING x1 == " + str(x1))
+		###print("DEBUGGING x2 == " + str(x2))		
+		
+		###print("\nDEBUGGING y0 == " + str(y0))
+		###print("DEBUGGING y1 == " + str(y1))
+		###print("DEBUGGING y2 == " + str(y2))				
+	
+		###print("\nDEBUGGING (x2 * x2) == " + str((x2 * x2)))
+		###print("DEBUGGING (y2 * y2) == " + str((y2 * y2)))
+		###print("DEBUGGING ((x2 * x2) - (y2 * y2)) == " + str((x2 * x2) - (y2 * y2)))
+		###print("DEBUGGING (0.5 - ((x2 * x2) - (y2 * y2))) == " + str((0.5 - ((x2 * x2) - (y2 * y2)))))
+	
+		## Apparently some clown thought it would be funny to allow order of operations to work all screwy in Java, or maybe someone sabatoged the code I was looking at.
+		## I really couldn't guess why, but this was the original code, written in Java:
+		## double t2 = 0.5 - x2*x2-y2*y2;
+		## There were no parentheses anywhere there.
+		
+		t2 = 0.5 - x2*x2 - y2*y2
+			
+			
+		###print("DEBUGGING t0 == " + str(t0))	
+		###print("DEBUGGING t1 == " + str(t1))	
+		###print("DEBUGGING t2 == " + str(t2))	
+			
+		
+		## I think I understand it now! the t's are ticking down like octaves in the perlin generator, or something?
+		## hrm it's multiplying, not dividing, so it couldn't get below zero that way unless it already was negative. ><
+		## Nevermind. Still don't understand it yet.
+		
+		if t2 < 0:
+			n2 = 0.0
+		else:
+			t2 *= t2
+			n2 = t2 * t2 * ( (gradient_x_table[gradient_i_two] * x2) + (gradient_y_table[gradient_i_two] * y2) )
+	
+			
+			
+		## "Add contributions from each corner to get the final noise value."
+		## "The result is scaled to return values in the interval [-1, 1]."
+		
+		###print("\nDEBUGGING n0 == " + str(n0))
+		###print("\nDEBUGGING n1 == " + str(n1))
+		###print("\nDEBUGGING n2 == " + str(n2))		
+		####print("\nDEBUGGING return " + str(70.0 * (n0 + n1 + n2)))
+		
+		#return 70.0 * (n0 + n1 + n2)
+		
+
+		number_to_return = ( 70.0 * (n0 + n1 + n2) )
+		
+		## My program would work better with a result scaled to 0-255. Therefore...		
+		number_to_return += 1
+		number_to_return *= 128.0
+		## blah, getting NoneTypes after the octaves were added. Hrm...
+		
+		## debug:
+		###print("\n number_to_return == " + str(number_to_return))
+		
+		return number_to_return
+
+	
+	
+	
+	
+	def get_lookup_table_arrays(self):
+		
+		''' Return a dictionary of the permutations table and the gradient component tables as NumPy integer arrays, keyed by attribute name, building them the first time they're asked for after each reshuffle. '''
+		
+		## The table builders reset this to None, so stale arrays can never outlive the tables they were copied from.
+		if self.lookup_table_arrays is None:
+			self.lookup_table_arrays = dict((each_name, numpy.array(getattr(self, each_name), dtype=numpy.int64)) for each_name in self.PERMUTATION_STATE_NAMES[1:])
+			
+		return self.lookup_table_arrays
+	
+	
+	
+	
+	def generate_octaved_noise_array(self, supplied_x_array, supplied_y_array, scale, octaves, persistence):
+		
+		''' Array version of generate_octaved_noise(). The coordinate arrays are broadcast against each other, and each octave is one call to generate_raw_unoctaved_noise_array() over the whole grid. '''
+		
+		return self.accumulate_octaves_array(self.generate_raw_unoctaved_noise_array, (supplied_x_array, supplied_y_array), scale, octaves, persistence)
+
+
+
+
+	def accumulate_octaves_array(self, raw_noise_array_function, coordinate_arrays, scale, octaves, persistence):
+
+		''' Sum octaves of raw_noise_array_function over the (broadcast) coordinate arrays, the same way generate_octaved_noise() does for one cell. Shared by the 2D, 3D and 4D array evaluators. '''
+
+		## Requires NumPy. See the import section at the top of the module.
+		if numpy is None:
+			raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+
+		## Same octave schedule and accumulation order as generate_octaved_noise(), so the results match the scalar path bit for bit.
+		## Each octave is a single pass of raw_noise_array_function over every point at once.
+		frequencies_and_amplitudes, max_amplitude = self.generate_octave_schedule(scale, octaves, persistence)
+		
+		total_noise = numpy.zeros(numpy.broadcast(*coordinate_arrays).shape, dtype=numpy.float64)
+		
+		for frequency, amplitude in frequencies_and_amplitudes:
+			
+			total_noise += ( raw_noise_array_function(*[(each_coordinate_array * frequency) for each_coordinate_array in coordinate_arrays]) * amplitude )
+			
+		total_noise /= max_amplitude
+		
+		return total_noise
+
+
+
+
+	def generate_raw_unoctaved_noise_array(self, supplied_x_array, supplied_y_array, return_derivatives=False):
+		
+		''' Array version of generate_raw_unoctaved_noise(). Does the skew, the simplex corner selection, the gradient hashing and the three corner contributions for every point of the (broadcast) coordinate arrays at once. With return_derivatives=True it returns (values, x derivatives, y derivatives) instead, like generate_raw_unoctaved_noise_with_derivatives(). '''
+		
+		## Every line here mirrors a line in generate_raw_unoctaved_noise(), in the same order of operations.
+		## That's deliberate: floating point isn't associative, and the two paths are supposed to agree exactly.
+		
+		lookup_tables = self.get_lookup_table_arrays()
+		permutations_table = lookup_tables['permutations_table']
+		gradient_x_table = lookup_tables['gradient_x_table']
+		gradient_y_table = lookup_tables['gradient_y_table']
+		
+		
+		## "Skew the input space to determine which simplex cell we're in"
+		s = (supplied_x_array + supplied_y_array) * self.F2
+		
+		## numpy.floor() is the array version of the scalar path's fastfloor.
+		i = numpy.floor(supplied_x_array + s)
+		j = numpy.floor(supplied_y_array + s)
+		
+		t = ((i + j) * self.G2)
+		
+		## "The x,y distances from the cell origin"
+		x0 = (supplied_x_array - (i - t))
+		y0 = (supplied_y_array - (j - t))
+		
+		
+		## "Determine which simplex we are in." Lower triangle where x0 > y0, upper triangle everywhere else.
+		i1 = numpy.where((x0 > y0), 1, 0)
+		j1 = (1 - i1)
+		
+		x1 = (x0 - i1 + self.G2)
+		y1 = (y0 - j1 + self.G2)
+		
+		x2 = x0 - 1.0 + self.G2_doubled
+		y2 = y0 - 1.0 + self.G2_doubled
+		
+		
+		## "Work out the hashed gradient indices of the three simplex corners"
+		ii = (i.astype(numpy.int64) & self.hash_number)
+		jj = (j.astype(numpy.int64) & self.hash_number)
+		
+		gradient_i_zero = ii +      permutations_table[jj     ]
+		gradient_i_one  = ii + i1 + permutations_table[jj + j1]
+		gradient_i_two  = ii +  1 + permutations_table[jj +  1]
+		
+		
+		## "Calculate the contribution from the three corners"
+		## Corners with a negative t contribute exactly 0.0, same as the scalar path's if/else.
+		t0 = 0.5 - x0*x0 - y0*y0
+		t0_squared = t0 * t0
+		n0 = numpy.where((t0 < 0), 0.0, (t0_squared * t0_squared * ( (gradient_x_table[gradient_i_zero] * x0) + (gradient_y_table[gradient_i_zero] * y0) )))
+		
+		t1 = 0.5 - x1*x1 - y1*y1
+		t1_squared = t1 * t1
+		n1 = numpy.where((t1 < 0), 0.0, (t1_squared * t1_squared * ( (gradient_x_table[gradient_i_one] * x1) + (gradient_y_table[gradient_i_one] * y1) )))
+		
+		t2 = 0.5 - x2*x2 - y2*y2
+		t2_squared = t2 * t2
+		n2 = numpy.where((t2 < 0), 0.0, (t2_squared * t2_squared * ( (gradient_x_table[gradient_i_two] * x2) + (gradient_y_table[gradient_i_two] * y2) )))
+		
+		
+		## Same 0-255 rescaling as the scalar path.
+		number_to_return = ( 70.0 * (n0 + n1 + n2) )
+		number_to_return += 1
+		number_to_return *= 128.0
+		
+		if not return_derivatives:
+			return number_to_return
+		
+		
+		## The analytic derivatives come from the same corner terms; see generate_raw_unoctaved_noise_with_derivatives() for the working.
+		x_derivative = 0.0
+		y_derivative = 0.0
+		
+		for corner_t, corner_x, corner_y, gradient_index in ( (t0, x0, y0, gradient_i_zero), (t1, x1, y1, gradient_i_one), (t2, x2, y2, gradient_i_two) ):
+			
+			gradient_x = gradient_x_table[gradient_index]
+			gradient_y = gradient_y_table[gradient_index]
+			
+			corner_t_squared = corner_t * corner_t
+			corner_falloff = corner_t_squared * corner_t_squared
+			corner_slope = ( -8.0 * corner_t_squared * corner_t * ( (gradient_x * corner_x) + (gradient_y * corner_y) ) )
+			
+			x_derivative = x_derivative + numpy.where((corner_t < 0), 0.0, ( (corner_slope * corner_x) + (corner_falloff * gradient_x) ))
+			y_derivative = y_derivative + numpy.where((corner_t < 0), 0.0, ( (corner_slope * corner_y) + (corner_falloff * gradient_y) ))
+		
+		x_derivative *= self.DERIVATIVE_RESCALE
+		y_derivative *= self.DERIVATIVE_RESCALE
+		
+		return (number_to_return, x_derivative, y_derivative)
+	
+	
+	
+	
+	def generate_noise_with_derivatives(self, supplied_x, supplied_y, scale, octaves, persistence, randseed=None, use_numpy=False, reshuffle=True, origin_x=0, origin_y=0):
+		
+		''' Like generate_noise(), but returns three maps: (values, x derivatives, y derivatives). The values are exactly what generate_noise() returns; the derivatives are the analytic slope of those values per map cell, in each direction, worked out from the same corner contributions instead of by finite differences. '''
+		
+		## Slope, hillshade and normal maps can be built straight from the two derivative maps, with no extra samples and no second pass.
+		
+		## Requires NumPy. Checked before anything is reshuffled.
+		if use_numpy and (numpy is None):
+			raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+		
+		if reshuffle or ((randseed is not None) and (randseed != self.random_number_seed)):
+			self.randomize_the_noise_array_seed(random_number_seed=randseed)
+		
+		if use_numpy:
+			
+			x_coordinates = (numpy.arange(supplied_x, dtype=numpy.float64).reshape(1, supplied_x) + origin_x)
+			y_coordinates = (numpy.arange(supplied_y, dtype=numpy.float64).reshape(supplied_y, 1) + origin_y)
+			
+			return self.generate_octaved_noise_with_derivatives_array(x_coordinates, y_coordinates, scale, octaves, persistence)
+		
+		generate_octaved_noise_with_derivatives = self.generate_octaved_noise_with_derivatives
+		octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+		
+		value_map = []
+		x_derivative_map = []
+		y_derivative_map = []
+		
+		for each_y in range(0, supplied_y):
+			
+			value_row = []
+			x_derivative_row = []
+			y_derivative_row = []
+			
+			for each_x in range(0, supplied_x):
+				
+				new_z_value, new_x_derivative, new_y_derivative = generate_octaved_noise_with_derivatives((origin_x + each_x), (origin_y + each_y), scale, octaves, persistence, octave_schedule)
+				
+				value_row.append(new_z_value)
+				x_derivative_row.append(new_x_derivative)
+				y_derivative_row.append(new_y_derivative)
+				
+			value_map.append(value_row)
+			x_derivative_map.append(x_derivative_row)
+			y_derivative_map.append(y_derivative_row)
+			
+		return (value_map, x_derivative_map, y_derivative_map)
+	
+	
+	
+	
+	def generate_octaved_noise_with_derivatives(self, supplied_x, supplied_y, scale, octaves, persistence, octave_schedule=None):
+		
+		''' generate_octaved_noise() plus its partial derivatives with respect to supplied_x and supplied_y, returned as (value, x derivative, y derivative). '''
+		
+		if octave_schedule is None:
+			octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+		
+		frequencies_and_amplitudes, max_amplitude = octave_schedule
+		
+		total_noise_for_this_cell = 0.0
+		total_x_derivative = 0.0
+		total_y_derivative = 0.0
+		
+		generate_raw_unoctaved_noise_with_derivatives = self.generate_raw_unoctaved_noise_with_derivatives
+		
+		for frequency, amplitude in frequencies_and_amplitudes:
+			
+			raw_value, raw_x_derivative, raw_y_derivative = generate_raw_unoctaved_noise_with_derivatives((supplied_x * frequency), (supplied_y * frequency))
+			
+			total_noise_for_this_cell += ( raw_value * amplitude )
+			
+			## Chain rule: each octave samples at (x * frequency), so its slope per map cell is frequency times its raw slope.
+			total_x_derivative += ( raw_x_derivative * frequency * amplitude )
+			total_y_derivative += ( raw_y_derivative * frequency * amplitude )
+			
+		return ( (total_noise_for_this_cell / max_amplitude), (total_x_derivative / max_amplitude), (total_y_derivative / max_amplitude) )
+	
+	
+	
+	
+	def generate_octaved_noise_with_derivatives_array(self, supplied_x_array, supplied_y_array, scale, octaves, persistence):
+		
+		''' Array version of generate_octaved_noise_with_derivatives(). Returns (values, x derivatives, y derivatives) arrays. '''
+		
+		if numpy is None:
+			raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+		
+		frequencies_and_amplitudes, max_amplitude = self.generate_octave_schedule(scale, octaves, persistence)
+		
+		grid_shape = numpy.broadcast(supplied_x_array, supplied_y_array).shape
+		
+		total_noise = numpy.zeros(grid_shape, dtype=numpy.float64)
+		total_x_derivative = numpy.zeros(grid_shape, dtype=numpy.float64)
+		total_y_derivative = numpy.zeros(grid_shape, dtype=numpy.float64)
+		
+		for frequency, amplitude in frequencies_and_amplitudes:
+			
+			raw_value, raw_x_derivative, raw_y_derivative = self.generate_raw_unoctaved_noise_array((supplied_x_array * frequency), (supplied_y_array * frequency), return_derivatives=True)
+			
+			total_noise += ( raw_value * amplitude )
+			total_x_derivative += ( raw_x_derivative * frequency * amplitude )
+			total_y_derivative += ( raw_y_derivative * frequency * amplitude )
+			
+		total_noise /= max_amplitude
+		total_x_derivative /= max_amplitude
+		total_y_derivative /= max_amplitude
+		
+		return (total_noise, total_x_derivative, total_y_derivative)
+	
+	
+	
+	
+	def generate_raw_unoctaved_noise_with_derivatives(self, supplied_x, supplied_y):
+		
+		''' generate_raw_unoctaved_noise() plus its analytic partial derivatives, returned as (value, x derivative, y derivative). The value is identical to generate_raw_unoctaved_noise()'s. '''
+		
+		## Same skew, simplex and hashing steps as generate_raw_unoctaved_noise(); see the comments there.
+		F2 = self.F2
+		G2 = self.G2
+		G2_doubled = self.G2_doubled
+		floor = math.floor
+		
+		s = (supplied_x + supplied_y) * F2
+		
+		i = floor(supplied_x + s)
+		j = floor(supplied_y + s)
+		
+		t = ((i + j) * G2)
+		
+		x0 = (supplied_x - (i - t))
+		y0 = (supplied_y - (j - t))
+		
+		if x0 > y0:
+			i1 = 1
+			j1 = 0
+		else:
+			i1 = 0
+			j1 = 1
+		
+		x1 = (x0 - i1 + G2)
+		y1 = (y0 - j1 + G2)
+		
+		x2 = x0 - 1.0 + G2_doubled
+		y2 = y0 - 1.0 + G2_doubled
+		
+		hash_number = self.hash_number
+		ii = i & hash_number
+		jj = j & hash_number
+		
+		permutations_table = self.permutations_table
+		gradient_x_table = self.gradient_x_table
+		gradient_y_table = self.gradient_y_table
+		
+		
+		## Each corner contributes n = t^4 * (g . d), where t = 0.5 - dx^2 - dy^2 and d = (dx, dy) is the offset to that corner.
+		## Differentiating: dn/dx = 4t^3 * (-2 dx) * (g . d) + t^4 * gx, and the same for y.
+		## So the derivatives fall out of the t and (g . d) values the noise value needs anyway.
+		total_noise = 0.0
+		x_derivative = 0.0
+		y_derivative = 0.0
+		
+		for corner_x, corner_y, gradient_index in ( (x0, y0, (ii + permutations_table[jj])), (x1, y1, (ii + i1 + permutations_table[jj + j1])), (x2, y2, (ii + 1 + permutations_table[jj + 1])) ):
+			
+			corner_t = 0.5 - corner_x*corner_x - corner_y*corner_y
+			
+			if corner_t >= 0:
+				
+				gradient_x = gradient_x_table[gradient_index]
+				gradient_y = gradient_y_table[gradient_index]
+				
+				gradient_dot_product = ( (gradient_x * corner_x) + (gradient_y * corner_y) )
+				
+				corner_t_squared = corner_t * corner_t
+				corner_falloff = corner_t_squared * corner_t_squared
+				corner_slope = ( -8.0 * corner_t_squared * corner_t * gradient_dot_product )
+				
+				total_noise += corner_falloff * gradient_dot_product
+				x_derivative += ( (corner_slope * corner_x) + (corner_falloff * gradient_x) )
+				y_derivative += ( (corner_slope * corner_y) + (corner_falloff * gradient_y) )
+		
+		
+		## The value gets the usual 0-255 rescaling; the derivatives only pick up the multipliers, since the + 1 is a constant.
+		number_to_return = ( 70.0 * total_noise )
+		number_to_return += 1
+		number_to_return *= 128.0
+		
+		return (number_to_return, (x_derivative * self.DERIVATIVE_RESCALE), (y_derivative * self.DERIVATIVE_RESCALE))
+	
+	
+	
+	
+	def generate_domain_warped_noise(self, supplied_x, supplied_y, scale, octaves, persistence, warp_strength=40.0, warp_scale=None, warp_octaves=2, warp_persistence=None, randseed=None, use_numpy=False, reshuffle=True, origin_x=0, origin_y=0):
+		
+		''' Like generate_noise(), but every cell's coordinates are first pushed around by two more noise fields (one for x, one for y) before the final field is sampled. This gives the twisty, eroded look that plain fractal noise doesn't have, e.g. for coastlines. warp_strength is the furthest a cell can be pushed, in map cells. warp_scale and warp_persistence default to scale and persistence. '''
+		
+		## All three fields come from the same permutations table; WARP_FIELD_OFFSETS just samples the two warp fields from far-off, unrelated parts of it.
+		## Each field is evaluated over the whole grid in one go, so the warped map costs about (2 * warp_octaves + octaves) / octaves times a plain one.
+		
+		## Requires NumPy. Checked before anything is reshuffled.
+		if use_numpy and (numpy is None):
+			raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+		
+		if reshuffle or ((randseed is not None) and (randseed != self.random_number_seed)):
+			self.randomize_the_noise_array_seed(random_number_seed=randseed)
+		
+		if warp_scale is None:
+			warp_scale = scale
+		
+		if warp_persistence is None:
+			warp_persistence = persistence
+		
+		(x_warp_offset_x, x_warp_offset_y), (y_warp_offset_x, y_warp_offset_y) = self.WARP_FIELD_OFFSETS
+		
+		## The raw noise is centred on 128, so (value / 128.0) - 1.0 is a displacement between -1 and 1.
+		if use_numpy:
+			
+			x_coordinates = (numpy.arange(supplied_x, dtype=numpy.float64).reshape(1, supplied_x) + origin_x)
+			y_coordinates = (numpy.arange(supplied_y, dtype=numpy.float64).reshape(supplied_y, 1) + origin_y)
+			
+			x_warp_field = self.generate_octaved_noise_array((x_coordinates + x_warp_offset_x), (y_coordinates + x_warp_offset_y), warp_scale, warp_octaves, warp_persistence)
+			y_warp_field = self.generate_octaved_noise_array((x_coordinates + y_warp_offset_x), (y_coordinates + y_warp_offset_y), warp_scale, warp_octaves, warp_persistence)
+			
+			warped_x_coordinates = x_coordinates + ( warp_strength * ((x_warp_field / 128.0) - 1.0) )
+			warped_y_coordinates = y_coordinates + ( warp_strength * ((y_warp_field / 128.0) - 1.0) )
+			
+			return self.generate_octaved_noise_array(warped_x_coordinates, warped_y_coordinates, scale, octaves, persistence)
+		
+		generate_octaved_noise = self.generate_octaved_noise
+		
+		## One schedule per field, worked out once for the whole map.
+		octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+		warp_octave_schedule = self.generate_octave_schedule(warp_scale, warp_octaves, warp_persistence)
+		
+		noise_map = []
+		
+		for each_y in range(0, supplied_y):
+			
+			y_coordinate = (origin_y + each_y)
+			
+			new_row = []
+			
+			for each_x in range(0, supplied_x):
+				
+				x_coordinate = (origin_x + each_x)
+				
+				x_warp_value = generate_octaved_noise((x_coordinate + x_warp_offset_x), (y_coordinate + x_warp_offset_y), warp_scale, warp_octaves, warp_persistence, warp_octave_schedule)
+				y_warp_value = generate_octaved_noise((x_coordinate + y_warp_offset_x), (y_coordinate + y_warp_offset_y), warp_scale, warp_octaves, warp_persistence, warp_octave_schedule)
+				
+				warped_x_coordinate = x_coordinate + ( warp_strength * ((x_warp_value / 128.0) - 1.0) )
+				warped_y_coordinate = y_coordinate + ( warp_strength * ((y_warp_value / 128.0) - 1.0) )
+				
+				new_row.append(generate_octaved_noise(warped_x_coordinate, warped_y_coordinate, scale, octaves, persistence, octave_schedule))
+				
+			noise_map.append(new_row)
+			
+		return noise_map
+	
+	
+	
+	
+	## 3D and 4D simplex noise.
+	## The third coordinate is usually time, which turns an animation into slices of one continuous field instead of a brand new map every frame.
+	## The fourth lets time run around a circle, so the animation loops without a seam.
+	## Same structure as the 2D evaluator above: skew, find the simplex, hash the corners, add up the corner contributions, rescale to 0-255.
+
+
+	def generate_time_slice(self, supplied_x, supplied_y, time, scale, octaves, persistence, use_numpy=False, origin_x=0, origin_y=0):
+
+		''' Return a supplied_x by supplied_y map (array[y][x] == z) cut from the 3D noise field at the given time, using the current permutations table. Consecutive times give smoothly changing frames. '''
+
+		## Requires NumPy.
+		if use_numpy and (numpy is None):
+			raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+
+		if use_numpy:
+
+			x_coordinates = (numpy.arange(supplied_x, dtype=numpy.float64).reshape(1, supplied_x) + origin_x)
+			y_coordinates = (numpy.arange(supplied_y, dtype=numpy.float64).reshape(supplied_y, 1) + origin_y)
+
+			return self.generate_octaved_noise_3d_array(x_coordinates, y_coordinates, time, scale, octaves, persistence)
+
+		generate_octaved_noise_3d = self.generate_octaved_noise_3d
+		octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+
+		return [[generate_octaved_noise_3d((origin_x + each_x), (origin_y + each_y), time, scale, octaves, persistence, octave_schedule) for each_x in range(0, supplied_x)] for each_y in range(0, supplied_y)]
+
+
+
+
+	def generate_looping_time_slice(self, supplied_x, supplied_y, frame, frame_count, loop_radius, scale, octaves, persistence, use_numpy=False, origin_x=0, origin_y=0):
+
+		''' Return frame number [frame] of a [frame_count]-frame animation that loops seamlessly. Time runs around a circle of radius loop_radius in the third and fourth dimensions of the 4D noise field, so the last frame flows straight back into the first. '''
+
+		## Requires NumPy.
+		if use_numpy and (numpy is None):
+			raise ImportError("SimplexNoiseGenerator's array backend requires NumPy.")
+
+		## A bigger loop_radius means more change between frames, much like scale does for x and y.
+		## frame is wrapped first so frame_count (and any multiple of it) lands exactly back on frame 0.
+		angle = ( (2.0 * math.pi * (frame % frame_count)) / frame_count )
+
+		supplied_z = ( loop_radius * math.cos(angle) )
+		supplied_w = ( loop_radius * math.sin(angle) )
+
+		if use_numpy:
+
+			x_coordinates = (numpy.arange(supplied_x, dtype=numpy.float64).reshape(1, supplied_x) + origin_x)
+			y_coordinates = (numpy.arange(supplied_y, dtype=numpy.float64).reshape(supplied_y, 1) + origin_y)
+
+			return self.generate_octaved_noise_4d_array(x_coordinates, y_coordinates, supplied_z, supplied_w, scale, octaves, persistence)
+
+		generate_octaved_noise_4d = self.generate_octaved_noise_4d
+		octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+
+		return [[generate_octaved_noise_4d((origin_x + each_x), (origin_y + each_y), supplied_z, supplied_w, scale, octaves, persistence, octave_schedule) for each_x in range(0, supplied_x)] for each_y in range(0, supplied_y)]
+
+
+
+
+	def generate_octaved_noise_3d(self, supplied_x, supplied_y, supplied_z, scale, octaves, persistence, octave_schedule=None):
+
+		''' 3D version of generate_octaved_noise(). '''
+
+		if octave_schedule is None:
+			octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+
+		frequencies_and_amplitudes, max_amplitude = octave_schedule
+
+		total_noise_for_this_cell = 0.0
+
+		generate_raw_unoctaved_noise_3d = self.generate_raw_unoctaved_noise_3d
+
+		for frequency, amplitude in frequencies_and_amplitudes:
+
+			total_noise_for_this_cell += ( generate_raw_unoctaved_noise_3d((supplied_x * frequency), (supplied_y * frequency), (supplied_z * frequency)) * amplitude )
+
+		return (total_noise_for_this_cell / max_amplitude)
+
+
+
+
+	def generate_octaved_noise_4d(self, supplied_x, supplied_y, supplied_z, supplied_w, scale, octaves, persistence, octave_schedule=None):
+
+		''' 4D version of generate_octaved_noise(). '''
+
+		if octave_schedule is None:
+			octave_schedule = self.generate_octave_schedule(scale, octaves, persistence)
+
+		frequencies_and_amplitudes, max_amplitude = octave_schedule
+
+		total_noise_for_this_cell = 0.0
+
+		generate_raw_unoctaved_noise_4d = self.generate_raw_unoctaved_noise_4d
+
+		for frequency, amplitude in frequencies_and_amplitudes:
+
+			total_noise_for_this_cell += ( generate_raw_unoctaved_noise_4d((supplied_x * frequency), (supplied_y * frequency), (supplied_z * frequency), (supplied_w * frequency)) * amplitude )
+
+		return (total_noise_for_this_cell / max_amplitude)
+
+
+
+
+	def generate_octaved_noise_3d_array(self, supplied_x_array, supplied_y_array, supplied_z_array, scale, octaves, persistence):
+
+		''' Array version of generate_octaved_noise_3d(). Any of the coordinates may be a plain number, such as a single time value for a whole frame. '''
+
+		return self.accumulate_octaves_array(self.generate_raw_unoctaved_noise_3d_array, (supplied_x_array, supplied_y_array, supplied_z_array), scale, octaves, persistence)
+
+
+
+
+	def generate_octaved_noise_4d_array(self, supplied_x_array, supplied_y_array, supplied_z_array, supplied_w_array, scale, octaves, persistence):
+
+		''' Array version of generate_octaved_noise_4d(). Any of the coordinates may be a plain number. '''
+
+		return self.accumulate_octaves_array(self.generate_raw_unoctaved_noise_4d_array, (supplied_x_array, supplied_y_array, supplied_z_array, supplied_w_array), scale, octaves, persistence)
+
+
+
+
+	def generate_raw_unoctaved_noise_3d(self, supplied_x, supplied_y, supplied_z):
+
+		''' Return one sample of single-octave 3D simplex noise, rescaled to 0-255 like generate_raw_unoctaved_noise(). '''
+
+		G3 = self.G3
+		G3_doubled = self.G3_doubled
+		G3_tripled = self.G3_tripled
+		floor = math.floor
+
+
+		## "Skew the input space to determine which simplex cell we're in"
+		s = (supplied_x + supplied_y + supplied_z) * self.F3
+
+		i = floor(supplied_x + s)
+		j = floor(supplied_y + s)
+		k = floor(supplied_z + s)
+
+		t = ((i + j + k) * G3)
+
+		## "The x,y,z distances from the cell origin"
+		x0 = (supplied_x - (i - t))
+		y0 = (supplied_y - (j - t))
+		z0 = (supplied_z - (k - t))
+
+
+		## "For the 3D case, the simplex shape is a slightly irregular tetrahedron."
+		## The order of x0, y0 and z0 says which of the six tetrahedra in the cube we're in.
+		## (i1, j1, k1) and (i2, j2, k2) are the offsets of its second and third corners.
+		if x0 >= y0:
+			if y0 >= z0:
+				i1, j1, k1, i2, j2, k2 = 1, 0, 0, 1, 1, 0	# X Y Z order
+			elif x0 >= z0:
+				i1, j1, k1, i2, j2, k2 = 1, 0, 0, 1, 0, 1	# X Z Y order
+			else:
+				i1, j1, k1, i2, j2, k2 = 0, 0, 1, 1, 0, 1	# Z X Y order
+		else:
+			if y0 < z0:
+				i1, j1, k1, i2, j2, k2 = 0, 0, 1, 0, 1, 1	# Z Y X order
+			elif x0 < z0:
+				i1, j1, k1, i2, j2, k2 = 0, 1, 0, 0, 1, 1	# Y Z X order
+			else:
+				i1, j1, k1, i2, j2, k2 = 0, 1, 0, 1, 1, 0	# Y X Z order
+
+
+		## Offsets of the other three corners in unskewed coords.
+		x1 = (x0 - i1 + G3)
+		y1 = (y0 - j1 + G3)
+		z1 = (z0 - k1 + G3)
+
+		x2 = (x0 - i2 + G3_doubled)
+		y2 = (y0 - j2 + G3_doubled)
+		z2 = (z0 - k2 + G3_doubled)
+
+		x3 = (x0 - 1.0 + G3_tripled)
+		y3 = (y0 - 1.0 + G3_tripled)
+		z3 = (z0 - 1.0 + G3_tripled)
+
+
+		## "Work out the hashed gradient indices of the four simplex corners", straight into the precomputed gradient tables.
+		hash_number = self.hash_number
+		ii = i & hash_number
+		jj = j & hash_number
+		kk = k & hash_number
+
+		permutations_table = self.permutations_table
+		gradient_x_table = self.gradient_x_table
+		gradient_y_table = self.gradient_y_table
+		gradient_z_table = self.gradient_z_table
+
+
+		## "Calculate the contribution from the four corners"
+		## Same falloff as 2D but with a 0.6 radius, which is what the 3D reference implementation uses.
+		t0 = 0.6 - x0*x0 - y0*y0 - z0*z0
+		if t0 < 0:
+			n0 = 0.0
+		else:
+			gradient_i_zero = ii + permutations_table[jj + permutations_table[kk]]
+			t0 *= t0
+			n0 = t0 * t0 * ( (gradient_x_table[gradient_i_zero] * x0) + (gradient_y_table[gradient_i_zero] * y0) + (gradient_z_table[gradient_i_zero] * z0) )
+
+		t1 = 0.6 - x1*x1 - y1*y1 - z1*z1
+		if t1 < 0:
+			n1 = 0.0
+		else:
+			gradient_i_one = ii + i1 + permutations_table[jj + j1 + permutations_table[kk + k1]]
+			t1 *= t1
+			n1 = t1 * t1 * ( (gradient_x_table[gradient_i_one] * x1) + (gradient_y_table[gradient_i_one] * y1) + (gradient_z_table[gradient_i_one] * z1) )
+
+		t2 = 0.6 - x2*x2 - y2*y2 - z2*z2
+		if t2 < 0:
+			n2 = 0.0
+		else:
+			gradient_i_two = ii + i2 + permutations_table[jj + j2 + permutations_table[kk + k2]]
+			t2 *= t2
+			n2 = t2 * t2 * ( (gradient_x_table[gradient_i_two] * x2) + (gradient_y_table[gradient_i_two] * y2) + (gradient_z_table[gradient_i_two] * z2) )
+
+		t3 = 0.6 - x3*x3 - y3*y3 - z3*z3
+		if t3 < 0:
+			n3 = 0.0
+		else:
+			gradient_i_three = ii + 1 + permutations_table[jj + 1 + permutations_table[kk + 1]]
+			t3 *= t3
+			n3 = t3 * t3 * ( (gradient_x_table[gradient_i_three] * x3) + (gradient_y_table[gradient_i_three] * y3) + (gradient_z_table[gradient_i_three] * z3) )
+
+
+		## "The result is scaled to stay just inside [-1,1]" with 32.0 in 3D, then moved to 0-255 like the 2D evaluator.
+		number_to_return = ( 32.0 * (n0 + n1 + n2 + n3) )
+		number_to_return += 1
+		number_to_return *= 128.0
+
+		return number_to_return
+
+
+
+
+	def generate_raw_unoctaved_noise_4d(self, supplied_x, supplied_y, supplied_z, supplied_w):
+
+		''' Return one sample of single-octave 4D simplex noise, rescaled to 0-255 like generate_raw_unoctaved_noise(). '''
+
+		G4 = self.G4
+		G4_doubled = self.G4_doubled
+		G4_tripled = self.G4_tripled
+		G4_quadrupled = self.G4_quadrupled
+		floor = math.floor
+
+
+		## "Skew the (x,y,z,w) space to determine which cell of 24 simplices we're in"
+		s = (supplied_x + supplied_y + supplied_z + supplied_w) * self.F4
+
+		i = floor(supplied_x + s)
+		j = floor(supplied_y + s)
+		k = floor(supplied_z + s)
+		l = floor(supplied_w + s)
+
+		t = ((i + j + k + l) * G4)
+
+		x0 = (supplied_x - (i - t))
+		y0 = (supplied_y - (j - t))
+		z0 = (supplied_z - (k - t))
+		w0 = (supplied_w - (l - t))
+
+
+		## Too many simplices to write out an if tree like the 3D case, so rank the four distances instead.
+		## Each coordinate's rank is how many of the others it's bigger than; the corners are stepped through from the biggest rank down.
+		rank_x = 0
+		rank_y = 0
+		rank_z = 0
+		rank_w = 0
+
+		if x0 > y0:
+			rank_x += 1
+		else:
+			rank_y += 1
+		if x0 > z0:
+			rank_x += 1
+		else:
+			rank_z += 1
+		if x0 > w0:
+			rank_x += 1
+		else:
+			rank_w += 1
+		if y0 > z0:
+			rank_y += 1
+		else:
+			rank_z += 1
+		if y0 > w0:
+			rank_y += 1
+		else:
+			rank_w += 1
+		if z0 > w0:
+			rank_z += 1
+		else:
+			rank_w += 1
+
+
+		hash_number = self.hash_number
+		ii = i & hash_number
+		jj = j & hash_number
+		kk = k & hash_number
+		ll = l & hash_number
+
+		permutations_table = self.permutations_table
+		gradient4_x_table = self.gradient4_x_table
+		gradient4_y_table = self.gradient4_y_table
+		gradient4_z_table = self.gradient4_z_table
+		gradient4_w_table = self.gradient4_w_table
+
+
+		## Corner number n is offset by 1 along every axis whose rank is at least (4 - n): corner 0 has no offsets and corner 4 has all four.
+		## Each corner contributes the 0.6-radius falloff times the dot product with its grad4 gradient.
+		total_noise = 0.0
+
+		for rank_needed, corner_unskew in ( (4, 0.0), (3, G4), (2, G4_doubled), (1, G4_tripled), (0, G4_quadrupled) ):
+
+			offset_i = 1 if (rank_x >= rank_needed) else 0
+			offset_j = 1 if (rank_y >= rank_needed) else 0
+			offset_k = 1 if (rank_z >= rank_needed) else 0
+			offset_l = 1 if (rank_w >= rank_needed) else 0
+
+			corner_x = (x0 - offset_i + corner_unskew)
+			corner_y = (y0 - offset_j + corner_unskew)
+			corner_z = (z0 - offset_k + corner_unskew)
+			corner_w = (w0 - offset_l + corner_unskew)
+
+			corner_t = 0.6 - corner_x*corner_x - corner_y*corner_y - corner_z*corner_z - corner_w*corner_w
+
+			if corner_t >= 0:
+
+				gradient_index = ii + offset_i + permutations_table[jj + offset_j + permutations_table[kk + offset_k + permutations_table[ll + offset_l]]]
+
+				corner_t *= corner_t
+				total_noise += corner_t * corner_t * ( (gradient4_x_table[gradient_index] * corner_x) + (gradient4_y_table[gradient_index] * corner_y) + (gradient4_z_table[gradient_index] * corner_z) + (gradient4_w_table[gradient_index] * corner_w) )
+
+
+		## 27.0 keeps the 4D result inside [-1, 1], then it's moved to 0-255 like the others.
+		number_to_return = ( 27.0 * total_noise )
+		number_to_return += 1
+		number_to_return *= 128.0
+
+		return number_to_return
+
+
+
+
+	def generate_raw_unoctaved_noise_3d_array(self, supplied_x_array, supplied_y_array, supplied_z_array):
+
+		''' Array version of generate_raw_unoctaved_noise_3d(). '''
+
+		lookup_tables = self.get_lookup_table_arrays()
+		permutations_table = lookup_tables['permutations_table']
+		gradient_x_table = lookup_tables['gradient_x_table']
+		gradient_y_table = lookup_tables['gradient_y_table']
+		gradient_z_table = lookup_tables['gradient_z_table']
+
+
+		s = (supplied_x_array + supplied_y_array + supplied_z_array) * self.F3
+
+		i = numpy.floor(supplied_x_array + s)
+		j = numpy.floor(supplied_y_array + s)
+		k = numpy.floor(supplied_z_array + s)
+
+		t = ((i + j + k) * self.G3)
+
+		x0 = (supplied_x_array - (i - t))
+		y0 = (supplied_y_array - (j - t))
+		z0 = (supplied_z_array - (k - t))
+
+
+		## The scalar path's six-way if tree, one condition per tetrahedron.
+		x_at_least_y = (x0 >= y0)
+		y_at_least_z = (y0 >= z0)
+		x_at_least_z = (x0 >= z0)
+
+		tetrahedron_conditions = [	(x_at_least_y & y_at_least_z),
+									(x_at_least_y & ~y_at_least_z & x_at_least_z),
+									(x_at_least_y & ~y_at_least_z & ~x_at_least_z),
+									(~x_at_least_y & (y0 < z0)),
+									(~x_at_least_y & ~(y0 < z0) & (x0 < z0))	]
+
+		## (i1, j1, k1, i2, j2, k2) for each condition above, then the leftover case (Y X Z order).
+		tetrahedron_offsets = [	(1, 0, 0, 1, 1, 0),
+								(1, 0, 0, 1, 0, 1),
+								(0, 0, 1, 1, 0, 1),
+								(0, 0, 1, 0, 1, 1),
+								(0, 1, 0, 0, 1, 1),
+								(0, 1, 0, 1, 1, 0)	]
+
+		i1, j1, k1, i2, j2, k2 = [numpy.select(tetrahedron_conditions, [each_offsets[each_column] for each_offsets in tetrahedron_offsets[:-1]], default=tetrahedron_offsets[-1][each_column]) for each_column in range(6)]
+
+
+		ii = (i.astype(numpy.int64) & self.hash_number)
+		jj = (j.astype(numpy.int64) & self.hash_number)
+		kk = (k.astype(numpy.int64) & self.hash_number)
+
+
+		total_noise = 0.0
+
+		for offset_i, offset_j, offset_k, corner_unskew in ( (0, 0, 0, 0.0), (i1, j1, k1, self.G3), (i2, j2, k2, self.G3_doubled), (1, 1, 1, self.G3_tripled) ):
+
+			corner_x = (x0 - offset_i + corner_unskew)
+			corner_y = (y0 - offset_j + corner_unskew)
+			corner_z = (z0 - offset_k + corner_unskew)
+
+			gradient_index = ii + offset_i + permutations_table[jj + offset_j + permutations_table[kk + offset_k]]
+
+			corner_t = 0.6 - corner_x*corner_x - corner_y*corner_y - corner_z*corner_z
+			corner_t_squared = corner_t * corner_t
+
+			total_noise = total_noise + numpy.where((corner_t < 0), 0.0, (corner_t_squared * corner_t_squared * ( (gradient_x_table[gradient_index] * corner_x) + (gradient_y_table[gradient_index] * corner_y) + (gradient_z_table[gradient_index] * corner_z) )))
+
+
+		number_to_return = ( 32.0 * total_noise )
+		number_to_return += 1
+		number_to_return *= 128.0
+
+		return number_to_return
+
+
+
+
+	def generate_raw_unoctaved_noise_4d_array(self, supplied_x_array, supplied_y_array, supplied_z_array, supplied_w_array):
+
+		''' Array version of generate_raw_unoctaved_noise_4d(). '''
+
+		lookup_tables = self.get_lookup_table_arrays()
+		permutations_table = lookup_tables['permutations_table']
+		gradient4_x_table = lookup_tables['gradient4_x_table']
+		gradient4_y_table = lookup_tables['gradient4_y_table']
+		gradient4_z_table = lookup_tables['gradient4_z_table']
+		gradient4_w_table = lookup_tables['gradient4_w_table']
+
+
+		s = (supplied_x_array + supplied_y_array + supplied_z_array + supplied_w_array) * self.F4
+
+		i = numpy.floor(supplied_x_array + s)
+		j = numpy.floor(supplied_y_array + s)
+		k = numpy.floor(supplied_z_array + s)
+		l = numpy.floor(supplied_w_array + s)
+
+		t = ((i + j + k + l) * self.G4)
+
+		x0 = (supplied_x_array - (i - t))
+		y0 = (supplied_y_array - (j - t))
+		z0 = (supplied_z_array - (k - t))
+		w0 = (supplied_w_array - (l - t))
+
+
+		## The same ranking as the scalar path, done with boolean arrays.
+		x_over_y = (x0 > y0)
+		x_over_z = (x0 > z0)
+		x_over_w = (x0 > w0)
+		y_over_z = (y0 > z0)
+		y_over_w = (y0 > w0)
+		z_over_w = (z0 > w0)
+
+		rank_x = ( x_over_y.astype(numpy.int64) + x_over_z + x_over_w )
+		rank_y = ( (~x_over_y).astype(numpy.int64) + y_over_z + y_over_w )
+		rank_z = ( (~x_over_z).astype(numpy.int64) + (~y_over_z) + z_over_w )
+		rank_w = ( (~x_over_w).astype(numpy.int64) + (~y_over_w) + (~z_over_w) )
+
+
+		ii = (i.astype(numpy.int64) & self.hash_number)
+		jj = (j.astype(numpy.int64) & self.hash_number)
+		kk = (k.astype(numpy.int64) & self.hash_number)
+		ll = (l.astype(numpy.int64) & self.hash_number)
+
+
+		total_noise = 0.0
+
+		for rank_needed, corner_unskew in ( (4, 0.0), (3, self.G4), (2, self.G4_doubled), (1, self.G4_tripled), (0, self.G4_quadrupled) ):
+
+			offset_i = (rank_x >= rank_needed).astype(numpy.int64)
+			offset_j = (rank_y >= rank_needed).astype(numpy.int64)
+			offset_k = (rank_z >= rank_needed).astype(numpy.int64)
+			offset_l = (rank_w >= rank_needed).astype(numpy.int64)
+
+			corner_x = (x0 - offset_i + corner_unskew)
+			corner_y = (y0 - offset_j + corner_unskew)
+			corner_z = (z0 - offset_k + corner_unskew)
+			corner_w = (w0 - offset_l + corner_unskew)
+
+			gradient_index = ii + offset_i + permutations_table[jj + offset_j + permutations_table[kk + offset_k + permutations_table[ll + offset_l]]]
+
+			corner_t = 0.6 - corner_x*corner_x - corner_y*corner_y - corner_z*corner_z - corner_w*corner_w
+			corner_t_squared = corner_t * corner_t
+
+			total_noise = total_noise + numpy.where((corner_t < 0), 0.0, (corner_t_squared * corner_t_squared * ( (gradient4_x_table[gradient_index] * corner_x) + (gradient4_y_table[gradient_index] * corner_y) + (gradient4_z_table[gradient_index] * corner_z) + (gradient4_w_table[gradient_index] * corner_w) )))
+
+
+		number_to_return = ( 27.0 * total_noise )
+		number_to_return += 1
+		number_to_return *= 128.0
+
 		return number_to_return
 	
 	
@@ -0,0 +1,51 @@
+'''
+
+Tests for PlasmaFractalGenerator's level-of-detail generation.
+
+Run with pytest from the repository's root directory.
+
+'''
+
+
+import copy
+
+import pytest
+
+import NoiseMapGenerators_14 as NoiseMapGenerators
+
+
+
+
+#### Tests ####
+
+
+@pytest.mark.parametrize('integer_lattice', [False, True])
+def test_refine_noise_to_a_shallower_depth_changes_nothing(integer_lattice):
+
+	the_plasma_generator = NoiseMapGenerators.PlasmaFractalGenerator(random_number_seed=7)
+
+	noise_map = the_plasma_generator.generate_noise(0, 0, 65, 65, integer_lattice=integer_lattice, detail_depth=4)
+
+	preview_map = copy.deepcopy(noise_map)
+	frontier_quadrants = list(the_plasma_generator.saved_plasma_frontier['quadrants'])
+
+	assert len(frontier_quadrants) == 256
+
+	for each_detail_depth in (4, 2, 0, -1):
+
+		assert the_plasma_generator.refine_noise(each_detail_depth) == preview_map
+		assert the_plasma_generator.saved_plasma_frontier['quadrants'] == frontier_quadrants
+
+	## Going deeper still works afterwards.
+	the_plasma_generator.refine_noise(5)
+
+	assert len(the_plasma_generator.saved_plasma_frontier['quadrants']) == 1024
+
+
+@pytest.mark.parametrize('workers', [None, 1])
+def test_generate_noise_rejects_negative_detail_depth(workers):
+
+	the_plasma_generator = NoiseMapGenerators.PlasmaFractalGenerator(random_number_seed=7)
+
+	with pytest.raises(ValueError):
+		the_plasma_generator.generate_noise(0, 0, 65, 65, detail_depth=-1, workers=workers)